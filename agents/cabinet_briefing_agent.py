@@ -1,7 +1,36 @@
+import asyncio
 import pandas as pd
+import openai
 from engine.fiscal_core.unified_truth_engine import UnifiedTruthEngine
 from engine.fiscal_core.briefing_engine import BriefingEngine
-from openai import OpenAI
+from app.utils.rate_limit import AsyncTokenBucket
+from app.utils.llm_metrics import instrumented
+from environs import Env
+from agents.llm_clients import get_openai_client, make_async_openai_client
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+env = Env()
+env.read_env()
+
+# Brief pack fan-out limits
+PACK_CONCURRENCY = env.int("BRIEF_PACK_CONCURRENCY", 4)
+PACK_REQUESTS_PER_MINUTE = env.float("BRIEF_PACK_REQUESTS_PER_MINUTE", 60)
+PACK_REQUEST_TIMEOUT = env.float("BRIEF_PACK_REQUEST_TIMEOUT", 60)  # seconds
+PACK_MAX_ATTEMPTS = env.int("BRIEF_PACK_MAX_ATTEMPTS", 4)
+
+# Failures worth another attempt; anything else fails the memo at once
+RETRYABLE_ERRORS = (
+    asyncio.TimeoutError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
 
 
 class CabinetBriefingAgent:
@@ -9,20 +38,22 @@ class CabinetBriefingAgent:
         self.master_df = master_df
         self.truth_engine = UnifiedTruthEngine(master_df)
         self.briefing_engine = BriefingEngine(master_df)
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
+        self.openai_api_key = openai_api_key
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            self._async_client = make_async_openai_client(self.openai_api_key)
+        return self._async_client
 
     # ---------------------------------------------------
     # 1. Single Ministry Cabinet Memo
     # ---------------------------------------------------
 
-    def generate_ministry_memo(self, ministry_name: str):
-
-        brief = self.briefing_engine.build_ministry_brief(ministry_name)
-
-        if "error" in brief:
-            return brief
-
-        prompt = f"""
+    def _ministry_memo_prompt(self, brief):
+        return f"""
         You are drafting a formal Cabinet briefing note
         for the Ministry of Finance.
 
@@ -43,6 +74,16 @@ class CabinetBriefingAgent:
         Keep it under 400 words.
         """
 
+    @instrumented
+    def generate_ministry_memo(self, ministry_name: str):
+
+        brief = self.briefing_engine.build_ministry_brief(ministry_name)
+
+        if "error" in brief:
+            return brief
+
+        prompt = self._ministry_memo_prompt(brief)
+
         response = self.client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
@@ -70,10 +111,87 @@ class CabinetBriefingAgent:
 
         return memos
 
+    # ---------------------------------------------------
+    # 2b. Cabinet Critical Brief Pack (concurrent)
+    # ---------------------------------------------------
+
+    @instrumented
+    async def generate_ministry_memo_async(self, ministry_name: str,
+                                           limiter=None,
+                                           timeout=PACK_REQUEST_TIMEOUT,
+                                           max_attempts=PACK_MAX_ATTEMPTS):
+        """
+        Async generate_ministry_memo. Each attempt waits for a limiter
+        token and is bounded by timeout; retryable API errors are retried
+        with exponential backoff and jitter.
+        """
+        brief = self.briefing_engine.build_ministry_brief(ministry_name)
+
+        if "error" in brief:
+            return brief
+
+        prompt = self._ministry_memo_prompt(brief)
+
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            wait=wait_exponential_jitter(initial=1, max=20),
+            stop=stop_after_attempt(max_attempts),
+            reraise=True,
+        ):
+            with attempt:
+                if limiter is not None:
+                    await limiter.acquire()
+
+                response = await asyncio.wait_for(
+                    self.async_client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.15
+                    ),
+                    timeout=timeout,
+                )
+
+        return response.choices[0].message.content
+
+    async def generate_critical_brief_pack_async(
+            self,
+            max_concurrency=PACK_CONCURRENCY,
+            requests_per_minute=PACK_REQUESTS_PER_MINUTE,
+            timeout=PACK_REQUEST_TIMEOUT,
+            max_attempts=PACK_MAX_ATTEMPTS):
+        """
+        generate_critical_brief_pack with the memos requested concurrently.
+        Results come back in ministry order; a memo that still fails after
+        its retries is returned as {"error": ...} without failing the pack.
+        """
+        critical_df = self.truth_engine.cabinet_critical_entities()
+        ministries = list(critical_df['ministry'])
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = AsyncTokenBucket.per_minute(
+            requests_per_minute, burst=max_concurrency
+        )
+
+        async def memo_for(ministry):
+            async with semaphore:
+                try:
+                    memo = await self.generate_ministry_memo_async(
+                        ministry, limiter, timeout, max_attempts
+                    )
+                except Exception as e:
+                    memo = {"error": f"Memo generation failed: {e!r}"}
+            return {
+                "ministry": ministry,
+                "memo": memo
+            }
+
+        return list(await asyncio.gather(*(memo_for(m) for m in ministries)))
+
     # ---------------------------------------------------
     # 3. Executive Fiscal Snapshot Memo
     # ---------------------------------------------------
 
+    @instrumented
     def generate_executive_snapshot_memo(self):
 
         snapshot = self.truth_engine.executive_snapshot()
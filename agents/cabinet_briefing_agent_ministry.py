@@ -1,13 +1,9 @@
 import json
-from openai import OpenAI
-from environs import Env
+from agents.llm_clients import json_schema_completion
 from agents.agents_config import CABINET_BRIEFING_SCHEMA
-import inspect
-from app.utils.database_cache import check_cache, save_to_cache
+from app.utils.response_cache import response_key, lookup_response, store_response
+from app.utils.llm_metrics import instrumented
 
-env = Env()
-env.read_env()
-client = OpenAI(api_key=env.str("CHATGPT_API_KEY"))
 
 
 # Simple bullet point formatting of the signals data
@@ -111,48 +107,43 @@ Rules
 
 
 # Run agent
+@instrumented
 def generate_cabinet_briefing(
         data_hash,
         row,
         signals,
         fiscal_analysis,
         review_output,
-        model="gpt-4o"
+        model="gpt-4o",
+        on_partial=None
         ):
-    
-    # First we check if the request was made before
-    func_name = inspect.currentframe().f_code.co_name
-    cached_response = check_cache(data_hash, row['ministry'], func_name)
-
-    # If it exists we pull that instead
-    if cached_response:
-        return cached_response
 
     context = build_cabinet_context(row, fiscal_analysis, review_output)
     signals_text = format_signals(signals)
     prompt = build_cabinet_prompt(context, signals_text)
+    messages = [
+        {"role": "system", "content": "You are a senior Treasury official."},
+        {"role": "user", "content": prompt}
+    ]
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "You are a senior Treasury official."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.2,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "name": "cabinet_briefing",
-                "schema": CABINET_BRIEFING_SCHEMA
-            }
-        }
-    )
+    # First we check if this exact request was made before
+    cache_key = response_key("cabinet_briefing", messages, model, 0.2,
+                             CABINET_BRIEFING_SCHEMA)
+    cached_response, tier = lookup_response(cache_key)
 
-    raw_output = response.choices[0].message.content
+    # If it exists we pull that instead
+    if cached_response:
+        return cached_response
+
+    # With on_partial the response is streamed and rendered as it arrives
+    raw_output = json_schema_completion(
+        messages, model, 0.2, "cabinet_briefing",
+        CABINET_BRIEFING_SCHEMA, on_partial=on_partial
+    )
 
     try:
         parsed = json.loads(raw_output)
-        save_to_cache(data_hash, row['ministry'], func_name, parsed)
+        store_response(cache_key, parsed)
         return parsed
     except json.JSONDecodeError:
 
@@ -162,6 +153,6 @@ def generate_cabinet_briefing(
             "fiscal_implication": "Unavailable",
             "recommended_action": "Unavailable"
         }
-        save_to_cache(data_hash, row['ministry'], func_name, parsed)
+        # Not cached, so the next request asks the model again
 
     return parsed
\ No newline at end of file
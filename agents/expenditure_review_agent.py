@@ -1,7 +1,8 @@
 import pandas as pd
 from engine.fiscal_core.unified_truth_engine import UnifiedTruthEngine
 from engine.fiscal_core.briefing_engine import BriefingEngine
-from openai import OpenAI
+from agents.llm_clients import get_openai_client
+from app.utils.llm_metrics import instrumented
 
 
 class ExpenditureReviewAgent:
@@ -9,7 +10,7 @@ class ExpenditureReviewAgent:
         self.master_df = master_df
         self.truth_engine = UnifiedTruthEngine(master_df)
         self.briefing_engine = BriefingEngine(master_df)
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
 
         # Structured state
         self.session_state = {
@@ -49,6 +50,7 @@ class ExpenditureReviewAgent:
     # Conversational Follow-Up
     # ---------------------------------------------
 
+    @instrumented
     def ask(self, user_prompt: str):
 
         if not self.session_state["current_ministry"]:
@@ -1,15 +1,10 @@
 import json
-from openai import OpenAI
-from environs import Env
+from agents.llm_clients import json_schema_completion
 from agents.agents_config import EXPENDITURE_REVIEW_SCHEMA
-from app.utils.database_cache import check_cache, save_to_cache
+from app.utils.response_cache import response_key, lookup_response, store_response
+from app.utils.llm_metrics import instrumented
 import streamlit as st
-from app.utils.database_cache import check_cache, save_to_cache
-import inspect
 
-env = Env()
-env.read_env()
-client = OpenAI(api_key=env.str("CHATGPT_API_KEY"))
 
 
 # ==========================================================
@@ -127,43 +122,37 @@ Rules
 # ==========================================================
 # 4. RUN AGENT
 # ==========================================================
-@st.cache_data(persist="disk")
-def generate_expenditure_review(data_hash, row, signals, model="gpt-4o"):
+@instrumented
+def generate_expenditure_review(data_hash, row, signals, model="gpt-4o",
+                                on_partial=None):
 
-    # First we check if the request was made before
-    func_name = inspect.currentframe().f_code.co_name
-    cached_response = check_cache(data_hash, row['ministry'], func_name)
+    context = build_review_context(row)
+    signals_text = format_signals(signals)
+    prompt = build_review_prompt(context, signals_text)
+    messages = [
+        {"role": "system", "content": "You are a senior public expenditure analyst."},
+        {"role": "user", "content": prompt}
+    ]
+
+    # First we check if this exact request was made before
+    cache_key = response_key("expenditure_review", messages, model, 0.2,
+                             EXPENDITURE_REVIEW_SCHEMA)
+    cached_response, tier = lookup_response(cache_key)
 
     # If it exists we pull that instead
     if cached_response:
-        st.success("✅ Loaded from Postgres Cache")
+        st.success(f"✅ Loaded from {tier} cache")
         return cached_response
 
-    context = build_review_context(row)
-    signals_text = format_signals(signals)
-    prompt = build_review_prompt(context, signals_text)
-
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": "You are a senior public expenditure analyst."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.2,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "name": "expenditure_review",
-                "schema": EXPENDITURE_REVIEW_SCHEMA
-            }
-        }
+    # With on_partial the response is streamed and rendered as it arrives
+    raw_output = json_schema_completion(
+        messages, model, 0.2, "expenditure_review",
+        EXPENDITURE_REVIEW_SCHEMA, on_partial=on_partial
     )
 
-    raw_output = response.choices[0].message.content
-
     try:
         parsed = json.loads(raw_output)
-        save_to_cache(data_hash, row['ministry'], func_name, parsed)
+        store_response(cache_key, parsed)
         return parsed
     except json.JSONDecodeError:
         parsed = {
@@ -172,7 +161,7 @@ def generate_expenditure_review(data_hash, row, signals, model="gpt-4o"):
             "efficiency_opportunity": "Unavailable",
             "recommended_review_action": "Unavailable"
         }
-        save_to_cache(data_hash, row['ministry'], func_name, parsed)
+        # Not cached, so the next request asks the model again
 
 
     return parsed
\ No newline at end of file
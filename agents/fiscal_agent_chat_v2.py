@@ -1,37 +1,124 @@
 from environs import Env
-import duckdb
-import re
+import asyncio
+import contextvars
 import streamlit as st
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.deepseek import DeepSeekProvider
+from agents.llm_clients import deepseek_provider
+from app.utils.llm_metrics import instrumented, record_cache_lookup
+from app.utils.system_prompt import schema_prompt
+from app.utils.data_dictionary import DATA_DICTIONARY
+from app.utils.sql_results import RESULT_TABLE_RE, ResultStore, render_result
+from app.utils.query_plan_cache import combine_hashes, get_plan_cache, hint_text, result_hash
+from app.utils.background_loop import BackgroundLoop
+from engine.catalog import get_catalog
 from dataclasses import dataclass
 
 # Get environmental variables specifically LLM key
 env = Env()
 env.read_env()
 
+# Successful (sql, result hash) steps of the agent run in progress
+_run_steps = contextvars.ContextVar("nl_query_steps", default=None)
+# Full results of the agent run in progress, by handle
+_run_results = contextvars.ContextVar("nl_query_results", default=None)
+
 class ChatModel:
     def __init__(self, system_prompt):
         self.model = self._llm_model_init()
-        self.duck_db_conn = duckdb.connect(':memory:')
+        # Every dataset lives in the persistent catalog; queries run on
+        # the calling thread's cursor, so sessions sharing this cached
+        # model never share a connection
+        self.catalog = get_catalog()
         self.system_prompt = system_prompt
+        # Catalog tables and views described in the data dictionary
+        self.tables = [
+            t for t in DATA_DICTIONARY
+            if t in self.catalog.tables or t in self.catalog.views
+        ]
         self.agent = self.__llm_agent_init()
 
         self.agent.tool(self.query_database)
+        self.agent.system_prompt(dynamic=True)(self.schema_prompt)
+
+        # Every question runs on this one loop, so the LLM client's
+        # keep-alive connections survive between questions
+        self.loop = BackgroundLoop(name="nl-query-loop")
+
+    def submit(self, question:str):
+        """Starts ask(question) on the background loop; returns a Future."""
+        return self.loop.submit(self.ask(question))
 
+    @instrumented
     async def ask(self, question:str):
-        result = await self.agent.run(question,
-                                      model_settings={
-                                          "tool_choice": {
-                                              "type":"function",
-                                              "function": {"name" : "query_database"}
-                                          }
-                                      })
+        # DuckDB work runs off the loop so other questions keep moving
+        version, cached = await asyncio.to_thread(self._prepare, question)
+        record_cache_lookup("plan" if cached is not None else None)
+        if cached is not None:
+            return cached
+
+        steps = []
+        token = _run_steps.set(steps)
+        results_token = _run_results.set(ResultStore())
+        try:
+            result = await self.agent.run(question,
+                                          model_settings={
+                                              "tool_choice": {
+                                                  "type":"function",
+                                                  "function": {"name" : "query_database"}
+                                              }
+                                          })
+        finally:
+            _run_results.reset(results_token)
+            _run_steps.reset(token)
+
+        self._store_plan(question, version, steps, result.output)
         return result.output
     
     async def query_database(self, ctx: RunContext, sql: str) -> str:
-        return self._execute_sql(sql)
+        return await asyncio.to_thread(self._execute_sql, sql)
+
+    def schema_prompt(self, ctx: RunContext) -> str:
+        # Data dictionary entries relevant to this question only, plus the
+        # SQL of similar questions answered before
+        question = ctx.prompt if isinstance(ctx.prompt, str) else ""
+        prompt = schema_prompt(question, self.tables)
+        hints = hint_text(get_plan_cache().hints(question, self.catalog.data_version()))
+        return f"{prompt}\n{hints}" if hints else prompt
+
+    def _prepare(self, question):
+        # Picks up edited source CSVs; a stat call per file otherwise.
+        # Same or near-duplicate question on the same data: no LLM call
+        self.catalog.refresh()
+        version = self.catalog.data_version()
+        return version, self._cached_answer(question, version)
+
+    def _cached_answer(self, question, version):
+        plan = get_plan_cache().match(question, version)
+        if plan is None:
+            return None
+        # Re-running the stored SQL takes milliseconds; the answer is only
+        # reused if it still returns the same rows
+        try:
+            digest = combine_hashes(result_hash(self.catalog.query(sql)[0]) for sql in plan.sql)
+        except Exception:
+            return None
+        if digest != plan.result_hash:
+            return None
+        get_plan_cache().record_hit(plan)
+        return plan.answer
+
+    def _store_plan(self, question, version, steps, answer):
+        # Result tables belong to one run, so SQL reading them is not reusable
+        steps = [(sql, digest) for sql, digest in steps if not RESULT_TABLE_RE.search(sql)]
+        if not steps or not isinstance(answer, str) or not answer.strip():
+            return
+        get_plan_cache().store(
+            question, version,
+            [sql for sql, _ in steps],
+            combine_hashes(digest for _, digest in steps),
+            answer,
+        )
 
     def __llm_agent_init(self):
         agent = Agent(
@@ -43,31 +130,32 @@ class ChatModel:
     def _llm_model_init(self):
         model = OpenAIChatModel(
             'deepseek-chat',
-            provider=DeepSeekProvider(api_key=env.str("DEEPSEEK_API_KEY")),
+            provider=deepseek_provider(),
             )
         return model
     
-    def ingest_dataframe(self, df):
-        table_name = "master_ministry_fiscal_intelligence"
-        #self.duck_db_conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM df")
-        self.duck_db_conn.register(table_name, df)
-
-    def test_db(self):
-        print(self.duck_db_conn.execute("SELECT * FROM master_ministry_fiscal_intelligence LIMIT 3").fetchdf())
+    def ingest_dataframe(self, df, table_name:str):
+        # Ad-hoc frames only: the budget datasets are already in the catalog
+        self.catalog.register(table_name, df)
 
     def _execute_sql(self, query:str) -> str:
-        pattern = re.compile(r"^\s*select\b", re.IGNORECASE)
-        if not pattern.match(query):
-            return "Security Violation: Non-SELECT query detected."
-        
+        # Statement type, row cap and timeout are enforced by the catalog;
+        # result_<id> handles resolve against this run's results only
+        results = _run_results.get()
+        frames = results.frames(query) if results is not None else None
         try:
-            result = self.duck_db_conn.execute(query).fetchdf()
-            if result.empty:
-                return "No results."
-            return result.to_string(index=False)
+            result, truncated = self.catalog.query(query, frames=frames)
+        except ValueError:
+            return "Security Violation: Non-SELECT query detected."
         except Exception as e:
             return f"Error: {str(e)}"
-        return ""
+
+        steps = _run_steps.get()
+        if steps is not None:
+            steps.append((query, result_hash(result)))
+
+        # Bounded compact CSV; large results stay server-side by handle
+        return render_result(result, truncated, results)
 
 @st.cache_resource
 def get_llm_instance(system_prompt:str):
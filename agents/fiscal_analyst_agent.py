@@ -1,7 +1,8 @@
 import pandas as pd
 from engine.fiscal_core.unified_truth_engine import UnifiedTruthEngine
 from engine.fiscal_core.briefing_engine import BriefingEngine
-from openai import OpenAI
+from agents.llm_clients import get_openai_client
+from app.utils.llm_metrics import instrumented
 
 
 class FiscalAnalystAgent:
@@ -9,7 +10,7 @@ class FiscalAnalystAgent:
         self.master_df = master_df
         self.truth_engine = UnifiedTruthEngine(master_df)
         self.briefing_engine = BriefingEngine(master_df)
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = get_openai_client(openai_api_key)
 
     # ---------------------------------------------------
     # 1. Get Critical Entities
@@ -22,6 +23,7 @@ class FiscalAnalystAgent:
     # 2. Explain Ministry (LLM Narrative Layer)
     # ---------------------------------------------------
 
+    @instrumented
     def explain_ministry(self, ministry_name: str):
         brief = self.briefing_engine.build_ministry_brief(ministry_name)
 
@@ -1,17 +1,13 @@
-from openai import OpenAI
-from environs import Env
+from agents.llm_clients import json_schema_completion
 import streamlit as st
 import json
 from agents.agents_config import FISCAL_ANALYSIS_SCHEMA
-from app.utils.database_cache import check_cache, save_to_cache
+from app.utils.response_cache import response_key, lookup_response, store_response
+from app.utils.llm_metrics import instrumented
 from engine.fiscal_core.ministry_review.ministry_comparative_review import build_comparative_insight
 from engine.fiscal_core.ministry_review.ministry_opportunity_engine import build_opportunity_statement, estimate_savings_proxy
-import inspect
 
-env = Env()
-env.read_env()
 
-client = OpenAI(api_key=env.str("CHATGPT_API_KEY"))
 
 # Create Ministry Context.
 # Only use required fields for fiscal analysis
@@ -138,8 +134,9 @@ Rules:
 # "row" is the line item from master_ministry_fiscal_intelligence.csv 
 # for the specific ministry
 
-@st.cache_data(persist="disk")
-def generate_fiscal_analysis(df, data_hash, row, signals, model="gpt-4o"):
+@instrumented
+def generate_fiscal_analysis(df, data_hash, row, signals, model="gpt-4o",
+                             on_partial=None):
     """
     Build structured context
     Format signals: so that LLM can make sense of it.
@@ -148,15 +145,6 @@ def generate_fiscal_analysis(df, data_hash, row, signals, model="gpt-4o"):
     Output a nice json file
     """
 
-    # First we check if the request was made before
-    func_name = inspect.currentframe().f_code.co_name
-    cached_response = check_cache(data_hash, row['ministry'], func_name)
-
-    # If it exists we pull that instead
-    if cached_response:
-        st.success("✅ Loaded from Postgres Cache")
-        return cached_response
-
     context = build_ministry_context(row)
     signals_text = format_priority_signals(signals)
     comparative_text = build_comparative_insight(df, row)
@@ -164,28 +152,30 @@ def generate_fiscal_analysis(df, data_hash, row, signals, model="gpt-4o"):
     savings = estimate_savings_proxy(df, row)
     prompt = build_prompt(context, signals_text, comparative_text,
                           opportunity_text)
-
-    response = client.chat.completions.create(
-    model="gpt-4o",
-    messages=[
+    messages = [
         {"role": "system", "content": "You are a senior fiscal analyst."},
         {"role": "user", "content": prompt}
-        ],
-        temperature=0.2,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "name": "fiscal_analysis",
-                "schema": FISCAL_ANALYSIS_SCHEMA
-            }
-            }
-            )
-
-    raw_output = response.choices[0].message.content
+    ]
+
+    # First we check if this exact request was made before
+    cache_key = response_key("fiscal_analysis", messages, model, 0.2,
+                             FISCAL_ANALYSIS_SCHEMA)
+    cached_response, tier = lookup_response(cache_key)
+
+    # If it exists we pull that instead
+    if cached_response:
+        st.success(f"✅ Loaded from {tier} cache")
+        return cached_response
+
+    # With on_partial the response is streamed and rendered as it arrives
+    raw_output = json_schema_completion(
+        messages, model, 0.2, "fiscal_analysis",
+        FISCAL_ANALYSIS_SCHEMA, on_partial=on_partial
+    )
 
     try:
         parsed = json.loads(raw_output)
-        save_to_cache(data_hash, row['ministry'], func_name, parsed)
+        store_response(cache_key, parsed)
         return parsed
     except json.JSONDecodeError:
         parsed = {
@@ -194,6 +184,6 @@ def generate_fiscal_analysis(df, data_hash, row, signals, model="gpt-4o"):
             "oversight_priority": "Unavailable",
             "recommended_action": "Unavailable"
         }
-        save_to_cache(data_hash, row, parsed)
+        # Not cached, so the next request asks the model again
     
     return parsed
\ No newline at end of file
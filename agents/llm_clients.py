@@ -0,0 +1,106 @@
+import time
+from functools import lru_cache
+
+from environs import Env
+from openai import OpenAI, AsyncOpenAI
+from pydantic_ai.providers.deepseek import DeepSeekProvider
+
+from app.utils.partial_json import parse_partial_json
+from app.utils.llm_metrics import InstrumentedOpenAI
+
+# LLM clients, created on first use rather than at import time.
+# OPENAI_BASE_URL and DEEPSEEK_BASE_URL point the agents at another
+# chat-completions endpoint (e.g. benchmarks/stub_llm_server.py) so the
+# whole stack can run offline. Every client is wrapped so its requests are
+# recorded by app/utils/llm_metrics.py.
+
+env = Env()
+env.read_env()
+
+# Minimum seconds between partial-output callbacks while streaming, so the
+# UI redraws a few times a second rather than on every token
+PARTIAL_INTERVAL = env.float("LLM_PARTIAL_INTERVAL", 0.15)
+
+DEEPSEEK_DEFAULT_BASE_URL = "https://api.deepseek.com"
+
+
+@lru_cache(maxsize=None)
+def _openai_client(api_key, base_url):
+    return InstrumentedOpenAI(OpenAI(api_key=api_key, base_url=base_url))
+
+
+def get_openai_client(api_key: str = None):
+    """Shared sync client for this key and base URL."""
+    return _openai_client(
+        api_key or env.str("CHATGPT_API_KEY"),
+        env.str("OPENAI_BASE_URL", None),
+    )
+
+
+def make_async_openai_client(api_key: str = None):
+    # Not shared: an async client's connection pool belongs to one event loop.
+    # SDK retries are off: the caller retries through its rate limiter, and
+    # both layers together would multiply attempts past the limiter.
+    return InstrumentedOpenAI(AsyncOpenAI(
+        api_key=api_key or env.str("CHATGPT_API_KEY"),
+        base_url=env.str("OPENAI_BASE_URL", None),
+        max_retries=0,
+    ), is_async=True)
+
+
+def deepseek_provider(api_key: str = None) -> DeepSeekProvider:
+    client = AsyncOpenAI(
+        api_key=api_key or env.str("DEEPSEEK_API_KEY"),
+        base_url=env.str("DEEPSEEK_BASE_URL", DEEPSEEK_DEFAULT_BASE_URL),
+    )
+    return DeepSeekProvider(openai_client=InstrumentedOpenAI(client, is_async=True))
+
+
+# ---------------------------------------------------
+# Structured completions
+# ---------------------------------------------------
+
+def json_schema_completion(messages, model, temperature, schema_name, schema,
+                           on_partial=None) -> str:
+    """
+    Raw content of a json_schema chat completion. With on_partial the
+    response is streamed and on_partial(dict) is called with the fields
+    parsed so far as they arrive.
+    """
+    request = dict(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": schema_name,
+                "schema": schema
+            }
+        }
+    )
+    client = get_openai_client()
+
+    if on_partial is None:
+        response = client.chat.completions.create(**request)
+        return response.choices[0].message.content
+
+    chunks = []
+    last_emit = 0.0
+    for chunk in client.chat.completions.create(stream=True, **request):
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            continue
+        chunks.append(chunk.choices[0].delta.content)
+
+        now = time.monotonic()
+        if now - last_emit < PARTIAL_INTERVAL:
+            continue
+        try:
+            partial = parse_partial_json("".join(chunks))
+        except ValueError:
+            continue
+        if isinstance(partial, dict) and partial:
+            on_partial(partial)
+            last_emit = now
+
+    return "".join(chunks)
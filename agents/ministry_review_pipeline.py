@@ -0,0 +1,76 @@
+from functools import partial
+
+from app.utils.dag import DagPipeline, Node
+from agents.fiscal_analyst_agent_ministry import generate_fiscal_analysis
+from agents.expenditure_review_agent_ministry import generate_expenditure_review
+from agents.cabinet_briefing_agent_ministry import generate_cabinet_briefing
+
+# Ministry review chain as a DAG:
+#
+#   fiscal_analysis ----\
+#                        +--> cabinet_briefing
+#   expenditure_review -/
+#
+# The first two stages only need the ministry row and its signals, so they
+# run together and a full review costs two LLM round trips instead of three.
+
+REVIEW_STAGES = ["fiscal_analysis", "expenditure_review", "cabinet_briefing"]
+
+
+def build_review_pipeline(on_partial=None):
+    """
+    The review DAG. on_partial(stage, fields), if given, is passed to
+    every stage so partial outputs stream out while it generates.
+    """
+    def stage(name, func):
+        if on_partial is None:
+            return func
+        return partial(func, on_partial=partial(on_partial, name))
+
+    return DagPipeline([
+        Node(
+            "fiscal_analysis",
+            stage("fiscal_analysis", generate_fiscal_analysis),
+            args=("df", "data_hash", "row", "signals"),
+        ),
+        Node(
+            "expenditure_review",
+            stage("expenditure_review", generate_expenditure_review),
+            args=("data_hash", "row", "signals"),
+        ),
+        Node(
+            "cabinet_briefing",
+            stage("cabinet_briefing", generate_cabinet_briefing),
+            deps=("fiscal_analysis", "expenditure_review"),
+            args=("data_hash", "row", "signals"),
+            rename={"expenditure_review": "review_output"},
+        ),
+    ])
+
+
+MINISTRY_REVIEW_PIPELINE = build_review_pipeline()
+
+def generate_full_review(df, data_hash, row, signals, cache=None,
+                         thread_init=None, on_partial=None):
+    """
+    Runs the three review stages, yielding (stage, output) as each one
+    finishes. cache (any dict-like) keeps stage outputs per ministry and
+    data version across calls. on_partial(stage, fields) receives partial
+    outputs while stages are generating (called from worker threads).
+    """
+    pipeline = MINISTRY_REVIEW_PIPELINE
+    if on_partial is not None:
+        pipeline = build_review_pipeline(on_partial)
+
+    inputs = {
+        "df": df,
+        "data_hash": data_hash,
+        "row": row,
+        "signals": signals,
+    }
+    yield from pipeline.stream(
+        inputs,
+        cache=cache,
+        run_key=(data_hash, row["ministry"]),
+        thread_init=thread_init,
+    )
@@ -0,0 +1,41 @@
+# Layout of each ministry review stage on the Ministry Review page:
+# an optional title, then (output field, heading) in display order.
+# Shared by the final render and the streamed preview, so partial output
+# appears in the same place and style as the finished section.
+
+REVIEW_SECTIONS = {
+    "fiscal_analysis": (None, [
+        ("analysis", "### Fiscal Interpretation"),
+        ("fiscal_opportunity", "### Fiscal Opportunity"),
+        ("key_risk_driver", "### Key Risk Driver"),
+        ("oversight_priority", "### Oversight Priority"),
+        ("comparative_position", "### Comparative Position"),
+        ("recommended_action", "### Recommended Action"),
+    ]),
+    "expenditure_review": ("### Expenditure Review Assessment", [
+        ("review_rationale", "**Review Rationale**"),
+        ("priority_review_area", "**Priority Review Area**"),
+        ("efficiency_opportunity", "**Efficiency Opportunity**"),
+        ("recommended_review_action", "**Recommended Review Action**"),
+    ]),
+    "cabinet_briefing": ("### Cabinet Briefing", [
+        ("situation_summary", "**Situation Summary**"),
+        ("key_issue", "**Key Issue**"),
+        ("fiscal_implication", "**Fiscal Implication**"),
+        ("recommended_action", "**Recommended Action**"),
+    ]),
+}
+
+
+def render_review_stage(container, stage, output):
+    """
+    Writes a stage's output into container (st or any Streamlit
+    container). Fields not generated yet are skipped.
+    """
+    title, sections = REVIEW_SECTIONS[stage]
+    if title:
+        container.markdown(title)
+    for field, heading in sections:
+        if field in output:
+            container.markdown(heading)
+            container.write(output[field])
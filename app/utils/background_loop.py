@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+# A long-lived asyncio event loop on a daemon thread.
+# Streamlit scripts are synchronous, and asyncio.run() per call builds and
+# tears down a loop each time, taking the async HTTP client's keep-alive
+# connections with it. Coroutines submitted here all run on one loop that
+# outlives the script runs, so connections are reused and several calls
+# can be in flight at once; each submission is a concurrent.futures.Future
+# that the caller can wait on or cancel.
+
+
+class BackgroundLoop:
+    def __init__(self, name="background-loop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, coro):
+        """Schedules coro on the loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def run(self, coro, timeout=None):
+        """Runs coro on the loop and blocks for its result."""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """Cancels pending work and stops the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        def shutdown():
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.stop()
+
+        loop.call_soon_threadsafe(shutdown)
+        thread.join()
+        loop.close()
@@ -0,0 +1,179 @@
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+# Minimal DAG runner for chains of blocking calls (LLM stages).
+# Each node is called with keyword arguments taken from the run inputs and
+# from the outputs of the nodes it depends on. Nodes whose dependencies are
+# done run concurrently on a thread pool, and results are streamed back in
+# completion order.
+
+
+@dataclass
+class Node:
+    name: str
+    func: callable
+    # Upstream node names; their outputs are passed as keyword arguments
+    deps: tuple = ()
+    # Run inputs passed to func as keyword arguments
+    args: tuple = ()
+    # Keyword argument name for each dependency, if not the node name
+    rename: dict = field(default_factory=dict)
+
+
+class PipelineError(Exception):
+    """
+    failures maps node name -> exception, or None for nodes skipped
+    because a dependency failed.
+    """
+
+    def __init__(self, failures: dict):
+        self.failures = failures
+        details = "; ".join(
+            f"{name}: {'skipped' if error is None else repr(error)}"
+            for name, error in failures.items()
+        )
+        super().__init__(f"Pipeline node(s) failed: {details}")
+
+
+class RunCache(MutableMapping):
+    """
+    Node output cache for stream(), keyed (run_key, node name) and
+    bounded to the max_runs most recently used run keys.
+    """
+
+    def __init__(self, max_runs=16):
+        self.max_runs = max_runs
+        self._runs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        run_key, name = key
+        with self._lock:
+            outputs = self._runs[run_key]
+            self._runs.move_to_end(run_key)
+            return outputs[name]
+
+    def __setitem__(self, key, value):
+        run_key, name = key
+        with self._lock:
+            self._runs.setdefault(run_key, {})[name] = value
+            self._runs.move_to_end(run_key)
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+
+    def __delitem__(self, key):
+        run_key, name = key
+        with self._lock:
+            outputs = self._runs[run_key]
+            del outputs[name]
+            if not outputs:
+                del self._runs[run_key]
+
+    def __contains__(self, key):
+        run_key, name = key
+        with self._lock:
+            return name in self._runs.get(run_key, ())
+
+    def __iter__(self):
+        with self._lock:
+            keys = [(run_key, name) for run_key, outputs in self._runs.items()
+                    for name in outputs]
+        return iter(keys)
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(outputs) for outputs in self._runs.values())
+
+
+class DagPipeline:
+    def __init__(self, nodes):
+        self.nodes = {node.name: node for node in nodes}
+        self.order = self._toposort()
+
+    def _toposort(self):
+        for node in self.nodes.values():
+            unknown = [d for d in node.deps if d not in self.nodes]
+            if unknown:
+                raise ValueError(f"Node '{node.name}' depends on unknown {unknown}")
+
+        order, done = [], set()
+        pending = dict(self.nodes)
+        while pending:
+            ready = [n for n in pending.values() if set(n.deps) <= done]
+            if not ready:
+                raise ValueError(f"Cycle between nodes: {sorted(pending)}")
+            for node in ready:
+                order.append(node.name)
+                done.add(node.name)
+                del pending[node.name]
+        return order
+
+    def _call(self, node, inputs, results):
+        kwargs = {name: inputs[name] for name in node.args}
+        for dep in node.deps:
+            kwargs[node.rename.get(dep, dep)] = results[dep]
+        return node.func(**kwargs)
+
+    def stream(self, inputs: dict, cache=None, run_key=None,
+               max_workers=None, thread_init=None):
+        """
+        Yields (node name, output) as nodes finish. Outputs found in
+        cache under (run_key, node name) are reused without calling the
+        node, and new outputs are written back to it. If any node fails,
+        its dependents are skipped and PipelineError is raised once the
+        running nodes have finished.
+        """
+        results, failures = {}, {}
+        running = {}
+
+        for name in self.order:
+            key = (run_key, name)
+            if cache is not None and key in cache:
+                results[name] = cache[key]
+                yield name, results[name]
+
+        def ready():
+            for name in self.order:
+                node = self.nodes[name]
+                if name in results or name in failures or name in running.values():
+                    continue
+                if any(dep in failures for dep in node.deps):
+                    failures[name] = None
+                    continue
+                if all(dep in results for dep in node.deps):
+                    yield node
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or len(self.nodes),
+            initializer=thread_init,
+        ) as pool:
+            while True:
+                for node in list(ready()):
+                    future = pool.submit(self._call, node, inputs, dict(results))
+                    running[future] = node.name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        failures[name] = e
+                        continue
+
+                    if cache is not None:
+                        cache[(run_key, name)] = results[name]
+                    yield name, results[name]
+
+        if failures:
+            cause = next((e for e in failures.values() if e is not None), None)
+            raise PipelineError(failures) from cause
+
+    def run(self, inputs: dict, **kwargs) -> dict:
+        return dict(self.stream(inputs, **kwargs))
@@ -33,7 +33,8 @@ DATA_DICTIONARY: Dict[str, TableMeta] = {
         grain = "One row per government ministry/agency",
         primary_keys=["ministry"],
         join_hints=["joins to 'opex' and 'capex' on 'ministry' but first always aggregate the 'opex' and 'capex' tables on the 'ministry' and then join",
-                    "NEVER join 'opex' directly to 'fiscal_summary' without reducing the grain to 'ministry'" ],
+                    "NEVER join 'opex' directly to 'fiscal_summary' without reducing the grain to 'ministry'",
+                    "'opex_by_ministry', 'capex_by_ministry' and 'indicators_by_ministry' are already at the 'ministry' grain and join to 'fiscal_summary' on 'ministry' directly"],
         columns={
             "ministry": ColumnMeta(
                 description=MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY["ministry"],
@@ -272,6 +273,10 @@ DATA_DICTIONARY: Dict[str, TableMeta] = {
                 description=MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY["outcome_risk"],
                 example="0.8",
             ),
+            "efficiency_risk": ColumnMeta(
+                description=MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY["efficiency_risk"],
+                example="0.573170731707317",
+            ),
             "capex_risk": ColumnMeta(
                 description=MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY["capex_risk"],
                 example="0.5365853658536586",
@@ -483,8 +488,8 @@ DATA_DICTIONARY: Dict[str, TableMeta] = {
                 unit="GYD",
                 example="0",
             ),
-            "foreign_actual_2026": ColumnMeta(
-                description=CAPEX_DICTIONARY["foreign_actual_2026"],
+            "foreing_actual_2026": ColumnMeta(
+                description=CAPEX_DICTIONARY["foreing_actual_2026"],
                 unit="GYD",
                 example="2000000000",
             ),
@@ -522,25 +527,399 @@ DATA_DICTIONARY: Dict[str, TableMeta] = {
                 example="2844163000",
             ),
         }
-    )
+    ),
+
+    # revenue
+    "revenue": TableMeta(
+        description=(
+            """
+            Provides government revenue by revenue head (code and title) from the budget
+            estimates. It includes revenue collected in 2024, the 2025 budget and revised
+            estimate and the 2026 budget, grouped by header and revenue type (tax, non-tax,
+            foreign grants and loans).
+            """
+        ),
+        grain="One row per revenue head",
+        primary_keys=["code", "title"],
+        join_hints=["'revenue' is not ministry based and does not join to the other tables; aggregate it on 'header' or 'revenue_type' (or use 'revenue_by_header')"],
+        columns={
+            "code": ColumnMeta(
+                description=REVENUE_DICTIONARY["code"],
+                example="5011",
+            ),
+            "title": ColumnMeta(
+                description=REVENUE_DICTIONARY["title"],
+                example="Import Duties",
+            ),
+            "header": ColumnMeta(
+                description=REVENUE_DICTIONARY["header"],
+                example="customs and trade taxes",
+            ),
+            "revenue_type": ColumnMeta(
+                description=REVENUE_DICTIONARY["revenue_type"],
+                example="tax",
+            ),
+            "actual_2024": ColumnMeta(
+                description=REVENUE_DICTIONARY["actual_2024"],
+                unit="GYD",
+                example="34489081000",
+            ),
+            "budget_2025": ColumnMeta(
+                description=REVENUE_DICTIONARY["budget_2025"],
+                unit="GYD",
+                example="37523509000",
+            ),
+            "revised_2025": ColumnMeta(
+                description=REVENUE_DICTIONARY["revised_2025"],
+                unit="GYD",
+                example="44714428000",
+            ),
+            "budget_2026": ColumnMeta(
+                description=REVENUE_DICTIONARY["budget_2026"],
+                unit="GYD",
+                example="53174005000",
+            ),
+        }
+    ),
+
+    # indicators
+    "indicators": TableMeta(
+        description=(
+            """
+            Provides the key performance indicators published for each programme of each
+            ministry, with the reported 2025 value and the 2026 target. Indicators are
+            either outputs or outcomes and are tagged with a policy sector.
+            """
+        ),
+        grain="One row per indicator within each programme of each ministry",
+        primary_keys=["ministry", "programme", "indicator"],
+        join_hints=["join 'indicators' to 'opex' or 'capex' on 'ministry' and 'programme' but first aggregate each side on 'ministry' and 'programme'",
+                    "join 'indicators' to 'fiscal_summary' on 'ministry' but first aggregate on 'ministry' (or use 'indicators_by_ministry')"],
+        columns={
+            "agency": ColumnMeta(
+                description=INDICATOR_DICTIONARY["agency"],
+                example="AGENCY 01 - OFFICE OF THE PRESIDENT",
+            ),
+            "agency_id": ColumnMeta(
+                description=INDICATOR_DICTIONARY["agency_id"],
+                example="agency 01",
+            ),
+            "ministry": ColumnMeta(
+                description=INDICATOR_DICTIONARY["ministry"],
+                example="office of the president",
+            ),
+            "programme": ColumnMeta(
+                description=INDICATOR_DICTIONARY["programme"],
+                example="011 - administration",
+            ),
+            "indicator": ColumnMeta(
+                description=INDICATOR_DICTIONARY["indicator"],
+                example="percentage of budgetary allocation expended",
+            ),
+            "actual_2025": ColumnMeta(
+                description=INDICATOR_DICTIONARY["actual_2025"],
+                example="95%",
+            ),
+            "target_2026": ColumnMeta(
+                description=INDICATOR_DICTIONARY["target_2026"],
+                example="95%",
+            ),
+            "actual_2025_value": ColumnMeta(
+                description=INDICATOR_DICTIONARY["actual_2025_value"],
+                is_synthesized=True,
+                formula="TRY_CAST(replace(actual_2025, '%', '') AS DOUBLE)",
+                example="95.0",
+            ),
+            "target_2026_value": ColumnMeta(
+                description=INDICATOR_DICTIONARY["target_2026_value"],
+                is_synthesized=True,
+                formula="TRY_CAST(replace(target_2026, '%', '') AS DOUBLE)",
+                example="95.0",
+            ),
+            "is_percentage": ColumnMeta(
+                description=INDICATOR_DICTIONARY["is_percentage"],
+                is_synthesized=True,
+                formula="actual_2025 or target_2026 contains '%'",
+                example="true",
+            ),
+            "type": ColumnMeta(
+                description=INDICATOR_DICTIONARY["type"],
+                example="output",
+            ),
+            "sector": ColumnMeta(
+                description=INDICATOR_DICTIONARY["sector"],
+                example="efficiency",
+            ),
+            "agency_type": ColumnMeta(
+                description=INDICATOR_DICTIONARY["agency_type"],
+                example="ministry",
+            ),
+        }
+    ),
+
+    # opex by ministry (view)
+    "opex_by_ministry": TableMeta(
+        description="Pre-aggregated view of 'opex' summed to the 'ministry' grain.",
+        grain="One row per government ministry/agency",
+        primary_keys=["ministry"],
+        join_hints=["join 'opex_by_ministry' to 'fiscal_summary' or 'capex_by_ministry' on 'ministry' directly"],
+        columns={
+            "ministry": ColumnMeta(
+                description="text based, ministry or agency name, same values as 'fiscal_summary'",
+                example="office of the president",
+            ),
+            "programme_count": ColumnMeta(
+                description="integer, number of distinct programmes with 'opex' lines",
+                example="4",
+            ),
+            "line_items": ColumnMeta(
+                description="integer, number of 'opex' account lines summed",
+                example="120",
+            ),
+            "actual_2024": ColumnMeta(
+                description="float, sum of 'opex' actual_2024",
+                unit="GYD",
+                example="7012000000.0",
+            ),
+            "budget_2025": ColumnMeta(
+                description="float, sum of 'opex' budget_2025",
+                unit="GYD",
+                example="7520000000.0",
+            ),
+            "revised_2025": ColumnMeta(
+                description="float, sum of 'opex' revised_2025",
+                unit="GYD",
+                example="7803000000.0",
+            ),
+            "budget_2026": ColumnMeta(
+                description="float, sum of 'opex' budget_2026",
+                unit="GYD",
+                example="8071430000.0",
+            ),
+            "government_funding": ColumnMeta(
+                description="float, sum of 'opex' government_funding",
+                unit="GYD",
+                example="8071430000.0",
+            ),
+            "foreign_funding": ColumnMeta(
+                description="float, sum of 'opex' foreign_funding",
+                unit="GYD",
+                example="0.0",
+            ),
+        }
+    ),
+
+    # opex by programme (view)
+    "opex_by_programme": TableMeta(
+        description="Pre-aggregated view of 'opex' summed to the 'ministry' and 'programme' grain.",
+        grain="One row per programme within each ministry/agency",
+        primary_keys=["ministry", "programme"],
+        join_hints=["join 'opex_by_programme' to 'capex_by_programme' on 'ministry' and 'programme' directly"],
+        columns={
+            "ministry": ColumnMeta(
+                description="text based, ministry or agency name, same values as 'fiscal_summary'",
+                example="office of the president",
+            ),
+            "programme": ColumnMeta(
+                description="text based, programme within the ministry",
+                example="011 - administration",
+            ),
+            "line_items": ColumnMeta(
+                description="integer, number of 'opex' account lines summed",
+                example="40",
+            ),
+            "actual_2024": ColumnMeta(
+                description="float, sum of 'opex' actual_2024",
+                unit="GYD",
+                example="2312000000.0",
+            ),
+            "budget_2025": ColumnMeta(
+                description="float, sum of 'opex' budget_2025",
+                unit="GYD",
+                example="2520000000.0",
+            ),
+            "revised_2025": ColumnMeta(
+                description="float, sum of 'opex' revised_2025",
+                unit="GYD",
+                example="2603000000.0",
+            ),
+            "budget_2026": ColumnMeta(
+                description="float, sum of 'opex' budget_2026",
+                unit="GYD",
+                example="2771430000.0",
+            ),
+            "government_funding": ColumnMeta(
+                description="float, sum of 'opex' government_funding",
+                unit="GYD",
+                example="2771430000.0",
+            ),
+            "foreign_funding": ColumnMeta(
+                description="float, sum of 'opex' foreign_funding",
+                unit="GYD",
+                example="0.0",
+            ),
+        }
+    ),
+
+    # capex by ministry (view)
+    "capex_by_ministry": TableMeta(
+        description="Pre-aggregated view of 'capex' projects summed to the 'ministry' grain.",
+        grain="One row per government ministry/agency",
+        primary_keys=["ministry"],
+        join_hints=["join 'capex_by_ministry' to 'fiscal_summary' or 'opex_by_ministry' on 'ministry' directly"],
+        columns={
+            "ministry": ColumnMeta(
+                description="text based, ministry or agency name, same values as 'fiscal_summary'",
+                example="office of the president",
+            ),
+            "programme_count": ColumnMeta(
+                description="integer, number of distinct programmes with 'capex' projects",
+                example="3",
+            ),
+            "project_count": ColumnMeta(
+                description="integer, number of 'capex' projects summed",
+                example="12",
+            ),
+            "total_project_cost": ColumnMeta(
+                description="float, sum of 'capex' total_project_cost",
+                unit="GYD",
+                example="5468000000.0",
+            ),
+            "total_government_funding": ColumnMeta(
+                description="float, sum of 'capex' total_government_funding",
+                unit="GYD",
+                example="5468000000.0",
+            ),
+            "total_foreign_funding": ColumnMeta(
+                description="float, sum of 'capex' total_foreign_funding",
+                unit="GYD",
+                example="0.0",
+            ),
+            "gov_actual_2025": ColumnMeta(
+                description="float, sum of 'capex' gov_actual_2025",
+                unit="GYD",
+                example="2012000000.0",
+            ),
+            "foreign_actual_2025": ColumnMeta(
+                description="float, sum of 'capex' foreign_actual_2025",
+                unit="GYD",
+                example="0.0",
+            ),
+            "budget_2026": ColumnMeta(
+                description="float, sum of 'capex' budget_2026",
+                unit="GYD",
+                example="2423620000.0",
+            ),
+        }
+    ),
+
+    # capex by programme (view)
+    "capex_by_programme": TableMeta(
+        description="Pre-aggregated view of 'capex' projects summed to the 'ministry' and 'programme' grain.",
+        grain="One row per programme within each ministry/agency",
+        primary_keys=["ministry", "programme"],
+        join_hints=["join 'capex_by_programme' to 'opex_by_programme' on 'ministry' and 'programme' directly"],
+        columns={
+            "ministry": ColumnMeta(
+                description="text based, ministry or agency name, same values as 'fiscal_summary'",
+                example="office of the president",
+            ),
+            "programme": ColumnMeta(
+                description="text based, programme within the ministry",
+                example="011 - administration",
+            ),
+            "project_count": ColumnMeta(
+                description="integer, number of 'capex' projects summed",
+                example="4",
+            ),
+            "total_project_cost": ColumnMeta(
+                description="float, sum of 'capex' total_project_cost",
+                unit="GYD",
+                example="1468000000.0",
+            ),
+            "total_government_funding": ColumnMeta(
+                description="float, sum of 'capex' total_government_funding",
+                unit="GYD",
+                example="1468000000.0",
+            ),
+            "total_foreign_funding": ColumnMeta(
+                description="float, sum of 'capex' total_foreign_funding",
+                unit="GYD",
+                example="0.0",
+            ),
+            "gov_actual_2025": ColumnMeta(
+                description="float, sum of 'capex' gov_actual_2025",
+                unit="GYD",
+                example="712000000.0",
+            ),
+            "foreign_actual_2025": ColumnMeta(
+                description="float, sum of 'capex' foreign_actual_2025",
+                unit="GYD",
+                example="0.0",
+            ),
+            "budget_2026": ColumnMeta(
+                description="float, sum of 'capex' budget_2026",
+                unit="GYD",
+                example="823620000.0",
+            ),
+        }
+    ),
+
+    # indicators by ministry (view)
+    "indicators_by_ministry": TableMeta(
+        description="Pre-aggregated view of 'indicators' counted at the 'ministry' grain.",
+        grain="One row per government ministry/agency",
+        primary_keys=["ministry"],
+        join_hints=["join 'indicators_by_ministry' to 'fiscal_summary' on 'ministry' directly"],
+        columns={
+            "ministry": ColumnMeta(
+                description="text based, ministry or agency name, same values as 'fiscal_summary'",
+                example="office of the president",
+            ),
+            "programme_count": ColumnMeta(
+                description="integer, number of distinct programmes with indicators",
+                example="5",
+            ),
+            "indicator_count": ColumnMeta(
+                description="integer, number of indicators",
+                example="30",
+            ),
+            "output_count": ColumnMeta(
+                description="integer, number of output indicators",
+                example="20",
+            ),
+            "outcome_count": ColumnMeta(
+                description="integer, number of outcome indicators",
+                example="10",
+            ),
+        }
+    ),
 }
 
-def dict_as_text(table: str | None = None) -> str:
-    # Returns a compact, LLM Friendly string of the data dictionary
-    tables = (
-        {table: DATA_DICTIONARY[table]}
-        if table and table in DATA_DICTIONARY
-        else DATA_DICTIONARY
-    )
+def dict_as_text(table: str | None = None,
+                 columns: Dict[str, list[str]] | None = None,
+                 joins: bool = True) -> str:
+    # Returns a compact, LLM Friendly string of the data dictionary.
+    # columns ({table: [column, ...]}) keeps only those tables and columns.
+    if columns is not None:
+        tables = {t: DATA_DICTIONARY[t] for t in columns if t in DATA_DICTIONARY}
+    else:
+        tables = (
+            {table: DATA_DICTIONARY[table]}
+            if table and table in DATA_DICTIONARY
+            else DATA_DICTIONARY
+        )
     lines: list[str] = []
     for tname, tmeta in tables.items():
         lines.append(f"TABLE: {tname}")
         lines.append(f"  Description : {tmeta.description}")
         lines.append(f"  Grain       : {tmeta.grain}")
-        if tmeta.join_hints:
+        if joins and tmeta.join_hints:
             lines.append(f"  Joins       : {'; '.join(tmeta.join_hints)}")
         lines.append("  Columns:")
         for col, meta in tmeta.columns.items():
+            if columns is not None and col not in columns[tname]:
+                continue
             synth = " [synthesized]" if meta.is_synthesized else ""
             unit = f" ({meta.unit})" if meta.unit else ""
             lines.append(f"    {col}{unit}{synth}: {meta.description}")
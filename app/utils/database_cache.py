@@ -1,3 +1,8 @@
+import logging
+import queue
+import threading
+import time
+
 from environs import Env
 import psycopg2
 from psycopg2.extras import Json
@@ -5,33 +10,233 @@ from psycopg2.extras import Json
 env = Env()
 env.read_env()
 
+logger = logging.getLogger(__name__)
+
+CACHE_TABLE = "guyana_budget_llm_cache"
+
+# Pool and timeout settings. The cache sits in front of LLM calls, so a
+# slow or unreachable database is treated as a miss rather than waited on.
+POOL_MAX_SIZE = env.int("CACHE_POOL_MAX_SIZE", 4)
+POOL_ACQUIRE_TIMEOUT = env.float("CACHE_POOL_ACQUIRE_TIMEOUT", 1.0)  # seconds
+CONNECT_TIMEOUT = env.int("CACHE_CONNECT_TIMEOUT", 3)  # seconds
+STATEMENT_TIMEOUT_MS = env.int("CACHE_STATEMENT_TIMEOUT_MS", 2000)
+HEALTH_CHECK_AFTER = env.float("CACHE_HEALTH_CHECK_AFTER", 30.0)  # idle seconds
+FAILURE_COOLDOWN = env.float("CACHE_FAILURE_COOLDOWN", 30.0)  # seconds
+SSL_MODE = env.str("CACHE_SSLMODE", "require")
+
+
 def get_db_connection():
     # Heroku automatically sets DATABASE_URL
-    conn = psycopg2.connect(env.str("DATABASE_URL"), sslmode='require')
+    conn = psycopg2.connect(
+        env.str("DATABASE_URL"),
+        sslmode=SSL_MODE,
+        connect_timeout=CONNECT_TIMEOUT,
+        options=f"-c statement_timeout={STATEMENT_TIMEOUT_MS}",
+    )
     return conn
 
+
+def make_cache_key(data_hash, topic, func_name):
+    return f"{data_hash}_{topic}_{func_name}"
+
+
+# ---------------------------------------------------
+# Pooled cache client
+# ---------------------------------------------------
+
+class CacheClient:
+    """
+    Thread-safe pooled client for the LLM response cache.
+
+    connect is a zero-argument factory returning a DB-API connection
+    (psycopg2 paramstyle); it defaults to get_db_connection, and can be
+    swapped for a local Postgres or an in-process stand-in.
+
+    Every read or write that fails, times out or cannot get a pooled
+    connection within POOL_ACQUIRE_TIMEOUT is reported as a miss (or a
+    dropped write). After a connection failure the client stops trying
+    for FAILURE_COOLDOWN seconds.
+    """
+
+    def __init__(self, connect=None, max_size=POOL_MAX_SIZE,
+                 acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+                 health_check_after=HEALTH_CHECK_AFTER,
+                 failure_cooldown=FAILURE_COOLDOWN):
+        self._connect = connect or get_db_connection
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self.acquire_timeout = acquire_timeout
+        self.health_check_after = health_check_after
+        self.failure_cooldown = failure_cooldown
+        self._down_until = 0.0
+
+    # ---------------------------------------------------
+    # Pool
+    # ---------------------------------------------------
+
+    @property
+    def available(self):
+        return time.monotonic() >= self._down_until
+
+    def _trip(self, error):
+        self._down_until = time.monotonic() + self.failure_cooldown
+        logger.warning("LLM cache unavailable, serving misses: %s", error)
+
+    def _healthy(self, conn, idle_since):
+        if getattr(conn, "closed", 0):
+            return False
+        if time.monotonic() - idle_since < self.health_check_after:
+            return True
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.fetchone()
+            cur.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        while True:
+            try:
+                conn, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            if self._healthy(conn, idle_since):
+                return conn
+            self._discard(conn)
+
+    def _checkin(self, conn):
+        self._idle.put((conn, time.monotonic()))
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _run(self, work, default):
+        """
+        Runs work(cursor) on a pooled connection and commits. Returns
+        default if the pool is exhausted, the database is down, or the
+        statement fails.
+        """
+        if not self.available:
+            return default
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            return default
+
+        try:
+            try:
+                conn = self._checkout()
+            except Exception as e:
+                self._trip(e)
+                return default
+
+            try:
+                cur = conn.cursor()
+                result = work(cur)
+                conn.commit()
+                cur.close()
+            except Exception as e:
+                if getattr(conn, "closed", 0):
+                    self._trip(e)
+                else:
+                    logger.warning("LLM cache statement failed: %s", e)
+                try:
+                    conn.rollback()
+                    self._checkin(conn)
+                except Exception:
+                    self._discard(conn)
+                return default
+
+            self._checkin(conn)
+            return result
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    # ---------------------------------------------------
+    # Cache API
+    # ---------------------------------------------------
+
+    def check_many(self, keys) -> dict:
+        """Cached responses for the keys that are present."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        def work(cur):
+            placeholders = ", ".join(["%s"] * len(keys))
+            cur.execute(
+                f"SELECT cache_key, response FROM {CACHE_TABLE} "
+                f"WHERE cache_key IN ({placeholders})",
+                keys,
+            )
+            return dict(cur.fetchall())
+
+        return self._run(work, {})
+
+    def save_many(self, items) -> bool:
+        """
+        Upserts {key: response} (or (key, response) pairs) in one
+        statement. Returns False if the write was dropped.
+        """
+        items = dict(items)
+        if not items:
+            return True
+
+        def work(cur):
+            placeholders = ", ".join(["(%s, %s)"] * len(items))
+            params = []
+            for key, response in items.items():
+                params.extend([key, Json(response)])
+            cur.execute(
+                f"INSERT INTO {CACHE_TABLE} (cache_key, response) "
+                f"VALUES {placeholders} "
+                "ON CONFLICT (cache_key) DO UPDATE SET response = EXCLUDED.response",
+                params,
+            )
+            return True
+
+        return self._run(work, False)
+
+    def check(self, key):
+        return self.check_many([key]).get(key)
+
+    def save(self, key, response) -> bool:
+        return self.save_many({key: response})
+
+
+# ---------------------------------------------------
+# Shared per-process client
+# ---------------------------------------------------
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_cache_client() -> CacheClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = CacheClient()
+    return _client
+
+
 def check_cache(data_hash, topic, func_name):
-    key = f"{data_hash}_{topic}_{func_name}"
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    cur.execute("SELECT response FROM guyana_budget_llm_cache WHERE cache_key = %s", (key,))
-    result = cur.fetchone()
-    
-    cur.close()
-    conn.close()
-    return result[0] if result else None
+    return get_cache_client().check(make_cache_key(data_hash, topic, func_name))
+
 
 def save_to_cache(data_hash, topic, func_name, response):
-    key = f"{data_hash}_{topic}_{func_name}"
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    cur.execute(
-        "INSERT INTO guyana_budget_llm_cache (cache_key, response) VALUES (%s, %s) ON CONFLICT (cache_key) DO UPDATE SET response = EXCLUDED.response",
-        (key, Json(response))
-    )
-    
-    conn.commit()
-    cur.close()
-    conn.close()
\ No newline at end of file
+    get_cache_client().save(make_cache_key(data_hash, topic, func_name), response)
@@ -54,6 +54,7 @@ MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY = {
     "performance_review_flag": "bool, A boolean management flag (True/False) identifying agencies prioritized for a 'Deep-Dive' Performance Review. It is 'True' if an agency tracks at least one outcome but triggers either: (1) High Resource Intensity (low_efficiency is True), or (2) Strategic Imbalance (less than 35 percent of their total metrics are 'Outcomes'). Use this to isolate entities that have the data infrastructure for reporting but are currently failing to prioritize impact or manage unit costs effectively.",
     "high_performer_flag": "bool, A boolean excellence flag (True/False) identifying 'Agile Champions.' It is 'True' only if an agency is a 'High-Velocity' entity (top 30 percent efficiency) and a 'High-Value' entity (strong outcomes), while specifically excluding the largest 'Macro-Pillar' spenders. Use this to identify nimble, high-performing agencies that provide a model for efficient public service delivery and 'Best-in-Class' resource allocation.",
     "outcome_risk": "float64, A continuous risk score (0.0 to 1.0) measuring 'Strategic Blindness.' It represents the proportion of an agency's performance metrics that are NOT outcomes. A high score (e.g., > 0.70) indicates an agency is focused on administrative outputs (meetings, reports, processes) rather than tangible results (impact, change). Use this to identify entities that may be 'busy' without being effective.",
+    "efficiency_risk": "float64, A normalized risk score (0.0 to 1.0) representing 'Resource Intensity.' It is the agency's efficiency_rank divided by the highest efficiency_rank in the dataset, so the agency that spends the most per outcome scores 1.0 and the most efficient agencies score close to 0.0. A high score (e.g., > 0.70) identifies entities in the least efficient tier of their peers. Use this to compare operational efficiency on a common scale; it carries the 25 percent Operational Efficiency weight in fiscal_risk_score.",
     "capex_risk": "float64, A continuous risk score (0.0 to 1.0) representing 'Structural Inflexibility.' It is the proportion of the total 2026 budget allocated to Capital Expenditure (CAPEX). A high score (e.g., > 0.60) identifies agencies whose budgets are dominated by physical assets or infrastructure projects. Use this to flag entities that lack fiscal agility, as their funding is largely committed to multi-year contracts that cannot be easily reallocated or reduced without legal or physical project disruptions.",
     "foreign_risk_num": "float64, A ratio (0.0 to 1.0) representing the proportion of the 2026 Capital Expenditure (CAPEX) budget funded by external entities, including foreign government grants, international loans, and multi-lateral development bank credits. A value of 0.0 indicates full domestic funding (Fiscal Autonomy), while values closer to 1.0 indicate high 'External Exposure,' where critical infrastructure projects are reliant on international financing and may be subject to global interest rate fluctuations or geopolitical conditions.",
     "indicator_risk": "float64, A normalized risk score (0.0 to 1.0) representing 'Information Blindness.' It is derived from the structural depth of an agency's performance reporting (indicator_coverage). A high score (near 1.0) identifies agencies with the poorest data coverage, where the lack of standardized or comprehensive metrics makes independent fiscal oversight nearly impossible. Use this to flag entities that require a complete overhaul of their Key Performance Indicator (KPI) frameworks.",
@@ -108,4 +109,30 @@ CAPEX_DICTIONARY = {
     "gov_actual_2025": "float, total funding for project for the year 2025 from local treasury. This will be 0 if the project didn't start in 2025.",
     "gov_actual_2026": "float, total funding budgeted for in 2026, from local treasury.",
     "budget_2026": "float, sum gov_actual_2026 and foreing_actual_2026."
-}
\ No newline at end of file
+}
+REVENUE_DICTIONARY = {
+    "code": "integer, The revenue head code from the budget estimates (e.g., 5011).",
+    "title": "text based, Name of the revenue head (e.g., Import Duties).",
+    "header": "categorical, Group the revenue head belongs to (e.g., customs and trade taxes, income tax).",
+    "revenue_type": "categorical, Broad revenue class: tax, non-tax, fines, fees, etc., foreign grants or foreign loans.",
+    "actual_2024": "integer, Revenue actually collected in the 2024 fiscal year.",
+    "budget_2025": "integer, Revenue budgeted for the 2025 fiscal year.",
+    "revised_2025": "integer, Revised 2025 revenue estimate after mid-year adjustments.",
+    "budget_2026": "integer, Revenue budgeted for the 2026 fiscal year.",
+}
+
+INDICATOR_DICTIONARY = {
+    "agency": "text based, Agency as written in the budget document (e.g., AGENCY 01 - OFFICE OF THE PRESIDENT).",
+    "agency_id": "text based, Short agency identifier (e.g., agency 01).",
+    "ministry": "text based, The high-level government portfolio responsible for the indicator (e.g., office of the president).",
+    "programme": "text based, The programme the indicator measures (e.g., 011 - administration).",
+    "indicator": "text based, Description of the key performance indicator.",
+    "actual_2025": "text based, Reported 2025 value exactly as published; may be a count or a percentage such as '95%'.",
+    "target_2026": "text based, Target for 2026 exactly as published; may be a count or a percentage.",
+    "actual_2025_value": "float, Numeric part of actual_2025 (percent sign removed), NULL when not numeric.",
+    "target_2026_value": "float, Numeric part of target_2026 (percent sign removed), NULL when not numeric.",
+    "is_percentage": "boolean, True when the indicator is expressed as a percentage.",
+    "type": "categorical, Indicator type: output or outcome.",
+    "sector": "categorical, Policy sector the indicator relates to (e.g., governance, efficiency).",
+    "agency_type": "categorical, Kind of agency: ministry, constitutional, military or local government.",
+}
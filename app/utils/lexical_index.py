@@ -0,0 +1,86 @@
+import math
+import re
+from collections import Counter
+
+# Small lexical search toolkit: a tokenizer for English questions and
+# snake_case identifiers, and an Okapi BM25 index over tokenized documents.
+# Used to match user questions against the data dictionary and against
+# earlier questions.
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "did", "do",
+    "does", "for", "from", "give", "has", "have", "how", "i", "in", "is",
+    "it", "its", "list", "me", "much", "of", "on", "or", "show", "tell",
+    "that", "the", "their", "there", "these", "this", "to", "was", "were",
+    "what", "when", "where", "which", "who", "why", "with", "would", "you",
+}
+
+
+def stem(token: str) -> str:
+    """Light suffix stripping so plurals and -ing forms match."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 5 and token.endswith("ing"):
+        return token[:-3]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str, synonyms: dict = None) -> list[str]:
+    """
+    Lower-cased, stemmed word tokens without stopwords. snake_case and
+    punctuation split into words; synonyms maps a stemmed token to extra
+    tokens appended after it.
+    """
+    tokens = []
+    for raw in TOKEN_RE.findall(text.lower()):
+        if raw in STOPWORDS:
+            continue
+        token = stem(raw)
+        tokens.append(token)
+        if synonyms and token in synonyms:
+            tokens.extend(synonyms[token])
+    return tokens
+
+
+class BM25Index:
+    def __init__(self, documents, k1=1.5, b=0.75):
+        """documents: list of token lists."""
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if documents else 0.0
+
+        doc_freq = Counter(term for counts in self.term_counts for term in counts)
+        n = len(documents)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def __len__(self):
+        return len(self.term_counts)
+
+    def scores(self, query_tokens) -> list[float]:
+        """BM25 score of every document for the query."""
+        terms = [t for t in set(query_tokens) if t in self.idf]
+        result = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+            score = 0.0
+            for term in terms:
+                tf = counts.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            result.append(score)
+        return result
+
+    def top(self, query_tokens, k=10) -> list[tuple[int, float]]:
+        """(document index, score) of the k best matches with score > 0."""
+        ranked = sorted(enumerate(self.scores(query_tokens)),
+                        key=lambda item: item[1], reverse=True)
+        return [(i, s) for i, s in ranked[:k] if s > 0]
@@ -0,0 +1,444 @@
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+from environs import Env
+
+env = Env()
+env.read_env()
+
+logger = logging.getLogger(__name__)
+
+# Per-call instrumentation for the LLM agents.
+#
+# Agent functions are wrapped with @instrumented; while one runs, every
+# chat-completions request made through an InstrumentedOpenAI client and
+# every response-cache lookup is attributed to it. One LLMCall record is
+# kept per agent call with wall time, time to first token (streamed calls),
+# token usage, cost, prompt size and the cache tier that served it.
+#
+# Records are aggregated in-process (rolling percentiles plus running
+# totals per function) and can be exported as:
+#   - JSON lines appended to LLM_METRICS_FILE
+#   - Prometheus text on http://<host>:LLM_METRICS_PORT/metrics
+
+METRICS_WINDOW = env.int("LLM_METRICS_WINDOW", 1000)  # records kept per function
+METRICS_FILE = env.str("LLM_METRICS_FILE", None)
+METRICS_PORT = env.int("LLM_METRICS_PORT", None)
+
+# USD per 1M (prompt, completion) tokens; longest matching prefix wins
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "deepseek-chat": (0.27, 1.10),
+}
+
+UNATTRIBUTED = "unattributed"
+QUANTILES = (50, 95, 99)
+
+
+@dataclass
+class LLMCall:
+    function: str
+    started_at: float
+    wall_s: float = 0.0
+    # Time spent inside chat-completions requests
+    llm_s: float = 0.0
+    ttft_s: float = None
+    requests: int = 0
+    model: str = None
+    prompt_chars: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    # Tier that served the response, "miss" after a failed lookup,
+    # None when the function does not use the response cache
+    cache_tier: str = None
+    error: str = None
+
+
+def percentile(values, q):
+    """Linear-interpolated q-th percentile, None for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def request_cost(model, prompt_tokens, completion_tokens) -> float:
+    prefixes = [p for p in MODEL_PRICES if model and model.startswith(p)]
+    if not prefixes:
+        return 0.0
+    prompt_price, completion_price = MODEL_PRICES[max(prefixes, key=len)]
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def prompt_size(messages) -> int:
+    return sum(len(m.get("content") or "") for m in messages or []
+               if isinstance(m.get("content"), str))
+
+
+# ---------------------------------------------------
+# Aggregation
+# ---------------------------------------------------
+
+class LLMMetrics:
+    def __init__(self, window=METRICS_WINDOW, path=METRICS_FILE):
+        self.window = window
+        self.path = path
+        self._recent = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+        self._server = None
+
+    def record(self, call: LLMCall):
+        with self._lock:
+            self._recent[call.function].append(call)
+            totals = self._totals[call.function]
+            totals["calls"] += 1
+            totals["wall_s"] += call.wall_s
+            totals["requests"] += call.requests
+            totals["prompt_tokens"] += call.prompt_tokens
+            totals["completion_tokens"] += call.completion_tokens
+            totals["cost_usd"] += call.cost_usd
+            totals["errors"] += call.error is not None
+            if call.cache_tier is not None:
+                totals[f"cache_{call.cache_tier}"] += 1
+
+            if self.path:
+                try:
+                    with open(self.path, "a") as f:
+                        f.write(json.dumps(asdict(call)) + "\n")
+                except OSError as e:
+                    logger.warning("Could not write LLM metrics to %s: %s", self.path, e)
+
+    def summary(self) -> dict:
+        """
+        Per function: running totals, cache hit rate, and p50/p95/p99 of
+        wall time, time to first token and prompt tokens per call (calls
+        that reached the API) over the window.
+        """
+        with self._lock:
+            recent = {name: list(calls) for name, calls in self._recent.items()}
+            totals = {name: dict(t) for name, t in self._totals.items()}
+
+        result = {}
+        for name, calls in recent.items():
+            t = totals[name]
+            hits = sum(v for k, v in t.items()
+                       if k.startswith("cache_") and k != "cache_miss")
+            lookups = hits + t.get("cache_miss", 0)
+            entry = {
+                "calls": int(t["calls"]),
+                "requests": int(t["requests"]),
+                "errors": int(t["errors"]),
+                "prompt_tokens": int(t["prompt_tokens"]),
+                "completion_tokens": int(t["completion_tokens"]),
+                "cost_usd": t["cost_usd"],
+                "wall_s_total": t["wall_s"],
+                "cache": {k[len("cache_"):]: int(v) for k, v in t.items() if k.startswith("cache_")},
+                "cache_hit_rate": hits / lookups if lookups else None,
+            }
+            series = {
+                "wall_s": [c.wall_s for c in calls],
+                "ttft_s": [c.ttft_s for c in calls if c.ttft_s is not None],
+                "call_prompt_tokens": [c.prompt_tokens for c in calls if c.requests],
+            }
+            for field, values in series.items():
+                entry[field] = {f"p{q}": percentile(values, q) for q in QUANTILES}
+            result[name] = entry
+        return result
+
+    def prometheus_text(self) -> str:
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP fiscal_llm_{name} {help_text}")
+            lines.append(f"# TYPE fiscal_llm_{name} {kind}")
+            for labels, value in samples:
+                if value is None:
+                    continue
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"fiscal_llm_{name}{{{label_text}}} {value}")
+
+        summary = self.summary()
+        metric("calls_total", "counter", "Instrumented agent calls.",
+               [({"function": f}, s["calls"]) for f, s in summary.items()])
+        metric("requests_total", "counter", "Chat-completions requests sent.",
+               [({"function": f}, s["requests"]) for f, s in summary.items()])
+        metric("errors_total", "counter", "Agent calls that raised.",
+               [({"function": f}, s["errors"]) for f, s in summary.items()])
+        metric("tokens_total", "counter", "Tokens used.",
+               [({"function": f, "kind": kind}, s[f"{kind}_tokens"])
+                for f, s in summary.items() for kind in ("prompt", "completion")])
+        metric("cost_usd_total", "counter", "Estimated spend at list prices.",
+               [({"function": f}, round(s["cost_usd"], 6)) for f, s in summary.items()])
+        metric("cache_lookups_total", "counter", "Response cache lookups by serving tier.",
+               [({"function": f, "tier": tier}, n)
+                for f, s in summary.items() for tier, n in s["cache"].items()])
+        metric("cache_hit_ratio", "gauge", "Share of cache lookups that hit.",
+               [({"function": f}, s["cache_hit_rate"]) for f, s in summary.items()])
+        for field, help_text in (("wall_s", "Agent call wall time."),
+                                 ("ttft_s", "Time to first streamed token.")):
+            metric(f"{field[:-2]}_seconds", "summary", help_text,
+                   [({"function": f, "quantile": q / 100}, s[field][f"p{q}"])
+                    for f, s in summary.items() for q in QUANTILES])
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port, host="0.0.0.0"):
+        """Serves prometheus_text() on /metrics from a daemon thread."""
+        if self._server is not None:
+            return self._server
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_llm_metrics() -> LLMMetrics:
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = LLMMetrics()
+                if METRICS_PORT:
+                    try:
+                        _metrics.serve(METRICS_PORT)
+                    except OSError as e:
+                        logger.warning("LLM metrics endpoint not started: %s", e)
+    return _metrics
+
+
+# ---------------------------------------------------
+# Attribution
+# ---------------------------------------------------
+
+_current_call = contextvars.ContextVar("llm_call", default=None)
+
+
+def instrumented(func):
+    """Records one LLMCall per call of func (sync or async)."""
+    name = func.__qualname__
+
+    def start():
+        call = LLMCall(function=name, started_at=time.time())
+        return call, _current_call.set(call), time.perf_counter()
+
+    def finish(call, token, started, error=None):
+        _current_call.reset(token)
+        call.wall_s = time.perf_counter() - started
+        if error is not None:
+            call.error = repr(error)
+        get_llm_metrics().record(call)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            call, token, started = start()
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as e:
+                finish(call, token, started, e)
+                raise
+            finish(call, token, started)
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        call, token, started = start()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            finish(call, token, started, e)
+            raise
+        finish(call, token, started)
+        return result
+    return wrapper
+
+
+def record_cache_lookup(tier):
+    """Notes which cache tier served the current call (None for a miss)."""
+    call = _current_call.get()
+    if call is not None:
+        call.cache_tier = tier or "miss"
+
+
+def record_usage(model, prompt_tokens, completion_tokens, requests=1,
+                 llm_s=0.0, ttft_s=None, prompt_chars=0):
+    """
+    Adds one or more completed requests to the current call, or records
+    them on their own if no instrumented function is running.
+    """
+    call = _current_call.get()
+    standalone = call is None
+    if standalone:
+        call = LLMCall(function=UNATTRIBUTED, started_at=time.time(), wall_s=llm_s)
+
+    call.model = model
+    call.requests += requests
+    call.llm_s += llm_s
+    call.prompt_chars += prompt_chars
+    call.prompt_tokens += prompt_tokens or 0
+    call.completion_tokens += completion_tokens or 0
+    call.cost_usd += request_cost(model, prompt_tokens or 0, completion_tokens or 0)
+    if ttft_s is not None and call.ttft_s is None:
+        call.ttft_s = ttft_s
+
+    if standalone:
+        get_llm_metrics().record(call)
+
+
+# ---------------------------------------------------
+# Client wrappers
+# ---------------------------------------------------
+
+class _RequestTimer:
+    def __init__(self, kwargs):
+        self.model = kwargs.get("model")
+        self.prompt_chars = prompt_size(kwargs.get("messages"))
+        self.started = time.perf_counter()
+        self.ttft = None
+        self.usage = None
+        self.done = False
+
+    def chunk(self, chunk):
+        if self.ttft is None and chunk.choices and (
+            chunk.choices[0].delta.content or chunk.choices[0].delta.tool_calls
+        ):
+            self.ttft = time.perf_counter() - self.started
+        if getattr(chunk, "usage", None) is not None:
+            self.usage = chunk.usage
+
+    def finish(self, usage=None):
+        if self.done:
+            return
+        self.done = True
+        usage = usage or self.usage
+        record_usage(
+            self.model,
+            getattr(usage, "prompt_tokens", 0),
+            getattr(usage, "completion_tokens", 0),
+            llm_s=time.perf_counter() - self.started,
+            ttft_s=self.ttft,
+            prompt_chars=self.prompt_chars,
+        )
+
+
+class _TimedStream:
+    """Passes a completion stream through, timing the first token."""
+
+    def __init__(self, stream, timer):
+        self._stream = stream
+        self._timer = timer
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._timer.chunk(chunk)
+            yield chunk
+        self._timer.finish()
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._timer.chunk(chunk)
+            yield chunk
+        self._timer.finish()
+
+    def __enter__(self):
+        self._stream.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self._timer.finish()
+        return self._stream.__exit__(*exc)
+
+    async def __aenter__(self):
+        await self._stream.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        self._timer.finish()
+        return await self._stream.__aexit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _prepare(kwargs):
+    if kwargs.get("stream"):
+        # Usage arrives in a final chunk only when asked for
+        kwargs.setdefault("stream_options", {"include_usage": True})
+    return _RequestTimer(kwargs)
+
+
+class _Completions:
+    def __init__(self, completions):
+        self._completions = completions
+
+    def create(self, **kwargs):
+        timer = _prepare(kwargs)
+        response = self._completions.create(**kwargs)
+        if kwargs.get("stream"):
+            return _TimedStream(response, timer)
+        timer.finish(response.usage)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._completions, name)
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **kwargs):
+        timer = _prepare(kwargs)
+        response = await self._completions.create(**kwargs)
+        if kwargs.get("stream"):
+            return _TimedStream(response, timer)
+        timer.finish(response.usage)
+        return response
+
+
+class InstrumentedOpenAI:
+    """
+    OpenAI or AsyncOpenAI client whose chat.completions.create calls are
+    recorded; everything else is passed through.
+    """
+
+    def __init__(self, client, is_async=False):
+        self._client = client
+        completions = _AsyncCompletions if is_async else _Completions
+        self.chat = SimpleNamespace(completions=completions(client.chat.completions))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -2,11 +2,12 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 import hashlib
+from engine.loader import read_dataset_file
 
 @st.cache_data
 def load_csv(file_path):
-    data_path = Path(__file__).parent.parent.parent / "data" / file_path
-    df = pd.read_csv(data_path)
+    # Served from the columnar snapshot in data/.snapshots when current
+    df = read_dataset_file(file_path)
     return df
 
 def get_file_hash(file_path):
@@ -0,0 +1,143 @@
+import json
+
+# Parses the prefix of a JSON document while it is still being generated,
+# e.g. a streamed structured LLM response:
+#
+#   parse_partial_json('{"analysis": "Spend is hi')  ->  {"analysis": "Spend is hi"}
+#
+# Strings cut off mid-way are returned as far as they go; a key whose value
+# has not started yet, and numbers or literals that may still grow, are left
+# out until they are complete.
+
+_LITERALS = {"true": True, "false": False, "null": None}
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f",
+            "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _Incomplete(Exception):
+    """The value at this position has not been generated far enough."""
+
+
+class _PartialParser:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def skip_ws(self):
+        while self.pos < len(self.text) and self.text[self.pos] in " \t\r\n":
+            self.pos += 1
+
+    def peek(self):
+        self.skip_ws()
+        if self.pos >= len(self.text):
+            raise _Incomplete
+        return self.text[self.pos]
+
+    def value(self):
+        """(value, complete) for the value starting at pos."""
+        char = self.peek()
+        if char == "{":
+            return self.container("}", self.members)
+        if char == "[":
+            return self.container("]", self.items)
+        if char == '"':
+            return self.string()
+        return self.scalar(), True
+
+    def container(self, closer, fill):
+        self.pos += 1
+        result = {} if closer == "}" else []
+        try:
+            if self.peek() == closer:
+                self.pos += 1
+                return result, True
+            fill(result)
+        except _Incomplete:
+            return result, False
+        self.pos += 1
+        return result, True
+
+    def members(self, result):
+        while True:
+            if self.peek() != '"':
+                raise ValueError(f"Expected key at {self.pos}")
+            key, complete = self.string()
+            if not complete:
+                raise _Incomplete
+            self.expect(":")
+
+            value, complete = self.value()
+            result[key] = value
+            if not complete:
+                raise _Incomplete
+            if self.peek() == "}":
+                return
+            self.expect(",")
+
+    def items(self, result):
+        while True:
+            value, complete = self.value()
+            result.append(value)
+            if not complete:
+                raise _Incomplete
+            if self.peek() == "]":
+                return
+            self.expect(",")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at {self.pos}")
+        self.pos += 1
+
+    def string(self):
+        self.pos += 1
+        chars = []
+        while self.pos < len(self.text):
+            char = self.text[self.pos]
+            if char == '"':
+                self.pos += 1
+                return "".join(chars), True
+            if char == "\\":
+                escape = self.text[self.pos + 1:self.pos + 2]
+                if not escape:
+                    break
+                if escape == "u":
+                    digits = self.text[self.pos + 2:self.pos + 6]
+                    if len(digits) < 4:
+                        break
+                    chars.append(chr(int(digits, 16)))
+                    self.pos += 6
+                    continue
+                chars.append(_ESCAPES.get(escape, escape))
+                self.pos += 2
+                continue
+            chars.append(char)
+            self.pos += 1
+        self.pos = len(self.text)
+        return "".join(chars), False
+
+    def scalar(self):
+        start = self.pos
+        while self.pos < len(self.text) and self.text[self.pos] not in ",]} \t\r\n":
+            self.pos += 1
+        token = self.text[start:self.pos]
+        if self.pos >= len(self.text):
+            # Might still grow (1 -> 10, fa -> false)
+            raise _Incomplete
+        if token in _LITERALS:
+            return _LITERALS[token]
+        return json.loads(token)
+
+
+def parse_partial_json(text: str):
+    """
+    Best-effort value of a possibly truncated JSON document, or None if
+    nothing usable has arrived yet. Raises ValueError on malformed input.
+    """
+    if not text.strip():
+        return None
+    try:
+        value, _ = _PartialParser(text).value()
+    except _Incomplete:
+        return None
+    return value
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+from environs import Env
+
+from app.utils.lexical_index import TOKEN_RE, BM25Index, tokenize
+
+env = Env()
+env.read_env()
+
+# Question -> SQL plan cache for the NL query agent.
+# Every successful run is stored as (question, SQL, result hash, answer)
+# under the data version it ran against. A later question that is the same
+# or a near duplicate gets the stored answer without an LLM call, once its
+# SQL has been re-run and still gives the same result. Near duplicate means
+# exactly the same stemmed content words (numbers included), differing only
+# in stopwords, inflection or a little word order: "top ministries" never
+# answers "bottom ministries" however long the rest of the question is, and
+# the ordered word pairs must mostly agree too, so "highest capex, lowest
+# opex" never answers "lowest capex, highest opex". Anything less similar
+# gets the closest earlier SQL as a few-shot hint instead, never its
+# answer. Similarity is lexical: BM25 over earlier questions picks the
+# candidates, the overlap of their word sets ranks them for hints.
+
+PLAN_CACHE_PATH = Path(env.str(
+    "NL_PLAN_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent.parent / "data" / ".cache" / "nl_query_plans.sqlite"),
+))
+# Ordered word-pair overlap needed to reuse an answer (on top of equal
+# content words), and word-set overlap needed to offer SQL as a hint
+ANSWER_SIMILARITY = env.float("NL_PLAN_ANSWER_SIMILARITY", 0.8)
+HINT_SIMILARITY = env.float("NL_PLAN_HINT_SIMILARITY", 0.3)
+HINT_MAX_PLANS = env.int("NL_PLAN_HINTS", 2)
+# BM25 candidates checked for overlap
+CANDIDATES = 8
+
+
+def normalize_question(question: str) -> str:
+    """Lower-cased words only: the exact-match key."""
+    return " ".join(TOKEN_RE.findall(question.lower()))
+
+
+def question_tokens(question: str) -> tuple:
+    """Stemmed content words, in question order."""
+    return tuple(tokenize(question))
+
+
+def question_terms(question: str) -> frozenset:
+    return frozenset(tokenize(question))
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard overlap of two questions' terms."""
+    if not a or not b:
+        return float(a == b)
+    return len(a & b) / len(a | b)
+
+
+def same_terms(a: tuple, b: tuple) -> bool:
+    """
+    Same stemmed content words, each as often: one changed word ("top" vs
+    "bottom", "2025" vs "2026") is a different question.
+    """
+    return Counter(a) == Counter(b)
+
+
+def sequence_similarity(a: tuple, b: tuple) -> float:
+    """
+    1.0 for the same word sequence, else the Jaccard overlap of the
+    ordered word pairs: swapping two words changes the pairs around them.
+    """
+    if a == b:
+        return 1.0
+    pairs_a, pairs_b = set(zip(a, a[1:])), set(zip(b, b[1:]))
+    if not pairs_a or not pairs_b:
+        return 0.0
+    return len(pairs_a & pairs_b) / len(pairs_a | pairs_b)
+
+
+def result_hash(df: pd.DataFrame) -> str:
+    """Content hash of a query result (values and column names)."""
+    digest = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    except TypeError:
+        digest.update(df.to_csv(index=False).encode())
+    return digest.hexdigest()[:16]
+
+
+def combine_hashes(hashes) -> str:
+    return hashlib.sha256("|".join(hashes).encode()).hexdigest()[:16]
+
+
+@dataclass
+class QueryPlan:
+    question: str
+    sql: list[str]
+    result_hash: str
+    answer: str
+    hits: int = 0
+    tokens: tuple = field(default=(), repr=False)
+    terms: frozenset = field(default=frozenset(), repr=False)
+
+    def __post_init__(self):
+        if not self.tokens:
+            self.tokens = question_tokens(self.question)
+        if not self.terms:
+            self.terms = frozenset(self.tokens)
+
+
+class QueryPlanCache:
+    def __init__(self, path=PLAN_CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = None
+        # Plans of the data version currently loaded, by normalized question
+        self._version = None
+        self._plans = {}
+        self._keys = []
+        self._index = None
+
+    def _connection(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=1.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS nl_query_plans ("
+                "question_key TEXT NOT NULL, data_version TEXT NOT NULL, "
+                "question TEXT NOT NULL, sql TEXT NOT NULL, result_hash TEXT NOT NULL, "
+                "answer TEXT NOT NULL, hits INTEGER NOT NULL DEFAULT 0, "
+                "updated_at REAL NOT NULL, "
+                "PRIMARY KEY (question_key, data_version))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _load(self, version):
+        """Switches the in-memory plans to version; plans of older data are dropped."""
+        if version == self._version:
+            return
+        conn = self._connection()
+        conn.execute("DELETE FROM nl_query_plans WHERE data_version != ?", [version])
+        conn.commit()
+        rows = conn.execute(
+            "SELECT question_key, question, sql, result_hash, answer, hits "
+            "FROM nl_query_plans WHERE data_version = ?",
+            [version],
+        ).fetchall()
+        self._plans = {
+            key: QueryPlan(question, json.loads(sql), digest, answer, hits)
+            for key, question, sql, digest, answer, hits in rows
+        }
+        self._version = version
+        self._index = None
+
+    def _ranked(self, question):
+        """(plan, similarity) of the closest stored questions, best first."""
+        key = normalize_question(question)
+        if key in self._plans:
+            return [(self._plans[key], 1.0)]
+        if not self._plans:
+            return []
+
+        if self._index is None:
+            self._keys = list(self._plans)
+            self._index = BM25Index([list(self._plans[k].terms) for k in self._keys])
+        terms = question_terms(question)
+        scored = [
+            (self._plans[self._keys[i]], similarity(terms, self._plans[self._keys[i]].terms))
+            for i, _ in self._index.top(list(terms), k=CANDIDATES)
+        ]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+    def match(self, question, version, min_similarity=ANSWER_SIMILARITY):
+        """
+        The stored plan of the same or a near-duplicate question (the same
+        content words, in nearly the same order), or None.
+        """
+        tokens = question_tokens(question)
+        best, best_score = None, min_similarity
+        with self._lock:
+            self._load(version)
+            for plan, _ in self._ranked(question):
+                if not same_terms(tokens, plan.tokens):
+                    continue
+                score = sequence_similarity(tokens, plan.tokens)
+                if score >= best_score:
+                    best, best_score = plan, score
+        return best
+
+    def hints(self, question, version, k=HINT_MAX_PLANS, min_similarity=HINT_SIMILARITY):
+        """Up to k stored plans similar enough to guide a new question."""
+        with self._lock:
+            self._load(version)
+            return [plan for plan, score in self._ranked(question)[:k]
+                    if score >= min_similarity]
+
+    def store(self, question, version, sql, digest, answer):
+        plan = QueryPlan(question, list(sql), digest, answer)
+        key = normalize_question(question)
+        with self._lock:
+            self._load(version)
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO nl_query_plans (question_key, data_version, question, sql, "
+                "result_hash, answer, hits, updated_at) VALUES (?, ?, ?, ?, ?, ?, 0, ?) "
+                "ON CONFLICT (question_key, data_version) DO UPDATE SET "
+                "question = excluded.question, sql = excluded.sql, "
+                "result_hash = excluded.result_hash, answer = excluded.answer, "
+                "updated_at = excluded.updated_at",
+                [key, version, question, json.dumps(plan.sql), digest, answer, time.time()],
+            )
+            conn.commit()
+            self._plans[key] = plan
+            self._index = None
+        return plan
+
+    def record_hit(self, plan):
+        key = normalize_question(plan.question)
+        with self._lock:
+            plan.hits += 1
+            conn = self._connection()
+            conn.execute(
+                "UPDATE nl_query_plans SET hits = hits + 1 "
+                "WHERE question_key = ? AND data_version = ?",
+                [key, self._version],
+            )
+            conn.commit()
+
+    def __len__(self):
+        return len(self._plans)
+
+
+def hint_text(plans) -> str:
+    """Few-shot block of earlier questions and the SQL that answered them."""
+    if not plans:
+        return ""
+    lines = ["Similar questions answered before; adapt their SQL where it fits:"]
+    for plan in plans:
+        lines.append(f"Q: {plan.question}")
+        lines.extend(f"SQL: {sql}" for sql in plan.sql)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------
+# Shared per-process cache
+# ---------------------------------------------------
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> QueryPlanCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QueryPlanCache()
+    return _cache
+
+
+def set_plan_cache(cache: QueryPlanCache):
+    """Replaces the shared cache (e.g. with a temporary file for a benchmark)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
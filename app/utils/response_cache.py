@@ -0,0 +1,379 @@
+import hashlib
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from environs import Env
+
+from app.utils.database_cache import get_cache_client
+from app.utils.llm_metrics import record_cache_lookup
+
+env = Env()
+env.read_env()
+
+logger = logging.getLogger(__name__)
+
+# Tiered cache for LLM responses, checked in order:
+#   memory   - per-process LRU shared by every Streamlit session
+#   disk     - local SQLite file, survives restarts of this worker
+#   postgres - shared remote cache (app/utils/database_cache.py)
+# A hit in a lower tier is promoted to the tiers above it. Writes land in
+# memory immediately and reach disk and Postgres through a background
+# writer, so the page never waits on the slower tiers.
+#
+# Entries are keyed on the content of the request (see response_key), so a
+# prompt, model or schema change is a different key rather than a stale hit.
+# Each agent has its own namespace with a version and a TTL; bumping the
+# version (or setting LLM_CACHE_VERSION_<NAMESPACE>) invalidates that agent
+# only.
+
+MEMORY_MAX_ENTRIES = env.int("LLM_CACHE_MEMORY_ENTRIES", 512)
+MEMORY_MAX_BYTES = env.int("LLM_CACHE_MEMORY_BYTES", 32 * 1024 * 1024)
+DISK_PATH = Path(env.str(
+    "LLM_CACHE_DISK_PATH",
+    str(Path(__file__).resolve().parent.parent.parent / "data" / ".cache" / "llm_responses.sqlite"),
+))
+
+
+# Namespace -> version and TTL in seconds (None = LLM_CACHE_TTL_SECONDS)
+NAMESPACES = {
+    "fiscal_analysis": {"version": 1, "ttl": None},
+    "expenditure_review": {"version": 1, "ttl": None},
+    "cabinet_briefing": {"version": 1, "ttl": None},
+}
+DEFAULT_TTL = env.int("LLM_CACHE_TTL_SECONDS", 0) or None
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+# ---------------------------------------------------
+# Keys and entries
+# ---------------------------------------------------
+
+def namespace_version(namespace: str) -> int:
+    default = NAMESPACES.get(namespace, {}).get("version", 1)
+    return env.int(f"LLM_CACHE_VERSION_{namespace.upper()}", default)
+
+
+def namespace_ttl(namespace: str):
+    ttl = NAMESPACES.get(namespace, {}).get("ttl")
+    return ttl if ttl is not None else DEFAULT_TTL
+
+
+def response_key(namespace, messages, model, temperature, schema=None) -> str:
+    """
+    Content-addressed key: a hash of everything that shapes the answer,
+    under a versioned namespace.
+    """
+    request = json.dumps({
+        "messages": messages,
+        "model": model,
+        "temperature": temperature,
+        "schema": schema,
+    }, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(request.encode()).hexdigest()
+    return f"llm:{namespace}:v{namespace_version(namespace)}:{digest}"
+
+
+def key_namespace(key: str):
+    parts = key.split(":")
+    return parts[1] if len(parts) == 4 and parts[0] == "llm" else None
+
+
+def _wrap(value, ttl=None) -> dict:
+    return {
+        "cache_entry": 1,
+        "expires_at": time.time() + ttl if ttl else None,
+        "value": value,
+    }
+
+
+def _unwrap(entry):
+    """(value, expired). Entries written before envelopes never expire."""
+    if not (isinstance(entry, dict) and entry.get("cache_entry") == 1):
+        return entry, False
+    expires_at = entry.get("expires_at")
+    return entry.get("value"), bool(expires_at and expires_at <= time.time())
+
+
+# ---------------------------------------------------
+# Tiers
+# ---------------------------------------------------
+
+class MemoryTier:
+    """
+    LRU bounded by entry count and by the size of the serialised values.
+    Values are stored serialised so callers cannot mutate cached entries.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries=MEMORY_MAX_ENTRIES, max_bytes=MEMORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys) -> dict:
+        found = {}
+        with self._lock:
+            for key in keys:
+                payload = self._entries.get(key)
+                if payload is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = payload
+        return {key: json.loads(payload) for key, payload in found.items()}
+
+    def set_many(self, items: dict):
+        with self._lock:
+            for key, value in items.items():
+                payload = _dumps(value)
+                if len(payload) > self.max_bytes:
+                    continue
+
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self.bytes -= len(old)
+                self._entries[key] = payload
+                self.bytes += len(payload)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self.bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskTier:
+    name = "disk"
+
+    def __init__(self, path=DISK_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=1.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "cache_key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys) -> dict:
+        keys = list(keys)
+        placeholders = ", ".join(["?"] * len(keys))
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT cache_key, response FROM llm_cache "
+                f"WHERE cache_key IN ({placeholders})",
+                keys,
+            ).fetchall()
+        return {key: json.loads(payload) for key, payload in rows}
+
+    def set_many(self, items: dict):
+        now = time.time()
+        rows = [(key, _dumps(value), now) for key, value in items.items()]
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT INTO llm_cache (cache_key, response, updated_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (cache_key) DO UPDATE SET "
+                "response = excluded.response, updated_at = excluded.updated_at",
+                rows,
+            )
+            conn.commit()
+
+
+class PostgresTier:
+    name = "postgres"
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client or get_cache_client()
+
+    def get_many(self, keys) -> dict:
+        return self.client.check_many(keys)
+
+    def set_many(self, items: dict):
+        self.client.save_many(items)
+
+
+# ---------------------------------------------------
+# Tiered cache
+# ---------------------------------------------------
+
+class TieredCache:
+    def __init__(self, tiers):
+        self.tiers = list(tiers)
+        self.stats = {tier.name: {"hits": 0, "misses": 0, "errors": 0}
+                      for tier in self.tiers}
+        self._stats_lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    def _count(self, tier, field, n=1):
+        with self._stats_lock:
+            self.stats[tier.name][field] += n
+
+    # ---------------------------------------------------
+    # Reads
+    # ---------------------------------------------------
+
+    def lookup_many(self, keys) -> dict:
+        """
+        {key: (value, tier name)} for every live key found in some tier.
+        Hits are promoted to the tiers above the one that served them;
+        expired entries count as misses.
+        """
+        missing = list(dict.fromkeys(keys))
+        found = {}
+
+        for level, tier in enumerate(self.tiers):
+            if not missing:
+                break
+            try:
+                entries = tier.get_many(missing)
+            except Exception as e:
+                logger.warning("LLM cache %s tier read failed: %s", tier.name, e)
+                self._count(tier, "errors")
+                entries = {}
+
+            hits = {}
+            for key, entry in entries.items():
+                value, expired = _unwrap(entry)
+                if not expired:
+                    hits[key] = entry
+                    found[key] = (value, tier.name)
+
+            self._count(tier, "hits", len(hits))
+            self._count(tier, "misses", len(missing) - len(hits))
+            if not hits:
+                continue
+
+            missing = [key for key in missing if key not in hits]
+            self._write(self.tiers[:level], hits)
+
+        return found
+
+    def lookup(self, key):
+        """(value, tier name), or (None, None) on a miss."""
+        return self.lookup_many([key]).get(key, (None, None))
+
+    def get(self, key):
+        return self.lookup(key)[0]
+
+    # ---------------------------------------------------
+    # Writes
+    # ---------------------------------------------------
+
+    def set_many(self, items: dict, ttl=None):
+        entries = {key: _wrap(value, ttl) for key, value in dict(items).items()}
+        self._write(self.tiers, entries)
+
+    def set(self, key, value, ttl=None):
+        self.set_many({key: value}, ttl)
+
+    def _write(self, tiers, items):
+        """First tier written inline, the rest through the background writer."""
+        if not tiers or not items:
+            return
+        head, *rest = tiers
+        self._set(head, items)
+        if rest:
+            self._ensure_writer()
+            self._pending.put((rest, items))
+
+    def _set(self, tier, items):
+        try:
+            tier.set_many(items)
+        except Exception as e:
+            logger.warning("LLM cache %s tier write failed: %s", tier.name, e)
+            self._count(tier, "errors")
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain, name="llm-cache-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _drain(self):
+        while True:
+            tiers, items = self._pending.get()
+            try:
+                for tier in tiers:
+                    self._set(tier, items)
+            finally:
+                self._pending.task_done()
+
+    def flush(self):
+        """Blocks until queued write-behind work has been applied."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def stats_snapshot(self) -> dict:
+        with self._stats_lock:
+            return {name: dict(counts) for name, counts in self.stats.items()}
+
+
+# ---------------------------------------------------
+# Shared per-process cache
+# ---------------------------------------------------
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> TieredCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TieredCache([MemoryTier(), DiskTier(), PostgresTier()])
+    return _cache
+
+
+def set_response_cache(cache: TieredCache):
+    """Replaces the shared cache (e.g. with isolated tiers for a benchmark)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def lookup_response(key):
+    """(value, tier name) for a response_key, or (None, None)."""
+    value, tier = get_response_cache().lookup(key)
+    record_cache_lookup(tier)
+    return value, tier
+
+
+def store_response(key, response):
+    """Stores response under its content key, with the namespace TTL."""
+    ttl = namespace_ttl(key_namespace(key) or "")
+    get_response_cache().set(key, response, ttl)
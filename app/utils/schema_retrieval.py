@@ -0,0 +1,145 @@
+from functools import lru_cache
+
+from environs import Env
+
+from app.utils.data_dictionary import DATA_DICTIONARY, dict_as_text
+from app.utils.lexical_index import BM25Index, tokenize
+
+env = Env()
+env.read_env()
+
+# Schema retrieval for the NL query agent: instead of the whole data
+# dictionary, each question gets only the tables and columns that match it
+# lexically (BM25 over column names, descriptions, units and formulas, plus
+# table descriptions, grains and join hints). Primary keys of every chosen
+# table are always kept so results can be labelled and joined, and join
+# hints are only included when more than one table is selected.
+
+MAX_COLUMNS = env.int("SCHEMA_MAX_COLUMNS", 12)
+# Columns scoring below this share of the best match are dropped
+MIN_SCORE_RATIO = env.float("SCHEMA_MIN_SCORE_RATIO", 0.2)
+
+# Question vocabulary -> dictionary vocabulary (stemmed tokens)
+SCHEMA_SYNONYMS = {
+    "spend": ["expenditure", "cost", "opex", "capex"],
+    "spent": ["expenditure", "actual"],
+    "expense": ["expenditure", "opex"],
+    "salary": ["compensation", "employee", "wage"],
+    "wage": ["compensation", "employee"],
+    "staff": ["compensation", "employee"],
+    "project": ["capex", "capital"],
+    "capital": ["capex"],
+    "operational": ["opex", "current"],
+    "operating": ["opex", "current"],
+    "donor": ["foreign"],
+    "loan": ["foreign"],
+    "grant": ["foreign"],
+    "aid": ["foreign"],
+    "external": ["foreign"],
+    "local": ["gov", "government"],
+    "treasury": ["gov", "government"],
+    "agency": ["ministry"],
+    "department": ["ministry", "programme"],
+    "program": ["programme"],
+    "efficient": ["efficiency"],
+    "risky": ["risk"],
+    "kpi": ["indicator"],
+    "target": ["indicator", "outcome", "output"],
+    "performance": ["indicator", "outcome", "efficiency"],
+}
+
+
+def _column_document(table, name, meta):
+    # Column names count twice: they are the strongest signal
+    text = " ".join([table, name, name, meta.description, meta.unit, meta.formula])
+    return tokenize(text)
+
+
+def _table_document(table, meta):
+    text = " ".join([table, table, meta.description, meta.grain, *meta.join_hints])
+    return tokenize(text)
+
+
+class SchemaIndex:
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self.columns = [
+            (table, name)
+            for table, meta in dictionary.items()
+            for name in meta.columns
+        ]
+        self.tables = list(dictionary)
+
+        self.column_index = BM25Index([
+            _column_document(table, name, dictionary[table].columns[name])
+            for table, name in self.columns
+        ])
+        self.table_index = BM25Index([
+            _table_document(table, dictionary[table]) for table in self.tables
+        ])
+
+    def retrieve(self, question, tables=None, max_columns=MAX_COLUMNS,
+                 min_ratio=MIN_SCORE_RATIO) -> dict:
+        """
+        {table: [column, ...]} relevant to question, in dictionary order,
+        limited to tables if given. Empty when nothing matches.
+        """
+        allowed = set(tables) if tables is not None else set(self.tables)
+        query = tokenize(question, SCHEMA_SYNONYMS)
+
+        # Key columns are added to every chosen table anyway, so a match on
+        # one ("ministry") does not pull its table in by itself
+        hits = [
+            (self.columns[i], score)
+            for i, score in self.column_index.top(query, k=len(self.columns))
+            if self.columns[i][0] in allowed
+            and self.columns[i][1] not in self.dictionary[self.columns[i][0]].primary_keys
+        ]
+        selected = {}
+        if hits:
+            best = hits[0][1]
+            for (table, name), score in hits[:max_columns]:
+                if score >= best * min_ratio:
+                    selected.setdefault(table, set()).add(name)
+
+        # The table whose description matches best comes along even when
+        # none of its columns did (e.g. "projects" -> capex)
+        table_hits = [
+            self.tables[i]
+            for i, _ in self.table_index.top(query, k=len(self.tables))
+            if self.tables[i] in allowed
+        ]
+        if table_hits:
+            selected.setdefault(table_hits[0], set())
+
+        result = {}
+        for table in self.tables:
+            if table not in selected:
+                continue
+            meta = self.dictionary[table]
+            keep = selected[table] | set(meta.primary_keys)
+            result[table] = [name for name in meta.columns if name in keep]
+        return result
+
+
+@lru_cache(maxsize=1)
+def schema_index() -> SchemaIndex:
+    return SchemaIndex(DATA_DICTIONARY)
+
+
+def schema_context(question, tables=None, max_columns=MAX_COLUMNS) -> str:
+    """
+    Data dictionary text for question: only the retrieved tables and
+    columns, or every allowed table in full when nothing matches.
+    """
+    selected = schema_index().retrieve(question, tables, max_columns)
+    if not selected:
+        allowed = tables if tables is not None else list(DATA_DICTIONARY)
+        selected = {t: list(DATA_DICTIONARY[t].columns) for t in allowed
+                    if t in DATA_DICTIONARY}
+    return dict_as_text(columns=selected, joins=len(selected) > 1)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token for English)."""
+    return (len(text) + 3) // 4
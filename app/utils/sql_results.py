@@ -0,0 +1,173 @@
+import re
+import threading
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+from environs import Env
+
+env = Env()
+env.read_env()
+
+# Compact rendering of SQL results for the NL agent's context.
+# Rows are sent as CSV with rounded numerics under a row and character
+# budget. When a result does not fit, the agent gets the first rows, a
+# summary of every column and a handle: the full frame stays server-side
+# as a queryable table (result_<id>) that later SELECTs of the same agent
+# run can page through or aggregate, so each tool call stays bounded
+# whatever the SQL returns. Each run has its own ResultStore, so handles
+# are never evicted by, or visible to, other sessions' runs.
+
+RESULT_MAX_ROWS = env.int("SQL_RESULT_MAX_ROWS", 30)
+RESULT_MAX_CHARS = env.int("SQL_RESULT_MAX_CHARS", 3000)
+RESULT_DECIMALS = env.int("SQL_RESULT_DECIMALS", 2)
+# Long free-text cells (project descriptions) are cut to this length
+CELL_MAX_CHARS = env.int("SQL_RESULT_CELL_CHARS", 80)
+SUMMARY_MAX_COLUMNS = env.int("SQL_RESULT_SUMMARY_COLUMNS", 12)
+# Per agent run
+STORE_MAX_ENTRIES = env.int("SQL_RESULT_STORE_ENTRIES", 64)
+
+# Tables created by ResultStore.put; they do not outlive the agent run
+RESULT_TABLE_RE = re.compile(r"\bresult_[0-9a-f]{8}\b")
+
+
+def _format_number(value, decimals=RESULT_DECIMALS) -> str:
+    if pd.isna(value):
+        return ""
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+
+
+def _clip(text: str, cell_chars=CELL_MAX_CHARS) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= cell_chars else text[:cell_chars - 1] + "…"
+
+
+def compact_frame(df: pd.DataFrame, decimals=RESULT_DECIMALS,
+                  cell_chars=CELL_MAX_CHARS) -> pd.DataFrame:
+    """
+    Copy of df for display: whole-valued floats as integers (no 1.7e+09),
+    other floats rounded, text cells on one line and cut to cell_chars.
+    """
+    out = df.copy()
+    for col in out.columns:
+        series = out[col]
+        if pd.api.types.is_float_dtype(series):
+            out[col] = series.map(lambda v: _format_number(v, decimals))
+        elif pd.api.types.is_object_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            text = series.astype("string").str.replace(r"\s+", " ", regex=True)
+            out[col] = text.where(
+                text.str.len() <= cell_chars, text.str.slice(0, cell_chars - 1) + "…"
+            )
+    return out
+
+
+def render_rows(df: pd.DataFrame, max_rows=RESULT_MAX_ROWS,
+                max_chars=RESULT_MAX_CHARS) -> tuple[str, int]:
+    """
+    CSV of the leading rows of df that fit both budgets, and the number
+    of rows included. The header and first row are always included.
+    """
+    head = compact_frame(df.head(max_rows))
+    header, *lines = head.to_csv(index=False).splitlines()
+
+    kept = [header]
+    used = len(header)
+    for line in lines:
+        if len(kept) > 1 and used + 1 + len(line) > max_chars:
+            break
+        kept.append(line)
+        used += 1 + len(line)
+    return "\n".join(kept), len(kept) - 1
+
+
+def summarize(df: pd.DataFrame, max_columns=SUMMARY_MAX_COLUMNS) -> str:
+    """One line per column: totals and range for numbers, distinct values for text."""
+    lines = []
+    for col in list(df.columns)[:max_columns]:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            lines.append(f"{col}: {int(series.sum())} true of {series.count()}")
+        elif pd.api.types.is_numeric_dtype(series):
+            if series.count() == 0:
+                lines.append(f"{col}: all empty")
+                continue
+            lines.append(
+                f"{col}: sum={_format_number(series.sum())} mean={_format_number(series.mean())} "
+                f"min={_format_number(series.min())} max={_format_number(series.max())}"
+            )
+        else:
+            counts = series.astype("string").value_counts()
+            top = ", ".join(f"{_clip(v)} ({n})" for v, n in counts.head(3).items())
+            lines.append(f"{col}: {len(counts)} distinct; top: {top}")
+    if len(df.columns) > max_columns:
+        lines.append(f"... {len(df.columns) - max_columns} more columns")
+    return "\n".join(lines)
+
+
+class ResultStore:
+    """
+    Full results of one agent run too large for the agent's context, by
+    result_<id> handle. frames(sql) gives the ones a query refers to, for
+    FiscalCatalog.query(frames=...). Least recently stored results are
+    dropped past max_entries.
+    """
+
+    def __init__(self, max_entries=STORE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, df: pd.DataFrame) -> str:
+        handle = f"result_{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            self._entries[handle] = df
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return handle
+
+    def get(self, handle: str):
+        with self._lock:
+            return self._entries.get(handle)
+
+    def frames(self, sql: str) -> dict:
+        """{handle: frame} for the stored results sql refers to."""
+        with self._lock:
+            return {
+                handle: self._entries[handle]
+                for handle in set(RESULT_TABLE_RE.findall(sql))
+                if handle in self._entries
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def render_result(df: pd.DataFrame, truncated: bool = False, store: ResultStore = None,
+                  max_rows=RESULT_MAX_ROWS, max_chars=RESULT_MAX_CHARS) -> str:
+    """
+    Tool output for a query result: the rows as compact CSV when they fit
+    the budget, otherwise the leading rows with a truncation notice, a
+    column summary and (given a store) the handle of the full result.
+    truncated means the engine's row cap already cut the result.
+    """
+    if df.empty:
+        return "No results."
+
+    text, shown = render_rows(df, max_rows, max_chars)
+    if shown == len(df) and not truncated:
+        return text
+
+    rows = f"{len(df)}{'+' if truncated else ''}"
+    notice = [f"[{rows} rows x {len(df.columns)} columns; showing the first {shown}]"]
+    if store is not None:
+        handle = store.put(df)
+        notice.append(
+            f"[Full result saved as table {handle}: page through it with "
+            f"SELECT * FROM {handle} LIMIT {max_rows} OFFSET {shown}, or aggregate it]"
+        )
+    if truncated:
+        notice.append("[The query hit the row limit; filter or aggregate for complete totals]")
+
+    return "\n".join([*notice, text, "Summary of all returned rows:", summarize(df)])
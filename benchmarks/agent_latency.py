@@ -0,0 +1,232 @@
+"""
+End-to-end agent benchmark against the local stub LLM server.
+
+    python -m benchmarks.agent_latency [--ministries 12] [--concurrency 4]
+                                       [--latency lognormal:-0.7,0.5]
+
+Nothing leaves the machine: the agents are pointed at
+benchmarks/stub_llm_server.py through OPENAI_BASE_URL / DEEPSEEK_BASE_URL,
+and the LLM response cache and NL query plan cache are replaced by
+throwaway SQLite files, so Postgres and the real cache files are never
+touched.
+
+Reports, per scenario, wall time, throughput and p50/p95/p99 latency:
+- full ministry review, cold cache then warm cache (with tier hit rates)
+- critical brief pack, sequential vs concurrent
+- chat agent question -> tool call -> answer round trip, then the same
+  questions reworded (served from the query plan cache), then new
+  questions in flight together on the chat model's event loop
+followed by the per-function LLM metrics (app/utils/llm_metrics.py).
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.utils.llm_metrics import get_llm_metrics, percentile
+from benchmarks.stub_llm_server import StubLLMServer
+
+MASTER_FILE = "master_ministry_fiscal_intelligence.csv"
+
+
+# ---------------------------------------------------
+# Reporting
+# ---------------------------------------------------
+
+def report(name, latencies, wall, extra=""):
+    n = len(latencies)
+    print(
+        f"{name:<28} n={n:<4} wall {wall:7.2f}s  {n / wall if wall else 0:7.2f}/s  "
+        f"p50 {percentile(latencies, 50):6.3f}s  p95 {percentile(latencies, 95):6.3f}s  "
+        f"p99 {percentile(latencies, 99):6.3f}s  {extra}"
+    )
+
+
+def report_metrics():
+    print(f"\n{'function':<56} calls  reqs  hit rate  prompt tok  compl tok   p95 wall  p95 ttft")
+    for name, s in sorted(get_llm_metrics().summary().items()):
+        hit_rate = "-" if s["cache_hit_rate"] is None else f"{s['cache_hit_rate']:.0%}"
+        p95_ttft = s["ttft_s"]["p95"]
+        print(
+            f"{name:<56} {s['calls']:>5} {s['requests']:>5} {hit_rate:>9} "
+            f"{s['prompt_tokens']:>11} {s['completion_tokens']:>10} "
+            f"{s['wall_s']['p95']:>9.3f} {'-' if p95_ttft is None else f'{p95_ttft:.3f}':>9}"
+        )
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+# ---------------------------------------------------
+# Scenarios
+# ---------------------------------------------------
+
+def bench_full_review(df, data_hash, ministries, concurrency, cache, server):
+    from engine.fiscal_core.ministry_index import ministry_row
+    from engine.fiscal_core.ministry_review.priority_signal_engine import ministry_priority_signals
+    from agents.ministry_review_pipeline import generate_full_review
+
+    inputs = []
+    for ministry in ministries:
+        row = ministry_row(df, ministry)
+        signals = ministry_priority_signals(df, row["ministry"])
+        inputs.append((row, signals))
+
+    def review(row, signals):
+        for _ in generate_full_review(df, data_hash, row, signals):
+            pass
+
+    for label in ("full review (cold)", "full review (warm)"):
+        before_stats = cache.stats_snapshot()
+        before_requests = server.requests
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(lambda item: timed(review, *item), inputs))
+        wall = time.perf_counter() - started
+
+        after_stats = cache.stats_snapshot()
+        memory = {k: after_stats["memory"][k] - before_stats["memory"][k]
+                  for k in ("hits", "misses")}
+        lookups = memory["hits"] + memory["misses"]
+        hit_rate = memory["hits"] / lookups if lookups else 0.0
+        report(label, latencies, wall,
+               f"hit rate {hit_rate:5.1%}  llm calls {server.requests - before_requests}")
+
+
+def bench_brief_pack(df, concurrency, server):
+    from agents.cabinet_briefing_agent import CabinetBriefingAgent
+
+    agent = CabinetBriefingAgent(df, "stub-key")
+    ministries = list(agent.truth_engine.cabinet_critical_entities()["ministry"])
+    if not ministries:
+        print("brief pack: no critical ministries in this dataset")
+        return
+
+    started = time.perf_counter()
+    latencies = [timed(agent.generate_ministry_memo, m) for m in ministries]
+    report("brief pack (sequential)", latencies, time.perf_counter() - started)
+
+    latencies = []
+
+    async def run_pack():
+        original = agent.generate_ministry_memo_async
+
+        async def timed_memo(*args, **kwargs):
+            memo_started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - memo_started)
+
+        agent.generate_ministry_memo_async = timed_memo
+        return await agent.generate_critical_brief_pack_async(
+            max_concurrency=concurrency, requests_per_minute=60_000
+        )
+
+    started = time.perf_counter()
+    pack = asyncio.run(run_pack())
+    errors = sum(isinstance(item["memo"], dict) for item in pack)
+    report("brief pack (concurrent)", latencies, time.perf_counter() - started,
+           f"errors {errors}")
+
+
+def bench_chat(questions, server):
+    from agents.fiscal_agent_chat_v2 import ChatModel
+
+    chat = ChatModel(system_prompt="You answer questions about ministry spending.")
+
+    # Through the model's background loop, one question at a time
+    def ask_all():
+        latencies = []
+        for question in questions:
+            started = time.perf_counter()
+            chat.submit(question).result()
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    latencies = ask_all()
+    report("chat (tool round trip)", latencies, time.perf_counter() - started)
+
+    # Near duplicates of the questions above skip the LLM
+    before_requests = server.requests
+    questions = [q.lower().rstrip("?") for q in questions]
+    started = time.perf_counter()
+    latencies = ask_all()
+    report("chat (repeat, plan cache)", latencies, time.perf_counter() - started,
+           f"llm calls {server.requests - before_requests}")
+
+    # New questions all in flight at once on the same loop
+    questions = [f"How many capital projects does {q.rsplit(' for ', 1)[-1]} run" for q in questions]
+    latencies = []
+    started = time.perf_counter()
+    futures = [chat.submit(question) for question in questions]
+    for future in futures:
+        future.add_done_callback(lambda _: latencies.append(time.perf_counter() - started))
+    for future in futures:
+        future.result()
+    report("chat (concurrent)", latencies, time.perf_counter() - started)
+    chat.loop.stop()
+
+
+# ---------------------------------------------------
+# Entry point
+# ---------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the agents against a local stub LLM.")
+    parser.add_argument("--ministries", type=int, default=12, help="ministries in the review scenario")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", default="lognormal:-0.7,0.5",
+                        help="stub latency: fixed:S | uniform:A,B | lognormal:MU,SIGMA")
+    parser.add_argument("--replay", help="JSONL of recorded responses for the stub")
+    parser.add_argument("--chat-questions", type=int, default=5)
+    args = parser.parse_args()
+
+    server = StubLLMServer(latency=args.latency, replay=args.replay).start()
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["DEEPSEEK_BASE_URL"] = server.base_url
+    os.environ.setdefault("CHATGPT_API_KEY", "stub-key")
+    os.environ.setdefault("DEEPSEEK_API_KEY", "stub-key")
+
+    # Agents run outside `streamlit run` here; silence bare-mode warnings
+    from streamlit import logger as streamlit_logger
+    streamlit_logger.set_log_level("error")
+
+    from app.utils.response_cache import DiskTier, MemoryTier, TieredCache, set_response_cache
+    from app.utils.query_plan_cache import QueryPlanCache, set_plan_cache
+    from app.utils.load_csv import get_file_hash
+    from engine.loader import read_dataset_file
+
+    workdir = tempfile.mkdtemp(prefix="fiscal-bench-")
+    cache = TieredCache([MemoryTier(), DiskTier(Path(workdir) / "llm_responses.sqlite")])
+    set_response_cache(cache)
+    set_plan_cache(QueryPlanCache(Path(workdir) / "nl_query_plans.sqlite"))
+
+    df = read_dataset_file(MASTER_FILE)
+    data_hash = get_file_hash(MASTER_FILE)
+    ministries = sorted(df["ministry"].unique())[:args.ministries]
+
+    print(f"Stub LLM on {server.base_url}, latency {args.latency}, "
+          f"{len(ministries)} ministries, concurrency {args.concurrency}\n")
+
+    bench_full_review(df, data_hash, ministries, args.concurrency, cache, server)
+    bench_brief_pack(df, args.concurrency, server)
+    bench_chat([f"What is the total spend for {m}?" for m in ministries[:args.chat_questions]], server)
+
+    report_metrics()
+
+    cache.flush()
+    server.stop()
+    print(f"\nStub served {server.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+System prompt size for NL queries: the full data dictionary against the
+per-question schema retrieved by app/utils/schema_retrieval.py.
+
+    python -m benchmarks.schema_prompt [--tables fiscal_summary opex capex]
+                                       [--questions questions.txt]
+
+Token counts are estimates (about 4 characters per token); the exact
+prompt tokens of live runs are recorded by app/utils/llm_metrics.py.
+"""
+import argparse
+import time
+
+from app.utils.dictionary_column_names import MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY
+from app.utils.data_dictionary import dict_as_text
+from app.utils.schema_retrieval import estimate_tokens, schema_index
+from app.utils.system_prompt import schema_prompt, system_prompt
+
+SAMPLE_QUESTIONS = [
+    "Which ministries have the highest fiscal risk score?",
+    "What is the total capex budget for 2026 by ministry?",
+    "How much foreign funding do projects in region 4 receive?",
+    "Which ministries spend the most on salaries and wages?",
+    "List ministries with weak outcomes but high spend",
+    "What is the efficiency rank of the Ministry of Health?",
+    "Compare opex 2025 and opex 2026 for the Ministry of Education",
+    "Which donors fund the most projects?",
+    "How many programmes does each ministry run?",
+    "Which agencies are most dependent on foreign funding?",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report NL query system prompt sizes.")
+    parser.add_argument("--tables", nargs="+", default=["fiscal_summary"],
+                        help="data dictionary tables available to the agent")
+    parser.add_argument("--questions", help="file with one question per line")
+    args = parser.parse_args()
+
+    questions = SAMPLE_QUESTIONS
+    if args.questions:
+        with open(args.questions) as f:
+            questions = [line.strip() for line in f if line.strip()]
+
+    # What every question used to carry: the whole master dictionary
+    baseline = estimate_tokens(
+        f"{system_prompt}\nData Dictionary:\n{MASTER_MINISTRY_FISCAL_INTELLIGENCE_DICTIONARY}"
+    )
+    full = estimate_tokens(system_prompt + "\n".join(
+        dict_as_text(table) for table in args.tables
+    ))
+
+    schema_index()  # build once, outside the timings
+    print(f"Tables: {', '.join(args.tables)}")
+    print(f"Baseline prompt (master dictionary):  ~{baseline} tokens")
+    print(f"Full dictionary for these tables:     ~{full} tokens\n")
+    print(f"{'question':<64} {'tokens':>7} {'saved':>6} {'columns':>8} {'ms':>6}")
+
+    sizes = []
+    for question in questions:
+        started = time.perf_counter()
+        prompt = system_prompt + schema_prompt(question, args.tables)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        tokens = estimate_tokens(prompt)
+        columns = sum(len(c) for c in schema_index().retrieve(question, args.tables).values())
+        sizes.append(tokens)
+        print(f"{question[:64]:<64} {tokens:>7} {1 - tokens / baseline:>6.0%} {columns:>8} {elapsed:>6.1f}")
+
+    mean = sum(sizes) / len(sizes)
+    print(f"\nMean ~{mean:.0f} tokens per question, {1 - mean / baseline:.0%} below the baseline prompt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Local stand-in for an OpenAI-compatible chat-completions endpoint.
+
+Serves POST /v1/chat/completions (and /chat/completions) with:
+- recorded responses replayed from a JSONL file, matched on the request
+  messages (--replay, one {"messages": [...], "content": "..."} per line)
+- otherwise synthetic responses: schema-valid JSON for json_schema
+  response formats, a tool call when tools are offered and the last
+  message is not a tool result, plain text otherwise
+- optional SSE streaming (stream=true)
+- a configurable latency distribution per request
+
+    python -m benchmarks.stub_llm_server --port 8765 --latency lognormal:0.8,0.4
+
+then point the app at it with OPENAI_BASE_URL / DEEPSEEK_BASE_URL set to
+http://127.0.0.1:8765/v1.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_SQL = "SELECT ministry, total_spend_2026 FROM master_ministry_fiscal_intelligence LIMIT 5"
+
+
+# ---------------------------------------------------
+# Latency
+# ---------------------------------------------------
+
+def parse_latency(spec: str):
+    """
+    "fixed:0.5", "uniform:0.2,1.5" or "lognormal:mu,sigma" (seconds,
+    mu/sigma of the underlying normal) -> zero-argument sampler.
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v]
+
+    if kind == "fixed":
+        return lambda: values[0] if values else 0.0
+    if kind == "uniform":
+        low, high = values
+        return lambda: random.uniform(low, high)
+    if kind == "lognormal":
+        mu, sigma = values
+        return lambda: random.lognormvariate(mu, sigma)
+    raise ValueError(f"Unknown latency distribution '{spec}'")
+
+
+# ---------------------------------------------------
+# Synthetic content
+# ---------------------------------------------------
+
+def synthesize(schema: dict, name: str = "value"):
+    """Minimal JSON value that validates against schema."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {key: synthesize(sub, key) for key, sub in properties.items()}
+    if kind == "array":
+        return [synthesize(schema.get("items", {"type": "string"}), name)]
+    if kind == "string":
+        if name == "sql":
+            return DEFAULT_SQL
+        return f"Synthetic {name.replace('_', ' ')}."
+    if kind == "integer":
+        return int(schema.get("minimum", 1))
+    if kind == "number":
+        return float(schema.get("minimum", 1.0))
+    if kind == "boolean":
+        return True
+    return None
+
+
+def messages_key(messages) -> str:
+    return hashlib.sha256(
+        json.dumps(messages, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def load_replay(path) -> dict:
+    recorded = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                recorded[messages_key(entry["messages"])] = entry["content"]
+    return recorded
+
+
+def build_message(request: dict, recorded: dict) -> dict:
+    messages = request.get("messages", [])
+    replay = recorded.get(messages_key(messages))
+    if replay is not None:
+        return {"role": "assistant", "content": replay}
+
+    tools = request.get("tools") or []
+    last_role = messages[-1].get("role") if messages else None
+    if tools and last_role != "tool" and request.get("tool_choice") != "none":
+        choice = request.get("tool_choice")
+        tool = tools[0]
+        if isinstance(choice, dict):
+            wanted = choice.get("function", {}).get("name")
+            tool = next((t for t in tools if t["function"]["name"] == wanted), tool)
+
+        function = tool["function"]
+        arguments = synthesize(function.get("parameters", {"type": "object"}))
+        return {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {
+                    "name": function["name"],
+                    "arguments": json.dumps(arguments),
+                },
+            }],
+        }
+
+    response_format = request.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        schema = response_format.get("json_schema", {}).get("schema", {})
+        return {"role": "assistant", "content": json.dumps(synthesize(schema))}
+    if response_format.get("type") == "json_object":
+        return {"role": "assistant", "content": "{}"}
+
+    return {"role": "assistant", "content": "Synthetic response from the stub LLM server."}
+
+
+def usage(request: dict, message: dict) -> dict:
+    """Rough token counts (4 characters per token)."""
+    prompt = sum(len(str(m.get("content", ""))) // 4 for m in request.get("messages", []))
+    completion = len(message.get("content") or json.dumps(message.get("tool_calls", ""))) // 4
+    return {
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "total_tokens": prompt + completion,
+    }
+
+
+def completion(request: dict, message: dict) -> dict:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": message,
+            "finish_reason": "tool_calls" if message.get("tool_calls") else "stop",
+        }],
+        "usage": usage(request, message),
+    }
+
+
+def stream_chunks(request: dict, message: dict, chunk_size: int = 16):
+    base = {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": request.get("model", "stub"),
+    }
+
+    def chunk(delta, finish=None):
+        return {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+
+    yield chunk({"role": "assistant", "content": ""})
+    if message.get("tool_calls"):
+        calls = [{**call, "index": i} for i, call in enumerate(message["tool_calls"])]
+        yield chunk({"tool_calls": calls})
+        yield chunk({}, "tool_calls")
+    else:
+        content = message.get("content") or ""
+        for start in range(0, len(content), chunk_size):
+            yield chunk({"content": content[start:start + chunk_size]})
+        yield chunk({}, "stop")
+
+    if (request.get("stream_options") or {}).get("include_usage"):
+        yield {**base, "choices": [], "usage": usage(request, message)}
+
+
+# ---------------------------------------------------
+# Server
+# ---------------------------------------------------
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [
+                {"id": "stub", "object": "model", "owned_by": "stub"}
+            ]})
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        time.sleep(max(0.0, self.server.latency()))
+        self.server.count()
+
+        message = build_message(request, self.server.recorded)
+        if not request.get("stream"):
+            self._send_json(200, completion(request, message))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for chunk in stream_chunks(request, message):
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(self.server.stream_delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency="fixed:0",
+                 replay=None, stream_delay=0.0, verbose=False):
+        super().__init__((host, port), StubHandler)
+        self.latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self.recorded = load_replay(replay) if replay else {}
+        self.stream_delay = stream_delay
+        self.verbose = verbose
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self._thread = None
+
+    def count(self):
+        with self._count_lock:
+            self.requests += 1
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """Serves on a background thread; returns self."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub chat-completions server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0", help="fixed:S | uniform:A,B | lognormal:MU,SIGMA")
+    parser.add_argument("--replay", help="JSONL of recorded {messages, content} responses")
+    parser.add_argument("--stream-delay", type=float, default=0.0, help="seconds between streamed chunks")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = StubLLMServer(args.host, args.port, args.latency, args.replay,
+                           args.stream_delay, args.verbose)
+    print(f"Stub LLM server on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,369 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import duckdb
+from environs import Env
+
+from engine.loader import BASE_PATH, DATASETS, read_dataset
+from engine.schema import schema_key
+from engine.snapshot import content_hash
+
+env = Env()
+env.read_env()
+
+# Persistent DuckDB catalog of every dataset for SQL over the budget.
+# Each source CSV becomes a typed table in one database file (categoricals
+# as ENUMs, dates as timestamps, money as doubles), and ministry- and
+# programme-grain views hold the aggregations the data dictionary's join
+# hints ask for. A table is rebuilt only when its source file changed
+# (size + mtime, content hash when only the mtime moved), so processes
+# share the built database instead of re-registering frames from pandas.
+# Queries run on one cursor per thread with an engine-side row cap, a
+# timeout and a database-wide memory limit. Tables are built from pandas
+# frames, so the database is opened without file or network access and
+# with its configuration locked: SQL cannot read files (read_text, .env),
+# attach other databases or load extensions.
+
+CATALOG_PATH = Path(env.str(
+    "FISCAL_CATALOG_PATH", str(BASE_PATH / ".cache" / "fiscal_catalog.duckdb")
+))
+
+# Bump when table definitions or views change shape
+CATALOG_FORMAT_VERSION = 1
+
+SOURCES_TABLE = "_catalog_sources"
+
+# Database-wide limits, and per-query limits for query()
+CATALOG_MEMORY_LIMIT = env.str("CATALOG_MEMORY_LIMIT", "1GB")
+CATALOG_THREADS = env.int("CATALOG_THREADS", 4)
+QUERY_TIMEOUT = env.float("SQL_QUERY_TIMEOUT", 20.0)
+# Rows kept server-side per query; app/utils/sql_results.py decides how
+# many of them reach the agent
+QUERY_MAX_ROWS = env.int("SQL_QUERY_MAX_ROWS", 10000)
+
+# Catalog table -> dataset in engine.loader and the SELECT over its frame
+CATALOG_TABLES = {
+    "fiscal_summary": {"dataset": "ministry_summary", "select": "SELECT * FROM df"},
+    "opex": {"dataset": "opex", "select": "SELECT * FROM df"},
+    "capex": {"dataset": "capex", "select": "SELECT * FROM df"},
+    "revenue": {"dataset": "revenue", "select": "SELECT * FROM df"},
+    # Published values mix counts and percentages ("95%", "7"); the text is
+    # kept as-is next to a numeric version of it
+    "indicators": {
+        "dataset": "indicators",
+        "select": """
+            SELECT agency, agency_id, ministry, programme, indicator,
+                   "2025" AS actual_2025,
+                   target_2026,
+                   TRY_CAST(replace(trim("2025"), '%', '') AS DOUBLE) AS actual_2025_value,
+                   TRY_CAST(replace(trim(target_2026), '%', '') AS DOUBLE) AS target_2026_value,
+                   coalesce(contains("2025", '%') OR contains(target_2026, '%'), false) AS is_percentage,
+                   type, sector, agency_type
+            FROM df
+        """,
+    },
+}
+
+# Pre-aggregated views at the grains the join hints require. Keys are cast
+# to VARCHAR so they join to fiscal_summary without ENUM mismatches.
+CATALOG_VIEWS = {
+    "master_ministry_fiscal_intelligence": "SELECT * FROM fiscal_summary",
+    "opex_by_ministry": """
+        SELECT CAST(ministry AS VARCHAR) AS ministry,
+               count(DISTINCT programme) AS programme_count,
+               count(*) AS line_items,
+               sum(actual_2024) AS actual_2024,
+               sum(budget_2025) AS budget_2025,
+               sum(revised_2025) AS revised_2025,
+               sum(budget_2026) AS budget_2026,
+               sum(government_funding) AS government_funding,
+               sum(foreign_funding) AS foreign_funding
+        FROM opex
+        GROUP BY ALL
+    """,
+    "opex_by_programme": """
+        SELECT CAST(ministry AS VARCHAR) AS ministry,
+               CAST(programme AS VARCHAR) AS programme,
+               count(*) AS line_items,
+               sum(actual_2024) AS actual_2024,
+               sum(budget_2025) AS budget_2025,
+               sum(revised_2025) AS revised_2025,
+               sum(budget_2026) AS budget_2026,
+               sum(government_funding) AS government_funding,
+               sum(foreign_funding) AS foreign_funding
+        FROM opex
+        GROUP BY ALL
+    """,
+    "capex_by_ministry": """
+        SELECT CAST(ministry AS VARCHAR) AS ministry,
+               count(DISTINCT programme) AS programme_count,
+               count(*) AS project_count,
+               sum(total_project_cost) AS total_project_cost,
+               sum(total_government_funding) AS total_government_funding,
+               sum(total_foreign_funding) AS total_foreign_funding,
+               sum(gov_actual_2025) AS gov_actual_2025,
+               sum(foreign_actual_2025) AS foreign_actual_2025,
+               sum(budget_2026) AS budget_2026
+        FROM capex
+        GROUP BY ALL
+    """,
+    "capex_by_programme": """
+        SELECT CAST(ministry AS VARCHAR) AS ministry,
+               CAST(programme AS VARCHAR) AS programme,
+               count(*) AS project_count,
+               sum(total_project_cost) AS total_project_cost,
+               sum(total_government_funding) AS total_government_funding,
+               sum(total_foreign_funding) AS total_foreign_funding,
+               sum(gov_actual_2025) AS gov_actual_2025,
+               sum(foreign_actual_2025) AS foreign_actual_2025,
+               sum(budget_2026) AS budget_2026
+        FROM capex
+        GROUP BY ALL
+    """,
+    "indicators_by_ministry": """
+        SELECT ministry,
+               count(DISTINCT programme) AS programme_count,
+               count(*) AS indicator_count,
+               count(*) FILTER (WHERE type = 'output') AS output_count,
+               count(*) FILTER (WHERE type = 'outcome') AS outcome_count
+        FROM indicators
+        GROUP BY ALL
+    """,
+    "revenue_by_header": """
+        SELECT header, revenue_type,
+               count(*) AS revenue_heads,
+               sum(actual_2024) AS actual_2024,
+               sum(budget_2025) AS budget_2025,
+               sum(revised_2025) AS revised_2025,
+               sum(budget_2026) AS budget_2026
+        FROM revenue
+        GROUP BY ALL
+    """,
+}
+
+
+def _table_key(table: str) -> str:
+    # Changes whenever the same source file would build a different table
+    spec = CATALOG_TABLES[table]
+    dataset = DATASETS[spec["dataset"]]
+    payload = json.dumps({
+        "format": CATALOG_FORMAT_VERSION,
+        "dtype": dataset.get("dtype"),
+        "schema": schema_key(dataset["schema"]) if dataset.get("schema") else None,
+        "select": spec["select"],
+    }, sort_keys=True)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+class FiscalCatalog:
+    def __init__(self, path=CATALOG_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Ad-hoc frames registered on every thread's cursor
+        self._frames = {}
+        self.conn = self._connect()
+        self.conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {SOURCES_TABLE} (
+                table_name VARCHAR PRIMARY KEY,
+                file VARCHAR,
+                size BIGINT,
+                mtime_ns BIGINT,
+                md5 VARCHAR,
+                table_key VARCHAR,
+                rows BIGINT,
+                built_at TIMESTAMP
+            )
+        """)
+        self.refresh()
+
+    def _connect(self):
+        config = {
+            "memory_limit": CATALOG_MEMORY_LIMIT,
+            "threads": CATALOG_THREADS,
+            "enable_external_access": False,
+            "lock_configuration": True,
+        }
+        if self.path == ":memory:":
+            return duckdb.connect(self.path, config=config)
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            return duckdb.connect(self.path, config=config)
+        except (OSError, duckdb.IOException):
+            # Read-only data dir or the file is held by another process:
+            # build the same catalog in memory for this process
+            self.path = ":memory:"
+            return duckdb.connect(self.path, config=config)
+
+    @property
+    def tables(self) -> list[str]:
+        return list(CATALOG_TABLES)
+
+    @property
+    def views(self) -> list[str]:
+        return list(CATALOG_VIEWS)
+
+    def cursor(self):
+        """
+        The calling thread's DuckDB cursor on the catalog. Cursors share
+        the database but not their connection state, so concurrent
+        sessions never run on the same connection.
+        """
+        local = self._local
+        if getattr(local, "cursor", None) is None:
+            with self._lock:
+                local.cursor = self.conn.cursor()
+            local.frames = {}
+
+        frames = dict(self._frames)
+        for name in [n for n in local.frames if n not in frames]:
+            local.cursor.unregister(name)
+            del local.frames[name]
+        for name, df in frames.items():
+            if local.frames.get(name) is not df:
+                local.cursor.register(name, df)
+                local.frames[name] = df
+        return local.cursor
+
+    def register(self, name: str, df):
+        """Makes an ad-hoc frame queryable as name from every thread."""
+        self._frames[name] = df
+
+    def unregister(self, name: str):
+        """Drops an ad-hoc frame; each cursor forgets it on its next use."""
+        self._frames.pop(name, None)
+
+    def query(self, sql: str, max_rows=QUERY_MAX_ROWS, timeout=QUERY_TIMEOUT,
+              frames=None):
+        """
+        Runs one SELECT statement on this thread's cursor and returns
+        (frame, truncated). The row cap is a LIMIT on the query plan, so
+        large results stop early, and the query is interrupted after
+        timeout seconds. frames ({name: DataFrame}) are queryable by this
+        statement only, not by other queries or threads.
+
+        Raises ValueError for anything but a single SELECT and
+        TimeoutError when interrupted.
+        """
+        cursor = self.cursor()
+        statements = cursor.extract_statements(sql)
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError("Only a single SELECT statement can be run")
+
+        frames = frames or {}
+        for name, frame in frames.items():
+            cursor.register(name, frame)
+        timer = threading.Timer(timeout, cursor.interrupt)
+        timer.daemon = True
+        timer.start()
+        try:
+            df = cursor.sql(statements[0].query).limit(max_rows + 1).df()
+        except duckdb.InterruptException:
+            raise TimeoutError(f"Query cancelled after {timeout:g}s") from None
+        finally:
+            timer.cancel()
+            for name in frames:
+                cursor.unregister(name)
+
+        return df.head(max_rows), len(df) > max_rows
+
+    def _stored(self) -> dict:
+        rows = self.conn.execute(
+            f"SELECT table_name, size, mtime_ns, md5, table_key FROM {SOURCES_TABLE}"
+        ).fetchall()
+        return {
+            name: {"size": size, "mtime_ns": mtime_ns, "md5": md5, "table_key": key}
+            for name, size, mtime_ns, md5, key in rows
+        }
+
+    def _is_fresh(self, table, stored) -> bool:
+        """
+        Same stat check as the snapshot layer: size + mtime first, and a
+        content hash only when the mtime moved (a touched-but-identical
+        file re-stamps its row instead of forcing a rebuild).
+        """
+        if stored is None or stored["table_key"] != _table_key(table):
+            return False
+
+        source = BASE_PATH / DATASETS[CATALOG_TABLES[table]["dataset"]]["file"]
+        stat = source.stat()
+        if stat.st_size != stored["size"]:
+            return False
+        if stat.st_mtime_ns == stored["mtime_ns"]:
+            return True
+        if content_hash(source) != stored["md5"]:
+            return False
+
+        self.conn.execute(
+            f"UPDATE {SOURCES_TABLE} SET mtime_ns = ? WHERE table_name = ?",
+            [stat.st_mtime_ns, table],
+        )
+        return True
+
+    def _build_table(self, table):
+        spec = CATALOG_TABLES[table]
+        source = BASE_PATH / DATASETS[spec["dataset"]]["file"]
+        stat = source.stat()
+        df = read_dataset(spec["dataset"])
+
+        # Same connection as the surrounding transaction
+        self.conn.register("df", df)
+        try:
+            self.conn.execute(f"CREATE OR REPLACE TABLE {table} AS {spec['select']}")
+        finally:
+            self.conn.unregister("df")
+
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {SOURCES_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, now())",
+            [table, source.name, stat.st_size, stat.st_mtime_ns,
+             content_hash(source), _table_key(table), len(df)],
+        )
+
+    def data_version(self) -> str:
+        """Hash of the source files and definitions the tables were built from."""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT table_name, md5, table_key FROM {SOURCES_TABLE} ORDER BY table_name"
+            ).fetchall()
+        return hashlib.md5(json.dumps(rows).encode()).hexdigest()[:16]
+
+    def refresh(self) -> list[str]:
+        """
+        Rebuilds the tables whose source data changed, in one transaction,
+        and returns their names. Cheap when nothing changed.
+        """
+        with self._lock:
+            stored = self._stored()
+            stale = [t for t in CATALOG_TABLES if not self._is_fresh(t, stored.get(t))]
+            if not stale:
+                return []
+
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                for table in stale:
+                    self._build_table(table)
+                for view, select in CATALOG_VIEWS.items():
+                    self.conn.execute(f"CREATE OR REPLACE VIEW {view} AS {select}")
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            return stale
+
+    def close(self):
+        self.conn.close()
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> FiscalCatalog:
+    """The process-wide catalog, opened (and built if needed) on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = FiscalCatalog()
+        return _catalog
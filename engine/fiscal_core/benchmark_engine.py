@@ -1,21 +1,25 @@
 import pandas as pd
 import numpy as np
 
+from .fiscal_frame import FiscalFrame
+
 # CURRENTLY NOT BEING USED
 
 class BenchmarkEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
+    def __init__(self, master_df):
+        self.frame = FiscalFrame.of(master_df)
         self._prepare()
 
     def _prepare(self):
-        self.df['ministry'] = self.df['ministry'].str.lower().str.strip()
+        base = self.frame.df
 
         # Compute percentiles for benchmarking
-        self.df['efficiency_percentile'] = self.df['efficiency_proxy'].rank(pct=True)
-        self.df['outcome_strength_percentile'] = self.df['indicator_outcome_strength'].rank(pct=True)
-        self.df['risk_percentile'] = self.df['fiscal_risk_score'].rank(pct=True)
-        self.df['capex_intensity_percentile'] = self.df['capex_ratio_budget_2026'].rank(pct=True)
+        self.df = self.frame.view(
+            efficiency_percentile=base['efficiency_proxy'].rank(pct=True),
+            outcome_strength_percentile=base['indicator_outcome_strength'].rank(pct=True),
+            risk_percentile=base['fiscal_risk_score'].rank(pct=True),
+            capex_intensity_percentile=base['capex_ratio_budget_2026'].rank(pct=True),
+        )
 
     # Filter agency by type [ministry, constitutional, military, local governement, nan(debt)]
     # Rank according to risk_percentile
@@ -1,13 +1,92 @@
+import numpy as np
 import pandas as pd
 
+from .fiscal_frame import FiscalFrame
+from .ministry_index import MinistryIndex
+
+# Flag column -> supporting flag text, in brief order
+BRIEF_FLAGS = [
+    ('budget_pressure_flag', "budget pressure"),
+    ('very_high_spend', "very high spend"),
+    ('low_efficiency', "low efficiency"),
+    ('weak_outcomes', "weak outcomes"),
+    ('foreign_dependent', "foreign dependent"),
+    ('capex_pressure', "capex pressure"),
+    ('performance_review_flag', "performance review required"),
+]
+
 
 class BriefingEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
-        self._prepare()
+    def __init__(self, master_df):
+        self.frame = FiscalFrame.of(master_df)
+        self.df = self.frame.df
+        self.index = MinistryIndex.of(self.df)
+        self._briefs = None
+
+    # ---------------------------------------------------
+    # 0. Brief Table for Every Ministry
+    # ---------------------------------------------------
 
-    def _prepare(self):
-        self.df['ministry'] = self.df['ministry'].str.lower().str.strip()
+    def build_all_briefs(self) -> pd.DataFrame:
+        """
+        One brief per row of the master table, computed column-wise.
+        Positional with self.df; memoised on the engine.
+        """
+        if self._briefs is not None:
+            return self._briefs
+
+        df = self.df
+        flag = {
+            column: df[column].astype(bool).to_numpy()
+            for column, _ in BRIEF_FLAGS
+        }
+        high_risk = (df['fiscal_risk_label'] == 'High').to_numpy()
+
+        primary_issue = np.select(
+            [
+                high_risk,
+                flag['low_efficiency'] & flag['very_high_spend'],
+                flag['weak_outcomes'],
+            ],
+            [
+                "High fiscal risk exposure",
+                "High spend with weak efficiency",
+                "Weak outcome framework",
+            ],
+            default="No critical structural issue",
+        )
+
+        action = np.select(
+            [high_risk, flag['performance_review_flag'], flag['low_efficiency']],
+            [
+                "Escalate to Cabinet review",
+                "Initiate performance review",
+                "Request efficiency improvement plan",
+            ],
+            default="Monitor",
+        )
+
+        labels = np.array([label for _, label in BRIEF_FLAGS], dtype=object)
+        flag_matrix = np.column_stack([flag[column] for column, _ in BRIEF_FLAGS])
+        supporting_flags = [labels[mask].tolist() for mask in flag_matrix]
+
+        self._briefs = pd.DataFrame({
+            "ministry": df['ministry'].to_numpy(),
+            "total_spend_2026": df['total_spend_2026'].astype(float).to_numpy(),
+            "fiscal_risk_score": df['fiscal_risk_score'].astype(float).to_numpy(),
+            "risk_label": df['fiscal_risk_label'].to_numpy(),
+            "primary_issue": primary_issue.astype(object),
+            "supporting_flags": supporting_flags,
+            "cabinet_action": action.astype(object),
+        })
+        return self._briefs
+
+    def _briefs_at(self, positions):
+        briefs = self.build_all_briefs().iloc[positions].to_dict(orient="records")
+        # Callers get their own flag lists, not the memoised ones
+        for brief in briefs:
+            brief["supporting_flags"] = list(brief["supporting_flags"])
+        return briefs
 
     # ---------------------------------------------------
     # 1. Build Briefing Object for One Ministry
@@ -15,91 +94,28 @@ class BriefingEngine:
 
     def build_ministry_brief(self, ministry_name: str):
 
-        row = self.df[self.df['ministry'] == ministry_name.lower()]
+        position = self.index.position(ministry_name)
 
-        if row.empty:
+        if position is None:
             return {"error": "Ministry not found"}
 
-        row = row.iloc[0]
-
-        flags = []
-
-        if row['budget_pressure_flag']:
-            flags.append("budget pressure")
-
-        if row['very_high_spend']:
-            flags.append("very high spend")
-
-        if row['low_efficiency']:
-            flags.append("low efficiency")
-
-        if row['weak_outcomes']:
-            flags.append("weak outcomes")
-
-        if row['foreign_dependent']:
-            flags.append("foreign dependent")
-
-        if row['capex_pressure']:
-            flags.append("capex pressure")
-
-        if row['performance_review_flag']:
-            flags.append("performance review required")
-
-        # Determine primary issue
-        if row['fiscal_risk_label'] == 'High':
-            primary_issue = "High fiscal risk exposure"
-        elif row['low_efficiency'] and row['very_high_spend']:
-            primary_issue = "High spend with weak efficiency"
-        elif row['weak_outcomes']:
-            primary_issue = "Weak outcome framework"
-        else:
-            primary_issue = "No critical structural issue"
-
-        # Suggested Cabinet action logic
-        if row['fiscal_risk_label'] == 'High':
-            action = "Escalate to Cabinet review"
-        elif row['performance_review_flag']:
-            action = "Initiate performance review"
-        elif row['low_efficiency']:
-            action = "Request efficiency improvement plan"
-        else:
-            action = "Monitor"
-
-        return {
-            "ministry": row['ministry'],
-            "total_spend_2026": float(row['total_spend_2026']),
-            "fiscal_risk_score": float(row['fiscal_risk_score']),
-            "risk_label": row['fiscal_risk_label'],
-            "primary_issue": primary_issue,
-            "supporting_flags": flags,
-            "cabinet_action": action
-        }
+        return self._briefs_at([position])[0]
 
     # ---------------------------------------------------
     # 2. Build All High Risk Briefings
     # ---------------------------------------------------
 
     def build_high_risk_briefs(self):
-        high_risk_df = self.df[self.df['fiscal_risk_label'] == 'High']
-        briefs = []
-
-        for ministry in high_risk_df['ministry']:
-            briefs.append(self.build_ministry_brief(ministry))
-
-        return briefs
+        mask = (self.df['fiscal_risk_label'] == 'High').to_numpy()
+        return self._briefs_at(np.flatnonzero(mask))
 
     # ---------------------------------------------------
     # 3. Budget Pressure Briefings
     # ---------------------------------------------------
 
     def build_budget_pressure_briefs(self):
-        pressure_df = self.df[self.df['budget_pressure_flag'] == True]
-        briefs = []
-
-        for ministry in pressure_df['ministry']:
-            briefs.append(self.build_ministry_brief(ministry))
-
-        return briefs
+        mask = (self.df['budget_pressure_flag'] == True).to_numpy()
+        return self._briefs_at(np.flatnonzero(mask))
 
     # ---------------------------------------------------
     # 4. Top Critical (From Unified Score)
@@ -107,9 +123,7 @@ class BriefingEngine:
 
     def build_critical_briefs(self, scored_df):
         critical_df = scored_df[scored_df['unified_label'] == 'Critical']
-        briefs = []
-
-        for ministry in critical_df['ministry']:
-            briefs.append(self.build_ministry_brief(ministry))
-
-        return briefs
\ No newline at end of file
+        return [
+            self.build_ministry_brief(ministry)
+            for ministry in critical_df['ministry']
+        ]
@@ -1,13 +1,12 @@
 import pandas as pd
 
+from .fiscal_frame import FiscalFrame
 
 class EfficiencyEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
-        self._prepare()
-
-    def _prepare(self):
-        self.performance_df = self.df[self.df['ministry'] != 'public debt']
+    def __init__(self, master_df):
+        self.frame = FiscalFrame.of(master_df)
+        self.df = self.frame.df
+        self.performance_df = self.frame.performance_df
 
     # ---------------------------------------------------
     # 1. Most Expensive Outcomes (Value Distortion)
@@ -1,15 +1,15 @@
 import pandas as pd
 
+from .fiscal_frame import FiscalFrame
+
 class FiscalEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
-        self._prepare()
+    def __init__(self, master_df):
+        self.frame = FiscalFrame.of(master_df)
+        self.df = self.frame.df
 
-    def _prepare(self):
         # exclude public debt from performance logic
-        self.performance_df = self.df[self.df['ministry'] != 'public debt']
-        self.ministry_only_df = self.df[
-            self.df['agency_type'] == 'ministry']
+        self.performance_df = self.frame.performance_df
+        self.ministry_only_df = self.frame.ministry_only_df
 
     # ---------------------------------------------------
     # CORE LISTS
@@ -0,0 +1,106 @@
+import hashlib
+import threading
+import weakref
+from functools import cached_property
+
+import pandas as pd
+
+
+class FiscalFrame:
+    """
+    Normalised master table shared by reference across the fiscal_core
+    engines. The ministry column is lower-cased and stripped once here
+    instead of in every engine.
+
+    Treat df as read-only: engines that need extra columns build a view
+    with view(), which reuses the base column arrays instead of copying
+    the table.
+    """
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    def __init__(self, master_df: pd.DataFrame):
+        df = master_df.copy()
+        df['ministry'] = df['ministry'].str.lower().str.strip()
+        self._df = df
+        self._derived = {}
+        self._derived_lock = threading.Lock()
+
+    # ---------------------------------------------------
+    # Shared construction
+    # ---------------------------------------------------
+
+    @classmethod
+    def of(cls, data):
+        """
+        Returns data if it is already a FiscalFrame, otherwise the frame
+        built for this DataFrame object, creating it on first use. Frames
+        are memoised per DataFrame object for as long as it is alive, so
+        every engine and agent built on the same master_df shares one.
+        """
+        if isinstance(data, FiscalFrame):
+            return data
+
+        key = id(data)
+        with cls._lock:
+            entry = cls._instances.get(key)
+            if entry is not None and entry[0]() is data:
+                return entry[1]
+
+            frame = cls(data)
+            ref = weakref.ref(data, lambda _, key=key: cls._instances.pop(key, None))
+            cls._instances[key] = (ref, frame)
+            return frame
+
+    # ---------------------------------------------------
+    # Shared data
+    # ---------------------------------------------------
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @cached_property
+    def version(self) -> str:
+        # Content hash, used to key caches built on top of this frame
+        return hashlib.md5(
+            pd.util.hash_pandas_object(self._df, index=True).values
+        ).hexdigest()
+
+    @cached_property
+    def performance_df(self) -> pd.DataFrame:
+        # Public debt is excluded from performance logic
+        return self._df[self._df['ministry'] != 'public debt']
+
+    @cached_property
+    def ministry_only_df(self) -> pd.DataFrame:
+        return self._df[self._df['agency_type'] == 'ministry']
+
+    def derived(self, name: str, build):
+        """
+        build(df) for this frame, computed on first use and shared by
+        every later caller asking for name. Treat the result as read-only.
+        """
+        with self._derived_lock:
+            if name not in self._derived:
+                self._derived[name] = build(self._df)
+            return self._derived[name]
+
+    def view(self, **columns) -> pd.DataFrame:
+        """
+        Base table plus engine-local derived columns, without copying
+        the base columns.
+        """
+        if not columns:
+            return self._df
+
+        # Shallow copy shares the base blocks; new columns get their own
+        # blocks (pd.concat would consolidate same-dtype blocks and copy)
+        view = self._df.copy(deep=False)
+        for name, values in columns.items():
+            view[name] = values
+        return view
+
+    def __len__(self):
+        return len(self._df)
@@ -0,0 +1,190 @@
+import hashlib
+import re
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Ministry lookups by normalised name.
+# MinistryIndex maps a ministry key to its row position in a one-row-per-
+# ministry table (the master table); MinistryGroups maps it to the row
+# positions of that ministry in a line-item table (opex, capex). Both are
+# built once per distinct ministry column and reused for every lookup on it,
+# including on the fresh copies st.cache_data hands out on each rerun.
+
+# Explicit short names, on top of the derived aliases below
+MINISTRY_ALIASES = {
+    "gdf": "guyana defence force",
+    "gecom": "guyana elections commission",
+    "op": "office of the president",
+    "opm": "office of the prime minister",
+}
+
+# Distinct ministry columns kept per lookup class
+MAX_INDEXES = 16
+
+_PREFIX = "ministry of "
+_REGION = re.compile(r"^(region \d+):")
+
+
+def normalise_ministry(name) -> str:
+    return " ".join(str(name).replace("&", "and").lower().split())
+
+
+def _derived_aliases(key: str):
+    # "ministry of health" -> "health", "region 4: demerara/mahaica" -> "region 4"
+    if key.startswith(_PREFIX):
+        yield key[len(_PREFIX):]
+    match = _REGION.match(key)
+    if match:
+        yield match.group(1)
+
+
+def _build_aliases(keys, aliases=None) -> dict:
+    """
+    Alias -> canonical key. Derived aliases that would point at more than
+    one ministry, or that shadow a real ministry name, are dropped.
+    """
+    keys = set(keys)
+    derived = {}
+    for key in keys:
+        for alias in _derived_aliases(key):
+            derived.setdefault(alias, set()).add(key)
+
+    resolved = {
+        alias: targets.pop()
+        for alias, targets in derived.items()
+        if len(targets) == 1 and alias not in keys
+    }
+
+    for alias, target in {**MINISTRY_ALIASES, **(aliases or {})}.items():
+        target = normalise_ministry(target)
+        if target in keys:
+            resolved[normalise_ministry(alias)] = target
+
+    return resolved
+
+
+# ---------------------------------------------------
+# Shared lookup base
+# ---------------------------------------------------
+
+class _MinistryLookup:
+    """
+    Normalised key -> positions, plus aliases. of() memoises one instance
+    per DataFrame object while it is alive, and per column content (up to
+    MAX_INDEXES) so equal copies of a frame share it; subclasses declare
+    their own _instances and _by_content.
+    """
+
+    _instances = None
+    _by_content = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _content_key(values: pd.Series) -> str:
+        digest = hashlib.sha1(pd.util.hash_pandas_object(values, index=False).values.tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def of(cls, df: pd.DataFrame, column: str = "ministry"):
+        cache = cls._instances
+        key = (id(df), column)
+        with cls._lock:
+            entry = cache.get(key)
+            if entry is not None and entry[0]() is df:
+                return entry[1]
+
+        values = df[column]
+        content = (column, cls._content_key(values))
+        with cls._lock:
+            instance = cls._by_content.get(content)
+            if instance is None:
+                instance = cls(values)
+                cls._by_content[content] = instance
+                while len(cls._by_content) > MAX_INDEXES:
+                    cls._by_content.popitem(last=False)
+            else:
+                cls._by_content.move_to_end(content)
+
+            ref = weakref.ref(df, lambda _, key=key: cache.pop(key, None))
+            cache[key] = (ref, instance)
+            return instance
+
+    def resolve(self, name):
+        """Canonical key for name or one of its aliases, else None."""
+        key = normalise_ministry(name)
+        if key in self._positions:
+            return key
+        return self._aliases.get(key)
+
+    def __contains__(self, name):
+        return self.resolve(name) is not None
+
+    def __len__(self):
+        return len(self._positions)
+
+
+# ---------------------------------------------------
+# One row per ministry
+# ---------------------------------------------------
+
+class MinistryIndex(_MinistryLookup):
+    _instances = {}
+    _by_content = OrderedDict()
+
+    def __init__(self, ministries: pd.Series, aliases=None):
+        self._positions = {}
+        for position, name in enumerate(ministries):
+            # First occurrence wins, as with df[df.ministry == x].iloc[0]
+            self._positions.setdefault(normalise_ministry(name), position)
+
+        self._aliases = _build_aliases(self._positions, aliases)
+
+    def position(self, name):
+        key = self.resolve(name)
+        return None if key is None else self._positions[key]
+
+
+# ---------------------------------------------------
+# Many rows per ministry
+# ---------------------------------------------------
+
+class MinistryGroups(_MinistryLookup):
+    _instances = {}
+    _by_content = OrderedDict()
+
+    def __init__(self, ministries: pd.Series, aliases=None):
+        groups = {}
+        grouped = ministries.groupby(ministries, observed=True, sort=False)
+        for name, positions in grouped.indices.items():
+            groups.setdefault(normalise_ministry(name), []).append(positions)
+
+        self._positions = {
+            key: np.sort(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+            for key, parts in groups.items()
+        }
+        self._aliases = _build_aliases(self._positions, aliases)
+
+    def positions(self, name) -> np.ndarray:
+        key = self.resolve(name)
+        if key is None:
+            return np.empty(0, dtype=np.intp)
+        return self._positions[key]
+
+
+# ---------------------------------------------------
+# Lookups
+# ---------------------------------------------------
+
+def ministry_row(df: pd.DataFrame, ministry: str):
+    """Row for ministry in a one-row-per-ministry table, or None."""
+    position = MinistryIndex.of(df).position(ministry)
+    return None if position is None else df.iloc[position]
+
+
+def ministry_rows(df: pd.DataFrame, ministry: str) -> pd.DataFrame:
+    """All line items for ministry (empty frame if unknown)."""
+    return df.iloc[MinistryGroups.of(df).positions(ministry)]
@@ -1,95 +1,148 @@
+import numpy as np
+import pandas as pd
+
+from engine.fiscal_core.fiscal_frame import FiscalFrame
+from engine.fiscal_core.ministry_index import MinistryIndex
+
 # We take the fiscal_ris_score and spend_percentile and
 # create a textual interpretation so that users can
 # easily interpret them
 
-def generate_executive_headline(profile: dict):
-
-    risk_score = profile["fiscal_risk_score"]
-    spend_percentile = profile["spend_percentile"]
+# build_executive_headline_table() computes the tiers, posture and
+# headline for a whole table (master table columns) at once.
+# executive_headline_table() memoises it per master frame and
+# ministry_executive_headline() looks one ministry up in it;
+# generate_executive_headline() is the one-profile view.
+
+# (posture, headline), in rule order
+POSTURES = [
+    ("High Intervention Priority",
+     "Systemically Exposed Ministry Requiring Immediate Fiscal Stabilisation"),
+    ("Active Oversight Required",
+     "High-Exposure Ministry Requiring Tight Fiscal Control"),
+    ("Active Risk Containment",
+     "Elevated Fiscal Risk Ministry Requiring Structured Risk Mitigation"),
+    ("Routine Executive Confidence",
+     "Operationally Stable Ministry with Strong Delivery Position"),
+]
+DEFAULT_POSTURE = (
+    "Targeted Monitoring",
+    "Moderate Fiscal Position Requiring Focused Oversight",
+)
+
+HEADLINE_SIGNALS = [
+    "Systemically Significant Expenditure Footprint",
+    "Elevated Capital Expenditure Pressure",
+    "Foreign Financing Dependency Risk",
+    "Below-Median Efficiency Performance",
+    "Weak Outcome Indicator Strength",
+    "Emerging Budget Sustainability Pressure",
+]
+
+
+def _flag(df: pd.DataFrame, column: str) -> np.ndarray:
+    return df[column].astype(bool).to_numpy()
+
+
+def build_executive_headline_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Risk, scale and efficiency tiers, posture, headline and headline
+    signals for every row of df.
+    """
+    risk_score = df["fiscal_risk_score"].to_numpy()
+    spend_percentile = df["spend_percentile"].to_numpy()
 
     # Create risk tiers.
 
-    if risk_score >= 75:
-        risk_tier = "high"
-    elif risk_score >= 55:
-        risk_tier = "moderate"
-    else:
-        risk_tier = "low"
+    risk_tier = np.select(
+        [risk_score >= 75, risk_score >= 55], ["high", "moderate"], default="low"
+    )
 
     # Create spend scale tier
 
-    if profile["very_high_spend"] or spend_percentile >= 85:
-        scale_tier = "systemic"
-    elif profile["high_spend"] or spend_percentile >= 70:
-        scale_tier = "high"
-    else:
-        scale_tier = "standard"
+    systemic = _flag(df, "very_high_spend") | (spend_percentile >= 85)
+    scale_tier = np.select(
+        [systemic, _flag(df, "high_spend") | (spend_percentile >= 70)],
+        ["systemic", "high"],
+        default="standard",
+    )
 
     # Create a more useful synonym
 
-    if profile["low_efficiency"]:
-        efficiency_tier = "weak"
-    elif profile["high_efficiency"]:
-        efficiency_tier = "strong"
-    else:
-        efficiency_tier = "neutral"
+    weak = _flag(df, "low_efficiency")
+    efficiency_tier = np.select(
+        [weak, _flag(df, "high_efficiency")], ["weak", "strong"],
+        default="neutral",
+    )
 
     # Use combination of tiers to create text interpretation
-    # This is also useful for the LLMs
-
-    if (
-        (risk_tier == "high" and scale_tier in ["systemic", "high"])
-        or (risk_tier == "high" and efficiency_tier == "weak")
-    ):
-        posture = "High Intervention Priority"
-        headline = "Systemically Exposed Ministry Requiring Immediate Fiscal Stabilisation"
-
-    elif risk_tier == "moderate" and scale_tier in ["systemic", "high"]:
-        posture = "Active Oversight Required"
-        headline = "High-Exposure Ministry Requiring Tight Fiscal Control"
-
-    elif risk_tier == "high":
-        posture = "Active Risk Containment"
-        headline = "Elevated Fiscal Risk Ministry Requiring Structured Risk Mitigation"
 
-    elif risk_tier == "low" and efficiency_tier == "strong":
-        posture = "Routine Executive Confidence"
-        headline = "Operationally Stable Ministry with Strong Delivery Position"
-
-    else:
-        posture = "Targeted Monitoring"
-        headline = "Moderate Fiscal Position Requiring Focused Oversight"
+    high_risk = risk_tier == "high"
+    large_scale = np.isin(scale_tier, ["systemic", "high"])
+    rules = [
+        (high_risk & large_scale) | (high_risk & (efficiency_tier == "weak")),
+        (risk_tier == "moderate") & large_scale,
+        high_risk,
+        (risk_tier == "low") & (efficiency_tier == "strong"),
+    ]
+    posture = np.select(
+        rules, [p for p, _ in POSTURES], default=DEFAULT_POSTURE[0]
+    )
+    headline = np.select(
+        rules, [h for _, h in POSTURES], default=DEFAULT_POSTURE[1]
+    )
 
     # Create Priority Signals
 
-    signals = []
+    signal_matrix = np.column_stack([
+        scale_tier == "systemic",
+        _flag(df, "capex_pressure"),
+        _flag(df, "foreign_risk"),
+        efficiency_tier == "weak",
+        _flag(df, "weak_outcomes"),
+        _flag(df, "budget_pressure_flag"),
+    ])
+    labels = np.array(HEADLINE_SIGNALS, dtype=object)
+    signals = [labels[mask].tolist()[:5] for mask in signal_matrix]
+
+    return pd.DataFrame({
+        "risk_tier": risk_tier.astype(object),
+        "scale_tier": scale_tier.astype(object),
+        "efficiency_tier": efficiency_tier.astype(object),
+        "headline": headline.astype(object),
+        "posture": posture.astype(object),
+        "risk_score": df["fiscal_risk_score"].to_numpy(),
+        "risk_label": df["fiscal_risk_label"].to_numpy(),
+        "spend_percentile": spend_percentile,
+        "efficiency_rank": df["efficiency_rank"].to_numpy(),
+        "signals": signals,
+    }, index=df.index)
 
-    if scale_tier == "systemic":
-        signals.append("Systemically Significant Expenditure Footprint")
 
-    if profile["capex_pressure"]:
-        signals.append("Elevated Capital Expenditure Pressure")
+def headline_from_row(row) -> dict:
+    return {
+        "headline": row["headline"],
+        "posture": row["posture"],
+        "risk_score": row["risk_score"],
+        "risk_label": row["risk_label"],
+        "spend_percentile": row["spend_percentile"],
+        "efficiency_rank": row["efficiency_rank"],
+        "signals": list(row["signals"]),
+    }
 
-    if profile["foreign_risk"]:
-        signals.append("Foreign Financing Dependency Risk")
 
-    if efficiency_tier == "weak":
-        signals.append("Below-Median Efficiency Performance")
+def executive_headline_table(df: pd.DataFrame) -> pd.DataFrame:
+    """build_executive_headline_table() for the master table df, computed once per frame."""
+    return FiscalFrame.of(df).derived("executive_headlines", build_executive_headline_table)
 
-    if profile["weak_outcomes"]:
-        signals.append("Weak Outcome Indicator Strength")
 
-    if profile["budget_pressure_flag"]:
-        signals.append("Emerging Budget Sustainability Pressure")
+def ministry_executive_headline(df: pd.DataFrame, ministry: str) -> dict:
+    position = MinistryIndex.of(df).position(ministry)
+    if position is None:
+        raise ValueError(f"Ministry '{ministry}' not found.")
+    return headline_from_row(executive_headline_table(df).iloc[position])
 
-    signals = signals[:5]
 
-    return {
-        "headline": headline,
-        "posture": posture,
-        "risk_score": risk_score,
-        "risk_label": profile["fiscal_risk_label"],
-        "spend_percentile": spend_percentile,
-        "efficiency_rank": profile["efficiency_rank"],
-        "signals": signals
-    }
\ No newline at end of file
+def generate_executive_headline(profile: dict):
+    table = build_executive_headline_table(pd.DataFrame([profile]))
+    return headline_from_row(table.iloc[0])
@@ -1,17 +1,17 @@
 import pandas as pd
 
+from engine.fiscal_core.ministry_index import ministry_row
+
 # df is dataset from the master_ministry_fiscal_intelligence.csv
 # ministry is the ministry of interest from the drop down in 2_Ministry_Review
 # Uses the data to create a profile for the ministry
 
 def build_ministry_profile(df: pd.DataFrame, ministry: str) -> dict:
-    row = df[df["ministry"] == ministry]
+    row = ministry_row(df, ministry)
 
-    if row.empty:
+    if row is None:
         raise ValueError(f"Ministry '{ministry}' not found.")
 
-    row = row.iloc[0]
-
     profile = {
         # Core Identifiers
         "ministry": row["ministry"],
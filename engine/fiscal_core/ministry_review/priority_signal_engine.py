@@ -1,98 +1,158 @@
+import numpy as np
+import pandas as pd
+
+from engine.fiscal_core.fiscal_frame import FiscalFrame
+from engine.fiscal_core.ministry_index import MinistryIndex
 
 # takes profile created build_ministry_profile()
 # uses spend_percentile, foreing_risk, outcomes etc. to create useful NL summary
 # for numerical values
 
-def build_priority_signals(profile: dict) -> list:
-    signals = []
+# build_priority_signal_table() does the same for a whole table at once
+# (master table columns, one row per ministry). priority_signal_table()
+# memoises it per master frame and ministry_priority_signals() looks one
+# ministry up in it; build_priority_signals() is the one-profile view.
+
+PRIORITY_SIGNALS = [
+    ("expenditure_concentration", "Expenditure Concentration"),
+    ("capital_structure", "Capital Structure Pressure"),
+    ("foreign_financing", "Foreign Financing Exposure"),
+    ("delivery_performance", "Delivery & Outcome Performance"),
+    ("fiscal_sustainability", "Fiscal Sustainability Risk"),
+]
+
+
+def _flag(df: pd.DataFrame, column: str) -> np.ndarray:
+    # Truthiness as in `if profile[column]`
+    return df[column].astype(bool).to_numpy()
+
+
+def _text(values) -> pd.Series:
+    return pd.Series(values, dtype=object).astype(str)
+
+
+def build_priority_signal_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Severity and summary of the five priority signals for every row of
+    df, as <signal>_severity / <signal>_summary columns.
+    """
+    table = pd.DataFrame(index=df.index)
 
     # Expenditure Concentration
 
-    percentile = profile["spend_percentile"]
-    percentile = round(percentile*100)
-    if percentile >= 85:
-        severity = "High"
-        summary = f"Positioned in the {percentile}th expenditure percentile — systemically significant fiscal footprint."
-    elif percentile >= 70:
-        severity = "Moderate"
-        summary = f"Positioned in the {percentile}th expenditure percentile — elevated fiscal scale."
-    else:
-        severity = "Contained"
-        summary = f"Positioned in the {percentile}th expenditure percentile — standard fiscal scale."
-
-    signals.append({
-        "title": "Expenditure Concentration",
-        "severity": severity,
-        "summary": summary
-    })
+    percentile = np.round(df["spend_percentile"].to_numpy() * 100).astype(int)
+    concentration = [percentile >= 85, percentile >= 70]
+
+    table["expenditure_concentration_severity"] = np.select(
+        concentration, ["High", "Moderate"], default="Contained",
+    )
+    table["expenditure_concentration_summary"] = (
+        "Positioned in the " + _text(percentile).to_numpy()
+        + "th expenditure percentile — "
+        + np.select(
+            concentration,
+            [
+                "systemically significant fiscal footprint.",
+                "elevated fiscal scale.",
+            ],
+            default="standard fiscal scale.",
+        ).astype(object)
+    )
 
     # Capital Structure Pressure
 
-    if profile["capex_pressure"] or profile["capex_risk"]:
-        severity = "High"
-        summary = "Capital expenditure structure indicates elevated execution or absorption pressure."
-    else:
-        severity = "Contained"
-        summary = "Capital structure within normal peer-adjusted range."
-
-    signals.append({
-        "title": "Capital Structure Pressure",
-        "severity": severity,
-        "summary": summary
-    })
+    capex_high = _flag(df, "capex_pressure") | _flag(df, "capex_risk")
+    table["capital_structure_severity"] = np.where(capex_high, "High", "Contained")
+    table["capital_structure_summary"] = np.where(
+        capex_high,
+        "Capital expenditure structure indicates elevated execution or absorption pressure.",
+        "Capital structure within normal peer-adjusted range.",
+    )
 
     # Foreign Financing Risk
 
-    if profile["foreign_risk"]:
-        severity = "High"
-        summary = f"{round(profile['foreign_dependency']*100,1)}% of capital expenditure externally financed — exposure to external funding volatility."
-    elif profile["foreign_dependency"] > 0.2:
-        severity = "Moderate"
-        summary = f"{round(profile['foreign_dependency']*100,1)}% of capital expenditure externally financed."
-    else:
-        severity = "Contained"
-        summary = "Limited reliance on external capital financing."
-
-    signals.append({
-        "title": "Foreign Financing Exposure",
-        "severity": severity,
-        "summary": summary
-    })
+    foreign_risk = _flag(df, "foreign_risk")
+    dependency = df["foreign_dependency"].to_numpy()
+    dependency_pct = _text(np.round(dependency * 100, 1)).to_numpy()
+    foreign_moderate = dependency > 0.2
+
+    table["foreign_financing_severity"] = np.select(
+        [foreign_risk, foreign_moderate], ["High", "Moderate"],
+        default="Contained",
+    )
+    table["foreign_financing_summary"] = np.select(
+        [foreign_risk, foreign_moderate],
+        [
+            dependency_pct + "% of capital expenditure externally financed — exposure to external funding volatility.",
+            dependency_pct + "% of capital expenditure externally financed.",
+        ],
+        default="Limited reliance on external capital financing.",
+    )
 
     # Efficiency & outcome performance
 
-    if profile["low_efficiency"] or profile["weak_outcomes"]:
-        severity = "High"
-        summary = f"Efficiency rank positioned at {profile['efficiency_rank']} with weak outcome indicators."
-    elif profile["high_efficiency"]:
-        severity = "Contained"
-        summary = "Strong relative efficiency and outcome alignment."
-    else:
-        severity = "Moderate"
-        summary = f"Efficiency rank positioned at {profile['efficiency_rank']} — mid-tier delivery performance."
-
-    signals.append({
-        "title": "Delivery & Outcome Performance",
-        "severity": severity,
-        "summary": summary
-    })
+    delivery_weak = _flag(df, "low_efficiency") | _flag(df, "weak_outcomes")
+    high_efficiency = _flag(df, "high_efficiency")
+    rank = _text(df["efficiency_rank"].to_numpy()).to_numpy()
+
+    table["delivery_performance_severity"] = np.select(
+        [delivery_weak, high_efficiency], ["High", "Contained"],
+        default="Moderate",
+    )
+    table["delivery_performance_summary"] = np.select(
+        [delivery_weak, high_efficiency],
+        [
+            "Efficiency rank positioned at " + rank + " with weak outcome indicators.",
+            "Strong relative efficiency and outcome alignment.",
+        ],
+        default="Efficiency rank positioned at " + rank + " — mid-tier delivery performance.",
+    )
 
     # Fiscal sustainability risk
 
-    if profile["budget_pressure_flag"] or profile["fiscal_risk_score"] >= 75:
-        severity = "High"
-        summary = "Budget sustainability pressures identified within fiscal risk assessment."
-    elif profile["fiscal_risk_score"] >= 55:
-        severity = "Moderate"
-        summary = "Moderate fiscal vulnerability requiring structured oversight."
-    else:
-        severity = "Contained"
-        summary = "Fiscal sustainability position assessed as stable."
-
-    signals.append({
-        "title": "Fiscal Sustainability Risk",
-        "severity": severity,
-        "summary": summary
-    })
-
-    return signals
\ No newline at end of file
+    risk_score = df["fiscal_risk_score"].to_numpy()
+    sustainability_high = _flag(df, "budget_pressure_flag") | (risk_score >= 75)
+    sustainability_moderate = risk_score >= 55
+
+    table["fiscal_sustainability_severity"] = np.select(
+        [sustainability_high, sustainability_moderate], ["High", "Moderate"],
+        default="Contained",
+    )
+    table["fiscal_sustainability_summary"] = np.select(
+        [sustainability_high, sustainability_moderate],
+        [
+            "Budget sustainability pressures identified within fiscal risk assessment.",
+            "Moderate fiscal vulnerability requiring structured oversight.",
+        ],
+        default="Fiscal sustainability position assessed as stable.",
+    )
+
+    return table
+
+
+def signals_from_row(row) -> list:
+    return [
+        {
+            "title": title,
+            "severity": row[f"{key}_severity"],
+            "summary": row[f"{key}_summary"],
+        }
+        for key, title in PRIORITY_SIGNALS
+    ]
+
+
+def priority_signal_table(df: pd.DataFrame) -> pd.DataFrame:
+    """build_priority_signal_table() for the master table df, computed once per frame."""
+    return FiscalFrame.of(df).derived("priority_signals", build_priority_signal_table)
+
+
+def ministry_priority_signals(df: pd.DataFrame, ministry: str) -> list:
+    position = MinistryIndex.of(df).position(ministry)
+    if position is None:
+        raise ValueError(f"Ministry '{ministry}' not found.")
+    return signals_from_row(priority_signal_table(df).iloc[position])
+
+
+def build_priority_signals(profile: dict) -> list:
+    table = build_priority_signal_table(pd.DataFrame([profile]))
+    return signals_from_row(table.iloc[0])
@@ -1,64 +1,164 @@
+import copy
+import hashlib
+import threading
+
+import numpy as np
 import pandas as pd
 
+from engine.fiscal_core.ministry_index import normalise_ministry
+
 # df is dataset from the BudgetCurrentExpenditure2026_v3.csv
 # ministry is the ministry of interest from the drop down in 4_Ministry_Opex_Review.py
 # Uses the data to create a profile for the ministry
 
-def build_ministry_profile(df: pd.DataFrame, ministry: str) -> dict:
-    rows = df[df["ministry"] == ministry]
-
-    if rows.empty:
-        raise ValueError(f"Ministry '{ministry}' not found.")
-    
-    profile = {
-        "ministry": ministry,
-
-        # Structural Spend
-        "budgeted_spend_year_0": rows["budget_2026"].sum(),
-        "actual_spend_year_1": rows["revised_2025"].sum(),
-        "actual_spend_year_2": rows["actual_2024"].sum(),
-
-        # High Level Fiscal Indicators
-        "budget_credibility_ratio": (rows["revised_2025"].sum()/rows["budget_2025"].sum())*100,
-
-        # Budget growth rate
-        "budget_growth_yoy": [100*(rows["revised_2025"].sum()/rows["actual_2024"].sum() - 1), 
-                              100*(rows["budget_2026"].sum()/rows["revised_2025"].sum() - 1)],
-        
-        "cagr": ((rows["budget_2026"].sum()/rows["actual_2024"].sum())**(0.5)-1)*100,
-
-        # Rigidity distribution
-        "rigidity_distribution": rows.groupby('rigidity')[
-            'budget_2026'
-            ].sum().to_dict(),
-
-        # Spending by type
-        "spending_type": rows.groupby('spending_type')[
-            'budget_2026'
-        ].sum().to_dict(),
-
-        # Personnel and Operations cost
-        "personnel_cost": rows[
-            rows['spending_type'] == 'Personnel'
-            ][
-                ['actual_2024', 'revised_2025', 'budget_2026']
-                ].sum().to_dict(),
-
-        "operations_cost": rows[
-            rows['spending_type'] == 'Operations'
-            ][
-                ['actual_2024', 'revised_2025', 'budget_2026']
-                ].sum().to_dict(),
-
-        "economic_group_costs": rows.groupby('economic_group')[
-            'budget_2026'
-        ].sum().to_dict(),
-    }
-    print(rows.columns)
-    print("--------------------")
-    #print(profile)
-    #print(rows['spending_type'].unique())
-    #print(rows['economic_subgroup'].unique())
-    #print(rows['account_name'].unique())
-
-    return profile
\ No newline at end of file
+# Profiles are served from an aggregate cube
+# (ministry x rigidity x spending_type x economic_group -> year totals)
+# built once per dataset version, so switching ministries is a lookup.
+
+YEAR_COLUMNS = ["actual_2024", "budget_2025", "revised_2025", "budget_2026"]
+CUBE_DIMENSIONS = ["rigidity", "spending_type", "economic_group"]
+
+# Cubes kept for the most recent dataset versions
+_CUBES = {}
+_CUBE_CACHE_SIZE = 4
+_CUBE_LOCK = threading.Lock()
+
+
+def dataset_version(df: pd.DataFrame) -> str:
+    return hashlib.md5(
+        pd.util.hash_pandas_object(df, index=True).values
+    ).hexdigest()
+
+
+class OpexCube:
+    def __init__(self, df: pd.DataFrame):
+        self.cube = df.groupby(
+            ["ministry", *CUBE_DIMENSIONS], observed=True, dropna=False
+        )[YEAR_COLUMNS].sum()
+
+        self.totals = self.cube.groupby(level="ministry", observed=True).sum()
+
+        # Per-dimension totals; missing labels are left out as in groupby
+        self.marginals = {
+            dimension: self.cube.groupby(
+                level=["ministry", dimension], observed=True
+            ).sum()
+            for dimension in CUBE_DIMENSIONS
+        }
+
+        self._keys = {
+            normalise_ministry(ministry): ministry
+            for ministry in self.totals.index
+        }
+        self._profiles = self._build_profiles()
+
+    # ---------------------------------------------------
+    # Profiles
+    # ---------------------------------------------------
+
+    def _breakdown(self, dimension, column="budget_2026"):
+        marginal = self.marginals[dimension][column]
+        out = {ministry: {} for ministry in self.totals.index}
+        for (ministry, label), value in marginal.items():
+            out[ministry][label] = value
+        return out
+
+    def _spending_type_costs(self, spending_type):
+        columns = ["actual_2024", "revised_2025", "budget_2026"]
+        marginal = self.marginals["spending_type"][columns]
+        labels = marginal.index.get_level_values("spending_type")
+        costs = marginal[labels == spending_type].droplevel("spending_type")
+        return costs.reindex(self.totals.index, fill_value=0.0)
+
+    def _build_profiles(self) -> dict:
+        t = self.totals
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            credibility = (t["revised_2025"] / t["budget_2025"]) * 100
+            growth_1 = 100 * (t["revised_2025"] / t["actual_2024"] - 1)
+            growth_0 = 100 * (t["budget_2026"] / t["revised_2025"] - 1)
+            cagr = ((t["budget_2026"] / t["actual_2024"]) ** 0.5 - 1) * 100
+
+        rigidity = self._breakdown("rigidity")
+        spending_type = self._breakdown("spending_type")
+        economic_group = self._breakdown("economic_group")
+        personnel = self._spending_type_costs("Personnel")
+        operations = self._spending_type_costs("Operations")
+
+        return {
+            ministry: {
+                "ministry": ministry,
+
+                # Structural Spend
+                "budgeted_spend_year_0": t.at[ministry, "budget_2026"],
+                "actual_spend_year_1": t.at[ministry, "revised_2025"],
+                "actual_spend_year_2": t.at[ministry, "actual_2024"],
+
+                # High Level Fiscal Indicators
+                "budget_credibility_ratio": credibility[ministry],
+
+                # Budget growth rate
+                "budget_growth_yoy": [growth_1[ministry], growth_0[ministry]],
+
+                "cagr": cagr[ministry],
+
+                # Rigidity distribution
+                "rigidity_distribution": rigidity[ministry],
+
+                # Spending by type
+                "spending_type": spending_type[ministry],
+
+                # Personnel and Operations cost
+                "personnel_cost": personnel.loc[ministry].to_dict(),
+                "operations_cost": operations.loc[ministry].to_dict(),
+
+                "economic_group_costs": economic_group[ministry],
+            }
+            for ministry in t.index
+        }
+
+    def ministries(self) -> list:
+        return list(self._profiles)
+
+    def profile(self, ministry: str) -> dict:
+        key = self._keys.get(normalise_ministry(ministry))
+        if key is None:
+            raise ValueError(f"Ministry '{ministry}' not found.")
+
+        profile = copy.deepcopy(self._profiles[key])
+        profile["ministry"] = ministry
+        return profile
+
+    def all_profiles(self) -> dict:
+        return copy.deepcopy(self._profiles)
+
+
+def opex_cube(df: pd.DataFrame, version: str = None) -> OpexCube:
+    """
+    Cube for this opex dataset, built on first use per dataset version.
+    version defaults to a content hash of df; pass the source file hash
+    to skip hashing.
+    """
+    version = version or dataset_version(df)
+
+    cube = _CUBES.get(version)
+    if cube is not None:
+        return cube
+
+    with _CUBE_LOCK:
+        cube = _CUBES.get(version)
+        if cube is None:
+            cube = OpexCube(df)
+            if len(_CUBES) >= _CUBE_CACHE_SIZE:
+                _CUBES.pop(next(iter(_CUBES)))
+            _CUBES[version] = cube
+        return cube
+
+
+def build_ministry_profile(df: pd.DataFrame, ministry: str,
+                           version: str = None) -> dict:
+    return opex_cube(df, version).profile(ministry)
+
+
+def build_all_ministry_profiles(df: pd.DataFrame, version: str = None) -> dict:
+    return opex_cube(df, version).all_profiles()
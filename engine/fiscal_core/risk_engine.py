@@ -1,13 +1,11 @@
 import pandas as pd
 
+from .fiscal_frame import FiscalFrame
 
 class RiskEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
-        self._prepare()
-
-    def _prepare(self):
-        self.df['ministry'] = self.df['ministry'].str.lower().str.strip()
+    def __init__(self, master_df):
+        self.frame = FiscalFrame.of(master_df)
+        self.df = self.frame.df
 
     # ---------------------------------------------------
     # 1. High Fiscal Risk Ministries
@@ -88,8 +86,7 @@ class RiskEngine:
             'capex_pressure'
         ]
 
-        df = self.df.copy()
-        df['risk_flag_count'] = df[risk_flags].sum(axis=1)
+        df = self.frame.view(risk_flag_count=self.df[risk_flags].sum(axis=1))
 
         watchlist = df[df['risk_flag_count'] >= 2]
 
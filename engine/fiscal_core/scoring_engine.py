@@ -1,19 +1,43 @@
+import threading
+
 import pandas as pd
 import numpy as np
 
+from .fiscal_frame import FiscalFrame
+
+# Unified score weights. Penalty weights apply to boolean flags.
+DEFAULT_WEIGHTS = {
+    'fiscal_risk': 0.40,
+    'efficiency': 0.25,
+    'outcome_strength': 0.15,
+    'budget_pressure': 0.10,
+    'foreign_dependence': 0.05,
+    'capex_pressure': 0.05,
+}
+
+# Scored tables keyed on (frame version, weights). Entries are shared
+# between engines and callers, so treat them as read-only.
+_SCORE_CACHE = {}
+_SCORE_CACHE_SIZE = 16
+_SCORE_LOCK = threading.Lock()
+
+
+def clear_score_cache():
+    with _SCORE_LOCK:
+        _SCORE_CACHE.clear()
+
 
 class ScoringEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.df = master_df.copy()
+    def __init__(self, master_df, weights=None):
+        self.frame = FiscalFrame.of(master_df)
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
         self._prepare()
 
     def _prepare(self):
-        self.df['ministry'] = self.df['ministry'].str.lower().str.strip()
+        base = self.frame.df
 
         # Normalize core numeric fields
-        self.df['norm_fiscal_risk'] = self._normalize(self.df['fiscal_risk_score'])
-        self.df['norm_efficiency'] = self._normalize(self.df['efficiency_proxy'])
-        self.df['indicator_outcome_strength_numeric'] = self.df['indicator_outcome_strength'].map(
+        outcome_strength_numeric = base['indicator_outcome_strength'].map(
             {
                 'very weak': 0,
                 'weak': 1,
@@ -22,9 +46,12 @@ class ScoringEngine:
                 'very strong': 4
             }
         )
-        self.df['norm_outcome_strength'] = self._normalize(
-            self.df['indicator_outcome_strength_numeric']
-            )
+        self.df = self.frame.view(
+            norm_fiscal_risk=self._normalize(base['fiscal_risk_score']),
+            norm_efficiency=self._normalize(base['efficiency_proxy']),
+            indicator_outcome_strength_numeric=outcome_strength_numeric,
+            norm_outcome_strength=self._normalize(outcome_strength_numeric),
+        )
 
     def _normalize(self, series):
         return (series - series.min()) / (series.max() - series.min() + 1e-9)
@@ -34,27 +61,47 @@ class ScoringEngine:
     # ---------------------------------------------------
 
     def compute_unified_score(self):
-
+        """
+        Scored table for this frame and weight configuration, computed
+        once and served from the module cache afterwards. Read-only.
+        """
+        key = (self.frame.version, tuple(sorted(self.weights.items())))
+
+        scored = _SCORE_CACHE.get(key)
+        if scored is not None:
+            return scored
+
+        with _SCORE_LOCK:
+            scored = _SCORE_CACHE.get(key)
+            if scored is None:
+                scored = self._score()
+                if len(_SCORE_CACHE) >= _SCORE_CACHE_SIZE:
+                    _SCORE_CACHE.pop(next(iter(_SCORE_CACHE)))
+                _SCORE_CACHE[key] = scored
+            return scored
+
+    def _score(self):
+        w = self.weights
         df = self.df.copy()
 
         # Penalty flags
-        df['pressure_penalty'] = df['budget_pressure_flag'].astype(int) * 0.10
-        df['foreign_penalty'] = df['foreign_dependent'].astype(int) * 0.05
-        df['capex_penalty'] = df['capex_pressure'].astype(int) * 0.05
+        df['pressure_penalty'] = df['budget_pressure_flag'].astype(int) * w['budget_pressure']
+        df['foreign_penalty'] = df['foreign_dependent'].astype(int) * w['foreign_dependence']
+        df['capex_penalty'] = df['capex_pressure'].astype(int) * w['capex_pressure']
 
         # Public debt should not get efficiency/outcome weight
         performance_mask = df['ministry'] != 'public debt'
     
         df['performance_component'] = 0
         df['performance_component'] = (
-            (df['norm_efficiency'] * 0.25) +
-            (df['norm_outcome_strength'] * 0.15)
+            (df['norm_efficiency'] * w['efficiency']) +
+            (df['norm_outcome_strength'] * w['outcome_strength'])
         )
         df.loc[~performance_mask, 'performance_component'] = 0
 
         # Core weighted score
         df['raw_score'] = (
-            (df['norm_fiscal_risk'] * 0.40) +
+            (df['norm_fiscal_risk'] * w['fiscal_risk']) +
             df['performance_component'] +
             df['pressure_penalty'] +
             df['foreign_penalty'] +
@@ -4,17 +4,20 @@ from .scoring_engine import ScoringEngine
 from .risk_engine import RiskEngine
 from .efficiency_engine import EfficiencyEngine
 from .benchmark_engine import BenchmarkEngine
+from .fiscal_frame import FiscalFrame
 
 
 class UnifiedTruthEngine:
-    def __init__(self, master_df: pd.DataFrame):
-        self.master_df = master_df.copy()
+    def __init__(self, master_df, weights=None):
+        # One normalised frame shared by reference with every component engine
+        self.frame = FiscalFrame.of(master_df)
+        self.master_df = self.frame.df
 
         # Initialize component engines
-        self.scoring_engine = ScoringEngine(self.master_df)
-        self.risk_engine = RiskEngine(self.master_df)
-        self.efficiency_engine = EfficiencyEngine(self.master_df)
-        self.benchmark_engine = BenchmarkEngine(self.master_df)
+        self.scoring_engine = ScoringEngine(self.frame, weights)
+        self.risk_engine = RiskEngine(self.frame)
+        self.efficiency_engine = EfficiencyEngine(self.frame)
+        self.benchmark_engine = BenchmarkEngine(self.frame)
 
     # ---------------------------------------------------
     # 1. Master Unified Table
@@ -25,7 +28,7 @@ class UnifiedTruthEngine:
         Produces one consolidated fiscal intelligence table.
         """
 
-        # Unified scoring
+        # Unified scoring (cached per data version and weights)
         scored_df = self.scoring_engine.compute_unified_score()
 
         # Merge back into master for full context
@@ -1,9 +1,11 @@
 from engine.loader import FiscalDataLoader
+from engine.fiscal_core.ministry_index import MinistryIndex
 
 class FiscalTools:
 
     def __init__(self):
-        self.data = FiscalDataLoader().load_all()
+        # Only the ministry summary is used here; other datasets stay unloaded
+        self.data = FiscalDataLoader()
         self.summary = self.data.ministry_summary
 
     # --------------------------------------------------
@@ -14,10 +16,10 @@ class FiscalTools:
         return sorted(self.summary["ministry"].unique().tolist())
 
     def get_ministry_summary(self, ministry: str):
-        df = self.summary[self.summary["ministry"].str.lower() == ministry.lower()]
-        if df.empty:
+        position = MinistryIndex.of(self.summary).position(ministry)
+        if position is None:
             return {"error": f"Ministry '{ministry}' not found"}
-        return df.to_dict(orient="records")[0]
+        return self.summary.iloc[[position]].to_dict(orient="records")[0]
 
     # --------------------------------------------------
     # TOP SPENDING ANALYSIS
@@ -1,38 +1,151 @@
+import threading
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from functools import partial
+from engine.snapshot import read_csv_snapshot
+from engine.schema import OPEX_SCHEMA, CAPEX_SCHEMA, apply_schema, read_dtypes, schema_key
 
 BASE_PATH = Path(__file__).resolve().parent.parent / "data"
 
+# Source file and explicit read dtypes for every dataset.
+# Dtypes are pinned so the snapshot schema does not drift with
+# pandas' type inference between budget revisions. Datasets with a column
+# schema take their numeric dtypes from it, so each column is declared once.
+DATASETS = {
+    "revenue": {
+        "file": "budget_2026_volume_1_revenue_v2.csv",
+        "dtype": {
+            "actual_2024": "int64",
+            "budget_2025": "int64",
+            "revised_2025": "int64",
+            "budget_2026": "int64",
+            "code": "int64",
+            "title": "object",
+            "header": "object",
+            "revenue_type": "object",
+        },
+    },
+    "opex": {
+        "file": "BudgetCurrentExpenditure2026_v3.csv",
+        "dtype": {
+            **read_dtypes(OPEX_SCHEMA),
+            "account_code": "int64",
+        },
+        "schema": OPEX_SCHEMA,
+    },
+    "capex": {
+        "file": "BudgetCapitalExpenditure_vol3_v4.csv",
+        "dtype": read_dtypes(CAPEX_SCHEMA),
+        "schema": CAPEX_SCHEMA,
+    },
+    "indicators": {
+        "file": "project_indicator_2026_v4.csv",
+        # Mixed values such as "95%" and "7"
+        "dtype": {
+            "2025": "object",
+            "target_2026": "object",
+        },
+    },
+    "ministry_summary": {
+        "file": "master_ministry_fiscal_intelligence.csv",
+        "dtype": {
+            "ministry": "object",
+            "programme_count": "int64",
+            "agency_type": "object",
+        },
+    },
+}
+
+DATASET_BY_FILE = {spec["file"]: name for name, spec in DATASETS.items()}
+
+
+def read_dataset_file(file_name: str) -> pd.DataFrame:
+    """
+    Reads a CSV from the data folder through the snapshot cache,
+    applying the registered dtypes and column schema when the file
+    is a known dataset.
+    """
+    spec = DATASETS.get(DATASET_BY_FILE.get(file_name), {})
+    schema = spec.get("schema")
+
+    return read_csv_snapshot(
+        BASE_PATH / file_name,
+        dtype=spec.get("dtype"),
+        transform=partial(apply_schema, schema=schema) if schema else None,
+        transform_key=schema_key(schema) if schema else None,
+    )
+
+
+def read_dataset(name: str) -> pd.DataFrame:
+    return read_dataset_file(DATASETS[name]["file"])
+
+
+class _LazyDataset:
+    """
+    Materialises a dataset on first attribute access and memoises it
+    on the loader instance.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, loader, owner=None):
+        if loader is None:
+            return self
+        return loader._load(self.name)
+
+    def __set__(self, loader, value):
+        loader._frames[self.name] = value
+
+
 class FiscalDataLoader:
+    revenue = _LazyDataset()
+    opex = _LazyDataset()
+    capex = _LazyDataset()
+    indicators = _LazyDataset()
+    ministry_summary = _LazyDataset()
+
     def __init__(self):
-        self.revenue = None
-        self.opex = None
-        self.capex = None
-        self.indicators = None
-        self.ministry_summary = None
+        self._frames = {}
+        self._locks = {name: threading.Lock() for name in DATASETS}
 
-    def load_all(self):
-        self.revenue = pd.read_csv(
-            BASE_PATH / "budget_2026_volume_1_revenue_v2.csv"
-            )
-        self.opex = pd.read_csv(
-            BASE_PATH / "BudgetCurrentExpenditure2026_v3.csv"
-        )
-        self.capex = pd.read_csv(
-            BASE_PATH / "BudgetCapitalExpenditure_vol3_v4.csv"
-        )
-        self.indicators = pd.read_csv(
-            BASE_PATH / "project_indicator_2026_v4.csv"
-        )
-        self.ministry_summary = pd.read_csv(
-            BASE_PATH / "master_ministry_fiscal_intelligence.csv"
-        )
+    def _load(self, name):
+        frame = self._frames.get(name)
+        if frame is not None:
+            return frame
+
+        # Per-dataset lock so concurrent first accesses parse once
+        with self._locks[name]:
+            if name not in self._frames:
+                self._frames[name] = read_dataset(name)
+            return self._frames[name]
+
+    def is_loaded(self, name):
+        return name in self._frames
+
+    def preload(self, names=None, parallel=True):
+        """
+        Loads the requested datasets (all of them by default) up front,
+        concurrently on a thread pool unless parallel is False.
+        """
+        names = list(DATASETS) if names is None else list(names)
+        unknown = [n for n in names if n not in DATASETS]
+        if unknown:
+            raise ValueError(f"Unknown dataset(s): {', '.join(unknown)}")
+
+        pending = [n for n in names if not self.is_loaded(n)]
+        if parallel and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                list(pool.map(self._load, pending))
+        else:
+            for name in pending:
+                self._load(name)
 
         return self
 
-    def load_ministry_summary(self):
-        self.ministry_summary = pd.read_csv(
-            BASE_PATH / "master_ministry_fiscal_intelligence.csv"
-        )
+    def load_all(self):
+        return self.preload()
 
-        return self
\ No newline at end of file
+    def load_ministry_summary(self):
+        return self.preload(["ministry_summary"])
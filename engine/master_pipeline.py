@@ -0,0 +1,464 @@
+import argparse
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from engine.loader import BASE_PATH, DATASETS, FiscalDataLoader
+from engine.schema import schema_key
+from engine.snapshot import SNAPSHOT_DIR_NAME
+
+# Builds master_ministry_fiscal_intelligence.csv from the opex, capex and
+# indicator line items.
+#
+# Stages 1-3 aggregate line items to one row per ministry. These only
+# depend on that ministry's own rows, so an incremental run reuses the
+# previous aggregates for ministries whose source rows did not change.
+# Stages 4-6 rank ministries against each other and always run on the
+# full (small) ministry table.
+
+MASTER_PATH = BASE_PATH / DATASETS["ministry_summary"]["file"]
+STATE_PATH = BASE_PATH / SNAPSHOT_DIR_NAME / "master_build_state.arrow"
+
+# Bump when the stage 1-3 aggregates change, so saved state from an older
+# build is discarded instead of reused
+STATE_FORMAT_VERSION = 1
+
+# Column order of the published master table
+MASTER_COLUMNS = [
+    "ministry", "opex_2024", "opex_2026", "opex_2025", "capex_2026",
+    "foreign_capex_actual_2024", "foreign_capex_actual_2025",
+    "foreign_capex_budget_2026", "foreign_capex_actual_pre_2024",
+    "gov_capex_actual_2024", "gov_capex_actual_2025", "gov_capex_budget_2026",
+    "gov_capex_actual_pre_2024", "capex_2025", "capex_2024",
+    "capex_ratio_budget_2026", "capex_ratio_budget_2025",
+    "capex_ratio_budget_2024", "opex_ratio_budget_2026",
+    "opex_ratio_budget_2025", "opex_ratio_budget_2024", "programme_count",
+    "indicator_outcome_count", "indicator_output_count", "agency_type",
+    "indicator_outcome_ratio", "indicator_output_ratio", "sector_count",
+    "spend_per_indicator", "spend_per_outcome", "capex_heavy",
+    "high_spend_low_outcome", "total_spend_2026", "indicator_count",
+    "indicator_outcome_strength", "indicator_coverage", "spend_intensity",
+    "efficiency_proxy", "efficiency_rank", "foreign_dependency",
+    "foreign_dependent", "spend_percentile", "high_spend", "very_high_spend",
+    "low_spend", "weak_outcomes", "strong_outcomes", "low_efficiency",
+    "high_efficiency", "capex_pressure", "foreign_risk",
+    "budget_pressure_flag", "performance_review_flag", "high_performer_flag",
+    "outcome_risk", "efficiency_risk", "capex_risk", "foreign_risk_num",
+    "indicator_risk", "fiscal_risk_score", "fiscal_risk_label",
+]
+
+OPEX_SUMS = {
+    "opex_2024": "actual_2024",
+    "opex_2025": "revised_2025",
+    "opex_2026": "budget_2026",
+}
+
+CAPEX_SUMS = {
+    "capex_2026": "budget_2026",
+    "foreign_capex_actual_2024": "foreign_actual_2024",
+    "foreign_capex_actual_2025": "foreign_actual_2025",
+    "foreign_capex_budget_2026": "foreing_actual_2026",
+    "foreign_capex_actual_pre_2024": "foreign_actual_pre_2024",
+    "gov_capex_actual_2024": "gov_actual_2024",
+    "gov_capex_actual_2025": "gov_actual_2025",
+    "gov_capex_budget_2026": "gov_actual_2026",
+    "gov_capex_actual_pre_2024": "gov_actual_pre_2024",
+}
+
+STRENGTH_LABELS = ["very weak", "weak", "moderate", "strong", "very strong"]
+QUINTILE_LABELS = ["very low", "low", "medium", "high", "very high"]
+COVERAGE_LABELS = ["very low", "low", "moderate", "high", "very high"]
+
+# Indicator count breakpoints for indicator_coverage
+COVERAGE_BINS = [-np.inf, 5, 15, 30, 60, np.inf]
+
+# Matches the published table, where 'high' coverage scores 0.5
+# and 'moderate' 0.25
+INDICATOR_RISK = {
+    "very low": 1.0,
+    "low": 0.75,
+    "high": 0.5,
+    "moderate": 0.25,
+    "very high": 0.0,
+}
+
+RISK_WEIGHTS = {
+    "outcome_risk": 0.30,
+    "efficiency_risk": 0.25,
+    "capex_risk": 0.20,
+    "indicator_risk": 0.15,
+    "foreign_risk_num": 0.10,
+}
+
+RISK_LABEL_BINS = [-np.inf, 30, 55, 75, np.inf]
+RISK_LABELS = ["strong", "stable", "watch", "high concern"]
+
+
+def _safe_divide(numerator, denominator):
+    return (numerator / denominator).replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
+
+def _ministry_groups(df):
+    return df.groupby(df["ministry"].astype(str), sort=True)
+
+
+# ---------------------------------------------------
+# 1-3. Per-ministry aggregation stages
+# ---------------------------------------------------
+
+def aggregate_opex(opex: pd.DataFrame) -> pd.DataFrame:
+    grouped = _ministry_groups(opex)
+    out = grouped[list(OPEX_SUMS.values())].sum()
+    out.columns = list(OPEX_SUMS)
+    out["programme_count"] = grouped["programme"].nunique().astype("int64")
+    return out
+
+
+def aggregate_capex(capex: pd.DataFrame) -> pd.DataFrame:
+    out = _ministry_groups(capex)[list(CAPEX_SUMS.values())].sum()
+    out.columns = list(CAPEX_SUMS)
+    return out.astype("float64")
+
+
+def aggregate_indicators(indicators: pd.DataFrame) -> pd.DataFrame:
+    grouped = _ministry_groups(indicators)
+    counts = pd.crosstab(
+        indicators["ministry"].astype(str), indicators["type"]
+    ).reindex(columns=["outcome", "output"], fill_value=0)
+
+    return pd.DataFrame({
+        "indicator_outcome_count": counts["outcome"].astype("float64"),
+        "indicator_output_count": counts["output"].astype("float64"),
+        "agency_type": grouped["agency_type"].first(),
+        "sector_count": grouped["sector"].nunique().astype("float64"),
+    })
+
+
+def combine_aggregates(opex_agg, capex_agg, indicator_agg) -> pd.DataFrame:
+    ministries = opex_agg.index.union(capex_agg.index).union(indicator_agg.index)
+    base = pd.concat(
+        [
+            opex_agg.reindex(ministries),
+            capex_agg.reindex(ministries),
+            indicator_agg.reindex(ministries),
+        ],
+        axis=1,
+    )
+    numeric = base.columns.drop("agency_type")
+    base[numeric] = base[numeric].fillna(0)
+    base["programme_count"] = base["programme_count"].astype("int64")
+    base.index.name = "ministry"
+    return base
+
+
+# ---------------------------------------------------
+# 4. Row-local ratios
+# ---------------------------------------------------
+
+def derive_ratios(base: pd.DataFrame) -> pd.DataFrame:
+    df = base.copy()
+
+    df["capex_2025"] = df["foreign_capex_actual_2025"] + df["gov_capex_actual_2025"]
+    df["capex_2024"] = df["foreign_capex_actual_2024"] + df["gov_capex_actual_2024"]
+
+    for year in ["2026", "2025", "2024"]:
+        total = df[f"capex_{year}"] + df[f"opex_{year}"]
+        df[f"capex_ratio_budget_{year}"] = df[f"capex_{year}"] / total
+        df[f"opex_ratio_budget_{year}"] = df[f"opex_{year}"] / total
+
+    df["indicator_count"] = df["indicator_outcome_count"] + df["indicator_output_count"]
+    df["indicator_outcome_ratio"] = _safe_divide(df["indicator_outcome_count"], df["indicator_count"])
+    df["indicator_output_ratio"] = _safe_divide(df["indicator_output_count"], df["indicator_count"])
+
+    df["total_spend_2026"] = df["capex_2026"] + df["opex_2026"]
+    df["spend_per_indicator"] = _safe_divide(df["total_spend_2026"], df["indicator_count"])
+    df["spend_per_outcome"] = _safe_divide(df["total_spend_2026"], df["indicator_outcome_count"])
+    df["efficiency_proxy"] = _safe_divide(df["indicator_outcome_count"], df["total_spend_2026"])
+    df["foreign_dependency"] = _safe_divide(df["foreign_capex_budget_2026"], df["capex_2026"])
+
+    df["indicator_outcome_strength"] = pd.cut(
+        df["indicator_outcome_ratio"],
+        bins=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        labels=STRENGTH_LABELS,
+        include_lowest=True,
+    ).astype(object)
+    df["indicator_coverage"] = pd.cut(
+        df["indicator_count"], bins=COVERAGE_BINS, labels=COVERAGE_LABELS
+    ).astype(object)
+
+    return df
+
+
+# ---------------------------------------------------
+# 5. Cross-ministry rankings and flags
+# ---------------------------------------------------
+
+def derive_rankings(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    df["spend_intensity"] = pd.qcut(
+        df["total_spend_2026"], q=5, labels=QUINTILE_LABELS
+    ).astype(object)
+    df["efficiency_rank"] = df["efficiency_proxy"].rank(ascending=False)
+    df["spend_percentile"] = df["total_spend_2026"].rank(pct=True)
+
+    spend_per_outcome = df["spend_per_outcome"]
+    efficiency_rank = df["efficiency_rank"]
+    outcome_ratio = df["indicator_outcome_ratio"]
+
+    df["capex_heavy"] = df["capex_ratio_budget_2026"] > 0.5
+    df["high_spend_low_outcome"] = (
+        (spend_per_outcome > spend_per_outcome.median()) & (outcome_ratio < 0.4)
+    )
+    df["foreign_dependent"] = df["foreign_dependency"] > 0.5
+    df["high_spend"] = df["spend_percentile"] >= 0.70
+    df["very_high_spend"] = df["spend_percentile"] > 0.85
+    df["low_spend"] = df["spend_percentile"] <= 0.25
+    df["weak_outcomes"] = (
+        (outcome_ratio < 0.25) | (spend_per_outcome >= spend_per_outcome.quantile(0.7))
+    )
+    df["strong_outcomes"] = (
+        (outcome_ratio > 0.55) & (spend_per_outcome <= spend_per_outcome.quantile(0.4))
+    )
+    df["low_efficiency"] = efficiency_rank >= efficiency_rank.quantile(0.7)
+    df["high_efficiency"] = efficiency_rank <= efficiency_rank.quantile(0.3)
+    df["capex_pressure"] = df["high_spend"] & (df["capex_ratio_budget_2026"] > 0.45)
+    df["foreign_risk"] = df["foreign_dependency"] > 0.4
+    df["budget_pressure_flag"] = (
+        (df["high_spend"] & df["low_efficiency"] & df["weak_outcomes"])
+        | (df["very_high_spend"] & (df["indicator_outcome_count"] <= 2))
+    )
+    df["performance_review_flag"] = (
+        (df["indicator_outcome_count"] > 0)
+        & (df["low_efficiency"] | (outcome_ratio < 0.35))
+    )
+    df["high_performer_flag"] = (
+        df["high_efficiency"] & df["strong_outcomes"] & ~df["very_high_spend"]
+    )
+
+    return df
+
+
+# ---------------------------------------------------
+# 6. Risk components and composite score
+# ---------------------------------------------------
+
+def derive_risk(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+
+    df["outcome_risk"] = 1 - df["indicator_outcome_ratio"]
+    df["efficiency_risk"] = df["efficiency_rank"] / df["efficiency_rank"].max()
+    df["capex_risk"] = df["capex_ratio_budget_2026"]
+    df["foreign_risk_num"] = df["foreign_dependency"]
+    df["indicator_risk"] = df["indicator_coverage"].map(INDICATOR_RISK)
+
+    df["fiscal_risk_score"] = 100 * sum(
+        df[column] * weight for column, weight in RISK_WEIGHTS.items()
+    )
+    df["fiscal_risk_label"] = pd.cut(
+        df["fiscal_risk_score"],
+        bins=RISK_LABEL_BINS,
+        labels=RISK_LABELS,
+        right=False,
+    ).astype(object)
+
+    return df
+
+
+# ---------------------------------------------------
+# Incremental state
+# ---------------------------------------------------
+
+def ministry_fingerprints(df: pd.DataFrame) -> pd.Series:
+    """
+    One content hash per ministry over that ministry's source rows.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    groups = _ministry_groups(df).indices
+
+    return pd.Series({
+        ministry: hashlib.md5(row_hashes[positions].tobytes()).hexdigest()
+        for ministry, positions in groups.items()
+    }, dtype=object)
+
+
+def state_key(sources) -> str:
+    """
+    Identifies the code and source schemas a saved state was built with;
+    state under any other key is ignored and every ministry rebuilt.
+    """
+    payload = json.dumps({
+        "format": STATE_FORMAT_VERSION,
+        "sources": {
+            name: {
+                "dtype": DATASETS[name].get("dtype"),
+                "schema": schema_key(DATASETS[name]["schema"]) if DATASETS[name].get("schema") else None,
+            }
+            for name in sources
+        },
+    }, sort_keys=True)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def _read_state(path: Path, key: str, columns):
+    try:
+        table = feather.read_table(path, memory_map=True)
+    except (OSError, ValueError):
+        return None
+
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"state_key", b"").decode() != key:
+        return None
+    state = table.to_pandas()
+    if "ministry" not in state.columns or not set(columns) <= set(state.columns):
+        return None
+    return state.set_index("ministry")
+
+
+def _write_state(path: Path, base: pd.DataFrame, fingerprints: pd.DataFrame, key: str):
+    state = pa.Table.from_pandas(base.join(fingerprints).reset_index(), preserve_index=False)
+    state = state.replace_schema_metadata({**(state.schema.metadata or {}), b"state_key": key.encode()})
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        feather.write_feather(state, path, compression="uncompressed")
+    except OSError:
+        pass
+
+
+class MasterTablePipeline:
+    SOURCES = ["opex", "capex", "indicators"]
+
+    def __init__(self, loader: FiscalDataLoader = None, state_path: Path = STATE_PATH):
+        self.loader = loader or FiscalDataLoader()
+        self.state_path = Path(state_path)
+        self.timings = {}
+        self.changed_ministries = []
+
+    @contextmanager
+    def _stage(self, name):
+        start = time.perf_counter()
+        yield
+        self.timings[name] = time.perf_counter() - start
+
+    def _changed(self, fingerprints: pd.DataFrame, state):
+        if state is None:
+            return list(fingerprints.index)
+
+        previous = state[fingerprints.columns].reindex(fingerprints.index)
+        changed = (previous != fingerprints).any(axis=1)
+        return list(fingerprints.index[changed])
+
+    def build_base(self, incremental=True) -> pd.DataFrame:
+        with self._stage("load"):
+            self.loader.preload(self.SOURCES)
+            sources = {name: getattr(self.loader, name) for name in self.SOURCES}
+
+        with self._stage("fingerprint"):
+            fingerprints = pd.DataFrame({
+                f"{name}_fingerprint": ministry_fingerprints(df)
+                for name, df in sources.items()
+            }).fillna("")
+            key = state_key(self.SOURCES)
+            state = _read_state(self.state_path, key, fingerprints.columns) if incremental else None
+            self.changed_ministries = self._changed(fingerprints, state)
+
+        fingerprints.index.name = "ministry"
+
+        if not self.changed_ministries:
+            return state.drop(columns=fingerprints.columns).reindex(fingerprints.index)
+
+        changed = set(self.changed_ministries)
+        if state is not None:
+            sources = {
+                name: df[df["ministry"].astype(str).isin(changed)]
+                for name, df in sources.items()
+            }
+
+        with self._stage("aggregate_opex"):
+            opex_agg = aggregate_opex(sources["opex"])
+        with self._stage("aggregate_capex"):
+            capex_agg = aggregate_capex(sources["capex"])
+        with self._stage("aggregate_indicators"):
+            indicator_agg = aggregate_indicators(sources["indicators"])
+
+        with self._stage("combine"):
+            fresh = combine_aggregates(opex_agg, capex_agg, indicator_agg)
+            if state is not None:
+                previous = state.drop(columns=fingerprints.columns)
+                keep = fingerprints.index.difference(fresh.index)
+                base = pd.concat([previous.reindex(keep), fresh]).sort_index()
+                base = base[fresh.columns]
+            else:
+                base = fresh
+            base = base.reindex(fingerprints.index)
+
+        _write_state(self.state_path, base, fingerprints, key)
+        return base
+
+    def run(self, incremental=True) -> pd.DataFrame:
+        self.timings = {}
+        base = self.build_base(incremental=incremental)
+
+        with self._stage("ratios"):
+            df = derive_ratios(base)
+        with self._stage("rankings"):
+            df = derive_rankings(df)
+        with self._stage("risk"):
+            df = derive_risk(df)
+
+        return df.reset_index()[MASTER_COLUMNS]
+
+    def timing_report(self) -> str:
+        total = sum(self.timings.values())
+        lines = [f"{stage:<22}{seconds * 1000:>10.2f} ms" for stage, seconds in self.timings.items()]
+        lines.append(f"{'total':<22}{total * 1000:>10.2f} ms")
+        return "\n".join(lines)
+
+
+def compare_tables(built: pd.DataFrame, published: pd.DataFrame) -> list:
+    """
+    Returns the master columns whose values differ between two tables.
+    """
+    built = built.set_index("ministry").sort_index()
+    published = published.set_index("ministry").sort_index()
+    different = []
+
+    for column in MASTER_COLUMNS[1:]:
+        a, b = built[column], published[column]
+        if a.dtype.kind in "fi" and b.dtype.kind in "fi":
+            same = np.isclose(a, b, rtol=1e-9, atol=1e-12).all()
+        else:
+            same = a.fillna("").astype(str).equals(b.fillna("").astype(str))
+        if not same:
+            different.append(column)
+
+    return different
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the master ministry fiscal intelligence table.")
+    parser.add_argument("--full", action="store_true", help="ignore saved state and rebuild every ministry")
+    parser.add_argument("--write", action="store_true", help=f"overwrite {MASTER_PATH.name}")
+    parser.add_argument("--output", type=Path, help="write the built table to this path instead")
+    args = parser.parse_args()
+
+    pipeline = MasterTablePipeline()
+    master = pipeline.run(incremental=not args.full)
+
+    print(f"Rebuilt {len(pipeline.changed_ministries)} of {len(master)} ministries")
+    print(pipeline.timing_report())
+
+    if args.write or args.output:
+        target = args.output or MASTER_PATH
+        master.to_csv(target, index=False)
+        print(f"Wrote {target}")
+    else:
+        different = compare_tables(master, pd.read_csv(MASTER_PATH))
+        print("Matches published table" if not different else f"Differs in: {', '.join(different)}")
@@ -0,0 +1,166 @@
+import hashlib
+import json
+
+import pandas as pd
+
+from app.utils.dictionary_column_names import OPEX_DICTIONARY, CAPEX_DICTIONARY
+
+# Declared column schemas for the line-item tables.
+# Column kinds come from the type prefix of each entry in the data
+# dictionaries ("float, ...", "categorical, ...", "date, ..."), so the
+# dictionary stays the single place where a column's meaning is described.
+# Free-text columns that actually hold a small set of repeated labels
+# (ministry, agency, programme ...) are promoted to categoricals below.
+
+DICTIONARY_KINDS = {
+    "float": "money",
+    "float64": "money",
+    "int64": "integer",
+    "bool": "bool",
+    "categorical": "category",
+    "date": "date",
+}
+
+# Repeated-label text columns stored as categoricals
+OPEX_LABEL_COLUMNS = [
+    "ministry",
+    "agency",
+    "programme",
+    "description",
+    "account_description",
+    "account_name",
+    "expenditure_type",
+    "tags",
+]
+
+CAPEX_LABEL_COLUMNS = [
+    "ministry",
+    "programme",
+    "foreign_donor",
+    "region",
+]
+
+# Source files use both 01-jan-2026 and 01-Jan-26
+DATE_FORMATS = ["%d-%b-%Y", "%d-%b-%y"]
+
+
+def _dictionary_kind(description: str) -> str:
+    prefix = description.split(",", 1)[0].strip().lower()
+    return DICTIONARY_KINDS.get(prefix, "text")
+
+
+def build_schema(dictionary: dict, label_columns=()) -> dict:
+    schema = {
+        column: _dictionary_kind(description)
+        for column, description in dictionary.items()
+    }
+    for column in label_columns:
+        schema[column] = "category"
+    return schema
+
+
+OPEX_SCHEMA = build_schema(OPEX_DICTIONARY, OPEX_LABEL_COLUMNS)
+CAPEX_SCHEMA = build_schema(CAPEX_DICTIONARY, CAPEX_LABEL_COLUMNS)
+
+
+# Dtype to parse each numeric kind as, so apply_schema has nothing to convert
+READ_DTYPES = {
+    "money": "float64",
+    "integer": "int64",
+}
+
+
+def read_dtypes(schema: dict) -> dict:
+    """read_csv dtypes for the schema's numeric columns."""
+    return {
+        column: READ_DTYPES[kind]
+        for column, kind in schema.items()
+        if kind in READ_DTYPES
+    }
+
+
+def schema_key(schema: dict) -> str:
+    return hashlib.md5(
+        json.dumps(schema, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    parsed = pd.to_datetime(series, format=DATE_FORMATS[0], errors="coerce")
+    for fmt in DATE_FORMATS[1:]:
+        missing = parsed.isna() & series.notna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(
+            series[missing], format=fmt, errors="coerce"
+        )
+    return parsed
+
+
+def apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Returns a copy of df with columns converted to their declared kinds.
+    Columns not in the schema, and "text" columns, are left untouched.
+    """
+    df = df.copy()
+
+    for column, kind in schema.items():
+        if column not in df.columns:
+            continue
+
+        if kind == "money":
+            df[column] = pd.to_numeric(df[column]).astype("float64")
+        elif kind == "integer":
+            df[column] = pd.to_numeric(df[column]).astype("int64")
+        elif kind == "bool":
+            df[column] = df[column].astype(bool)
+        elif kind == "category":
+            df[column] = df[column].astype("category")
+        elif kind == "date":
+            df[column] = _to_datetime(df[column])
+
+    return df
+
+
+# ---------------------------------------------------
+# Memory report
+# ---------------------------------------------------
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-column deep memory usage before and after a schema is applied,
+    with a TOTAL row and bytes per row.
+    """
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_before": before.memory_usage(deep=True, index=False),
+        "bytes_after": after.memory_usage(deep=True, index=False),
+    })
+
+    report.loc["TOTAL"] = [
+        "", "", report["bytes_before"].sum(), report["bytes_after"].sum()
+    ]
+    report["reduction"] = 1 - report["bytes_after"] / report["bytes_before"]
+
+    rows = max(len(before), 1)
+    report.attrs["bytes_per_row_before"] = report.loc["TOTAL", "bytes_before"] / rows
+    report.attrs["bytes_per_row_after"] = report.loc["TOTAL", "bytes_after"] / rows
+
+    return report.sort_values("bytes_before", ascending=False)
+
+
+if __name__ == "__main__":
+    from engine.loader import BASE_PATH, DATASETS
+
+    for name, schema in [("opex", OPEX_SCHEMA), ("capex", CAPEX_SCHEMA)]:
+        spec = DATASETS[name]
+        raw = pd.read_csv(BASE_PATH / spec["file"], dtype=spec["dtype"])
+        report = memory_report(raw, apply_schema(raw, schema))
+
+        print(f"\n{name.upper()} ({len(raw)} rows)")
+        print(report.to_string())
+        print(
+            f"bytes/row: {report.attrs['bytes_per_row_before']:,.0f} -> "
+            f"{report.attrs['bytes_per_row_after']:,.0f}"
+        )
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+# Columnar snapshot layer for the source CSVs.
+# Each CSV is parsed once and written next to the data as an uncompressed
+# Arrow IPC (feather v2) file, so later loads are a memory-mapped read
+# instead of a full CSV parse. Snapshots are keyed on the source file's
+# size, mtime and content hash plus the read options used to build them.
+
+SNAPSHOT_DIR_NAME = ".snapshots"
+
+# Bump when the on-disk snapshot layout changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def content_hash(path: Path) -> str:
+    hash_md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+
+def file_fingerprint(path: Path) -> dict:
+    stat = Path(path).stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "md5": content_hash(path),
+    }
+
+
+def _options_key(read_options: dict) -> str:
+    payload = json.dumps(
+        {"format": SNAPSHOT_FORMAT_VERSION, "options": read_options},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def _snapshot_paths(csv_path: Path, snapshot_dir: Path):
+    stem = csv_path.stem
+    return snapshot_dir / f"{stem}.arrow", snapshot_dir / f"{stem}.json"
+
+
+def _read_meta(meta_path: Path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _atomic_write_json(path: Path, payload: dict):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+
+
+def _is_fresh(csv_path: Path, meta: dict, options_key: str, snapshot_path: Path):
+    """
+    Cheap check first (size + mtime), content hash only when the
+    stat data moved. A touched-but-identical file re-stamps the meta
+    instead of forcing a rebuild.
+    """
+    if meta is None or meta.get("options") != options_key:
+        return False
+    if not snapshot_path.exists():
+        return False
+
+    stat = csv_path.stat()
+    source = meta.get("source", {})
+
+    if stat.st_size != source.get("size"):
+        return False
+    if stat.st_mtime_ns == source.get("mtime_ns"):
+        return True
+
+    if content_hash(csv_path) != source.get("md5"):
+        return False
+
+    meta["source"]["mtime_ns"] = stat.st_mtime_ns
+    try:
+        _atomic_write_json(snapshot_path.with_suffix(".json"), meta)
+    except OSError:
+        pass
+    return True
+
+
+def _write_snapshot(df: pd.DataFrame, csv_path: Path, snapshot_path: Path,
+                    meta_path: Path, options_key: str):
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        feather.write_feather(df, tmp, compression="uncompressed")
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, snapshot_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+    _atomic_write_json(meta_path, {
+        "options": options_key,
+        "source": file_fingerprint(csv_path),
+        "rows": len(df),
+    })
+
+
+def read_csv_snapshot(csv_path, snapshot_dir=None, transform=None,
+                      transform_key=None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Drop-in replacement for pd.read_csv that serves a memory-mapped
+    Arrow snapshot when one exists for the current version of the file.
+
+    transform is applied to the freshly parsed frame before it is
+    snapshotted; transform_key must change whenever its output would.
+    If the snapshot directory is not writable the parsed frame is
+    returned as-is.
+    """
+    csv_path = Path(csv_path)
+    snapshot_dir = (
+        Path(snapshot_dir) if snapshot_dir
+        else csv_path.parent / SNAPSHOT_DIR_NAME
+    )
+    snapshot_path, meta_path = _snapshot_paths(csv_path, snapshot_dir)
+    options_key = _options_key(
+        {"read_csv": read_csv_kwargs, "transform": transform_key}
+    )
+
+    if _is_fresh(csv_path, _read_meta(meta_path), options_key, snapshot_path):
+        try:
+            return feather.read_table(snapshot_path, memory_map=True).to_pandas()
+        except (OSError, ValueError):
+            pass
+
+    df = pd.read_csv(csv_path, **read_csv_kwargs)
+    if transform is not None:
+        df = transform(df)
+
+    try:
+        _write_snapshot(df, csv_path, snapshot_path, meta_path, options_key)
+    except OSError:
+        pass
+
+    return df
@@ -2,20 +2,28 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from app.utils.load_csv import load_csv, get_file_hash
-from engine.fiscal_core.ministry_review.ministry_intelligence_engine import build_ministry_profile
-from engine.fiscal_core.ministry_review.cabinet_framing_engine import generate_executive_headline
+from engine.fiscal_core.ministry_index import ministry_row
+from engine.fiscal_core.ministry_review.cabinet_framing_engine import ministry_executive_headline
 from app.ui.format_helpers import *
 from app.ui.graph_objects_config import STABILITY_COLOR
 from app.ui.commentary.fiscal_positioning import get_tooltip
-from engine.fiscal_core.ministry_review.priority_signal_engine import build_priority_signals
+from app.ui.review_sections import render_review_stage
+from engine.fiscal_core.ministry_review.priority_signal_engine import ministry_priority_signals
 from agents.fiscal_analyst_agent_ministry import generate_fiscal_analysis
 from agents.expenditure_review_agent_ministry import generate_expenditure_review
 from agents.cabinet_briefing_agent_ministry import generate_cabinet_briefing
+from agents.ministry_review_pipeline import generate_full_review
+from app.utils.dag import RunCache
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import threading
 
 from engine.fiscal_core.benchmark_engine import BenchmarkEngine
 
 st.set_page_config(layout="wide")
 
+# Ministries whose full-review stage outputs are kept per session
+REVIEW_CACHE_RUNS = 8
+
 # --------------------------------------------------
 # INITIAL SESSION SETUP
 # --------------------------------------------------
@@ -27,6 +35,9 @@ if 'cabinet_briefing_output' not in st.session_state:
     st.session_state.cabinet_briefing_output = None
 if 'df' not in st.session_state:
     st.session_state.df = None
+if 'review_stage_cache' not in st.session_state:
+    # Stage outputs per (data_hash, ministry), most recent reviews only
+    st.session_state.review_stage_cache = RunCache(max_runs=REVIEW_CACHE_RUNS)
 
 # --------------------------------------------------
 # INSTITUTIONAL HEADER
@@ -66,10 +77,9 @@ st.markdown("---")
 # EXECUTIVE HEADLINE (Rule-Based Placeholder)
 # --------------------------------------------------
 
-ministry_data = df_summary[df_summary["ministry"] == selected_ministry].iloc[0]
+ministry_data = ministry_row(df_summary, selected_ministry)
 
-profile = build_ministry_profile(df_summary, selected_ministry)
-framing = generate_executive_headline(profile)
+framing = ministry_executive_headline(df_summary, selected_ministry)
 
 test_benchmark_engine = BenchmarkEngine(df_summary)
 # --------------------------------------------------
@@ -119,7 +129,7 @@ with col3:
 
 st.divider()
 st.markdown("### Prirority Signals ###")
-signals = build_priority_signals(profile)
+signals = ministry_priority_signals(df_summary, selected_ministry)
 
 col1, col2 = st.columns(2)
 
@@ -160,7 +170,7 @@ for i, signal in enumerate(signals):
 
 st.divider()
 st.markdown("## Structured Fiscal Profile ##")
-row = df_summary[df_summary["ministry"] == selected_ministry].iloc[0]
+row = ministry_row(df_summary, selected_ministry)
 opex_2024 = row["opex_2024"]
 opex_2025 = row["opex_2025"]
 opex_2026 = row["opex_2026"]
@@ -279,7 +289,7 @@ for i, row in viz_df.iterrows():
         )
     )
 
-selected = viz_df[viz_df["ministry"] == selected_ministry].iloc[0]
+selected = ministry_row(viz_df, selected_ministry)
 
 fig.add_trace(
     go.Scatter(
@@ -358,65 +368,94 @@ st.plotly_chart(fig, width='stretch')
 
 st.divider()
 
+# --------------------------------------------------
+# FULL REVIEW (fiscal analysis + expenditure review in parallel,
+# then the cabinet briefing)
+# --------------------------------------------------
+
+REVIEW_OUTPUT_STATE = {
+    "fiscal_analysis": "fiscal_analysis_output",
+    "expenditure_review": "review_output",
+    "cabinet_briefing": "cabinet_briefing_output",
+}
+REVIEW_STAGE_LABELS = {
+    "fiscal_analysis": "Fiscal analysis",
+    "expenditure_review": "Expenditure review",
+    "cabinet_briefing": "Cabinet briefing",
+}
+
+if st.button("Generate Full Review"):
+
+    row = ministry_row(df_summary, selected_ministry)
+    script_ctx = get_script_run_ctx()
+
+    with st.status("Generating full review...", expanded=True) as status:
+        # One slot per stage: the streamed draft, then a ready line
+        previews = {stage: st.empty() for stage in REVIEW_OUTPUT_STATE}
+        try:
+            for stage, output in generate_full_review(
+                st.session_state.df,
+                df_summary_hash,
+                row,
+                signals,
+                cache=st.session_state.review_stage_cache,
+                thread_init=lambda: add_script_run_ctx(
+                    threading.current_thread(), script_ctx
+                ),
+                on_partial=lambda stage, fields: render_review_stage(
+                    previews[stage].container(), stage, fields
+                ),
+            ):
+                st.session_state[REVIEW_OUTPUT_STATE[stage]] = output
+                previews[stage].write(f"✅ {REVIEW_STAGE_LABELS[stage]} ready")
+            status.update(label="Full review ready", state="complete")
+        except Exception as e:
+            status.update(label="Full review incomplete", state="error")
+            st.error(str(e))
+
+st.divider()
+
 
 if (st.button("Generate Fiscal Analysis")
     and 
     st.session_state.fiscal_analysis_output == None):
 
-    row = df_summary[df_summary["ministry"] == selected_ministry].iloc[0]
+    row = ministry_row(df_summary, selected_ministry)
+    preview = st.empty()
 
     fiscal_analysis = generate_fiscal_analysis(st.session_state.df,
-        df_summary_hash, row, signals)
+        df_summary_hash, row, signals,
+        on_partial=lambda fields: render_review_stage(
+            preview.container(), "fiscal_analysis", fields))
     st.session_state.fiscal_analysis_output = fiscal_analysis
+    preview.empty()
     
 if st.session_state.fiscal_analysis_output:
-    st.markdown("### Fiscal Interpretation")
-    st.write(st.session_state.fiscal_analysis_output["analysis"])
-
-    st.markdown("### Fiscal Opportunit")
-    st.write(st.session_state.fiscal_analysis_output["fiscal_opportunity"])
-
-    st.markdown("### Key Risk Driver")
-    st.write(st.session_state.fiscal_analysis_output["key_risk_driver"])
-
-    st.markdown("### Oversight Priority")
-    st.write(st.session_state.fiscal_analysis_output["oversight_priority"])
-
-    st.markdown("### Compatative Position")
-    st.write(st.session_state.fiscal_analysis_output["comparative_position"])
-
-    st.markdown("### Recommended Action")
-    st.write(st.session_state.fiscal_analysis_output["recommended_action"])
+    render_review_stage(st, "fiscal_analysis",
+                        st.session_state.fiscal_analysis_output)
 
 st.divider()
 
 if st.button("Generate Expenditure Review"):
 
-    row = df_summary[df_summary["ministry"] == selected_ministry].iloc[0]
+    row = ministry_row(df_summary, selected_ministry)
+    preview = st.empty()
 
-    review_output = generate_expenditure_review(df_summary_hash, row, signals)
+    review_output = generate_expenditure_review(df_summary_hash, row, signals,
+        on_partial=lambda fields: render_review_stage(
+            preview.container(), "expenditure_review", fields))
     st.session_state.review_output = review_output
+    preview.empty()
 
 if st.session_state.review_output:
-    st.markdown("### Expenditure Review Assessment")
-
-    st.markdown("**Review Rationale**")
-    st.write(st.session_state.review_output["review_rationale"])
-
-    st.markdown("**Priority Review Area**")
-    st.write(st.session_state.review_output["priority_review_area"])
-
-    st.markdown("**Efficiency Opportunity**")
-    st.write(st.session_state.review_output["efficiency_opportunity"])
-
-    st.markdown("**Recommended Review Action**")
-    st.write(st.session_state.review_output["recommended_review_action"])
+    render_review_stage(st, "expenditure_review",
+                        st.session_state.review_output)
 
 st.divider()
 
 if st.button("Generate Cabinet Briefing"):
 
-    row = df_summary[df_summary["ministry"] == selected_ministry].iloc[0]
+    row = ministry_row(df_summary, selected_ministry)
     if (
         not st.session_state.fiscal_analysis_output
         ) and (
@@ -424,23 +463,19 @@ if st.button("Generate Cabinet Briefing"):
             ):
         st.error("Generate the above two reports first")
     else:
+        preview = st.empty()
         briefing = generate_cabinet_briefing(
             df_summary_hash,
             row,
             signals,
             st.session_state.fiscal_analysis_output,
-            st.session_state.review_output
+            st.session_state.review_output,
+            on_partial=lambda fields: render_review_stage(
+                preview.container(), "cabinet_briefing", fields)
         )
         st.session_state.cabinet_briefing_output = briefing
+        preview.empty()
 
 if st.session_state.cabinet_briefing_output:        
-    st.markdown("### Cabinet Briefing")
-    st.markdown("**Situation Summary**")
-    st.write(st.session_state.cabinet_briefing_output["situation_summary"])
-    st.markdown("**Key Issue**")
-    st.write(st.session_state.cabinet_briefing_output["key_issue"])
-    st.markdown("**Fiscal Implication**")
-    st.write(st.session_state.cabinet_briefing_output["fiscal_implication"])
-    st.markdown("**Recommended Action**")
-    st.write(st.session_state.cabinet_briefing_output["recommended_action"])
-    
+    render_review_stage(st, "cabinet_briefing",
+                        st.session_state.cabinet_briefing_output)
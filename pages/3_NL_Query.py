@@ -1,32 +1,26 @@
 import streamlit as st
-import asyncio
+import time
 from agents.fiscal_agent_chat_v2 import get_llm_instance
-from app.utils.load_csv import load_csv
 from app.utils.system_prompt import system_prompt
 
-if 'df' not in st.session_state:
-    st.session_state.df = None
-if 'data_loaded' not in st.session_state:
-    st.session_state.data_loaded = False
-if 'test_data' not in st.session_state:
-    st.session_state.test_data = 0
-
-df_summary = load_csv("master_ministry_fiscal_intelligence.csv")
-st.session_state.df = df_summary.copy()
-
+# Queries run against the persistent DuckDB catalog (engine/catalog.py)
 llm_assistant = get_llm_instance(system_prompt=system_prompt)
 
-if "df" in st.session_state and not(st.session_state.data_loaded):
-    llm_assistant.ingest_dataframe(st.session_state.df)
-    st.session_state.data_loaded = True
-
 input_message = st.chat_input("Ask a question about the data")
 
 if input_message:
     with st.chat_message("assistant"):
-        # Since 'ask' is async, we use asyncio to run it
-        llm_assistant.test_db()
-        st.session_state.test_data += 1
-        print(st.session_state.test_data)
-        response = asyncio.run(llm_assistant.ask(input_message))
-        st.write(response)
\ No newline at end of file
+        # The question runs on the model's background event loop. Waiting
+        # in short steps with an element update lets Streamlit stop this
+        # run (new message, page change, closed tab); the question is then
+        # cancelled instead of left running.
+        future = llm_assistant.submit(input_message)
+        status = st.empty()
+        try:
+            while not future.done():
+                status.caption("Querying the budget data…")
+                time.sleep(0.1)
+            status.empty()
+            st.write(future.result())
+        finally:
+            future.cancel()
\ No newline at end of file
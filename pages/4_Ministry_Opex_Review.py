@@ -54,8 +54,10 @@ st.markdown("---")
 # --------------------------------------------------
 
 
+# Served from the opex cube for this file version
 profile = build_ministry_profile(st.session_state.df, 
-                                 selected_ministry)
+                                 selected_ministry,
+                                 version=df_opex_hash)
 
 st.html("""
 <div style="
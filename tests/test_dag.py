@@ -0,0 +1,74 @@
+import pytest
+
+from app.utils.dag import DagPipeline, Node, PipelineError, RunCache
+
+
+def test_outputs_flow_to_dependents():
+    pipeline = DagPipeline([
+        Node("total", lambda values: sum(values), args=("values",)),
+        Node("double", lambda total: total * 2, deps=("total",)),
+        Node("label", lambda amount: f"{amount}", deps=("double",),
+             rename={"double": "amount"}),
+    ])
+    assert pipeline.run({"values": [1, 2, 3]}) == {
+        "total": 6, "double": 12, "label": "12",
+    }
+
+
+def test_failure_skips_dependents_and_is_chained():
+    called = []
+
+    def boom():
+        raise KeyError("missing column")
+
+    pipeline = DagPipeline([
+        Node("fails", boom),
+        Node("after", lambda fails: called.append("after"), deps=("fails",)),
+        Node("independent", lambda: "ok"),
+    ])
+
+    finished = []
+    with pytest.raises(PipelineError) as raised:
+        for name, output in pipeline.stream({}):
+            finished.append((name, output))
+
+    error = raised.value
+    # Independent nodes still finish and are streamed before the error
+    assert finished == [("independent", "ok")]
+    assert called == []
+    assert isinstance(error.failures["fails"], KeyError)
+    assert error.failures["after"] is None
+    assert "fails: KeyError('missing column')" in str(error)
+    assert "after: skipped" in str(error)
+    assert error.__cause__ is error.failures["fails"]
+
+
+def test_cached_outputs_are_reused():
+    calls = []
+    pipeline = DagPipeline([
+        Node("a", lambda: calls.append("a") or 1),
+        Node("b", lambda a: calls.append("b") or a + 1, deps=("a",)),
+    ])
+    cache = {}
+    pipeline.run({}, cache=cache, run_key="run")
+    assert pipeline.run({}, cache=cache, run_key="run") == {"a": 1, "b": 2}
+    assert calls == ["a", "b"]
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    with pytest.raises(ValueError, match="Cycle"):
+        DagPipeline([Node("a", len, deps=("b",)), Node("b", len, deps=("a",))])
+    with pytest.raises(ValueError, match="unknown"):
+        DagPipeline([Node("a", len, deps=("missing",))])
+
+
+def test_run_cache_keeps_most_recent_runs():
+    cache = RunCache(max_runs=2)
+    cache[("m1", "a")] = 1
+    cache[("m2", "a")] = 2
+    assert cache[("m1", "a")] == 1  # m1 is now the most recent
+    cache[("m3", "a")] = 3
+
+    assert ("m1", "a") in cache
+    assert ("m2", "a") not in cache
+    assert len(cache) == 2
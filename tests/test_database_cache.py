@@ -0,0 +1,154 @@
+import threading
+import time
+
+import pytest
+
+from app.utils.database_cache import CacheClient
+
+# CacheClient against an in-process stand-in for a psycopg2 connection.
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def execute(self, sql, params=()):
+        self.conn.statements += 1
+        if self.conn.block is not None:
+            self.conn.block.wait()
+        if self.conn.fail:
+            raise RuntimeError("statement failed")
+
+        params = list(params)
+        if sql.startswith("SELECT 1"):
+            self._rows = [(1,)]
+        elif sql.startswith("SELECT"):
+            self._rows = [(k, self.conn.store[k]) for k in params if k in self.conn.store]
+        elif sql.startswith("INSERT"):
+            for key, response in zip(params[::2], params[1::2]):
+                self.conn.store[key] = response.adapted
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, store):
+        self.store = store
+        self.closed = 0
+        self.fail = False
+        self.block = None
+        self.statements = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.store = {}
+        self.connections = []
+        self.down = False
+
+    def connect(self):
+        if self.down:
+            raise OSError("connection refused")
+        conn = FakeConnection(self.store)
+        self.connections.append(conn)
+        return conn
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase()
+
+
+def test_save_and_check_round_trip(db):
+    client = CacheClient(connect=db.connect)
+
+    assert client.save_many({"a": {"text": "one"}, "b": {"text": "two"}})
+    assert client.check_many(["a", "b", "missing"]) == {
+        "a": {"text": "one"},
+        "b": {"text": "two"},
+    }
+    assert client.check("missing") is None
+    # The connection went back to the pool and was reused
+    assert len(db.connections) == 1
+
+
+def test_exhausted_pool_is_a_miss(db):
+    client = CacheClient(connect=db.connect, max_size=1, acquire_timeout=0.05)
+    client.save("a", {"text": "one"})
+
+    # Hold the only slot with a statement that does not return
+    db.connections[0].block = threading.Event()
+    holder = threading.Thread(target=client.check, args=("a",))
+    holder.start()
+    while db.connections[0].statements < 2:
+        time.sleep(0.005)
+
+    started = time.monotonic()
+    assert client.check_many(["a"]) == {}
+    assert not client.save("b", {"text": "two"})
+    assert time.monotonic() - started < 1.0
+
+    db.connections[0].block.set()
+    holder.join()
+    assert client.check("a") == {"text": "one"}
+
+
+def test_connection_failure_is_a_miss_with_cooldown(db):
+    client = CacheClient(connect=db.connect, failure_cooldown=0.2)
+    db.down = True
+
+    assert client.check("a") is None
+    assert not client.available
+
+    # No reconnect attempts during the cooldown, even once the database is back
+    db.down = False
+    assert not client.save("a", {"text": "one"})
+    assert db.connections == []
+
+    time.sleep(0.25)
+    assert client.available
+    assert client.save("a", {"text": "one"})
+    assert client.check("a") == {"text": "one"}
+
+
+def test_failed_statement_is_a_miss_and_keeps_the_connection(db):
+    client = CacheClient(connect=db.connect)
+    client.save("a", {"text": "one"})
+
+    db.connections[0].fail = True
+    assert client.check("a") is None
+    # A statement error on an open connection does not trip the cooldown
+    assert client.available
+
+    db.connections[0].fail = False
+    assert client.check("a") == {"text": "one"}
+    assert len(db.connections) == 1
+
+
+def test_closed_idle_connection_is_replaced(db):
+    client = CacheClient(connect=db.connect)
+    client.save("a", {"text": "one"})
+
+    db.connections[0].closed = 1
+    assert client.check("a") == {"text": "one"}
+    assert len(db.connections) == 2
@@ -0,0 +1,36 @@
+import pytest
+
+from app.utils.partial_json import parse_partial_json
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("", None),
+    ("{", {}),
+    ('{"analysis": "Spend is hi', {"analysis": "Spend is hi"}),
+    # A key whose value has not started yet is left out
+    ('{"a": "done", "b"', {"a": "done"}),
+    ('{"a": "done", "b" ', {"a": "done"}),
+    ('{"a": "done", "b":', {"a": "done"}),
+    # Numbers and literals may still grow
+    ('{"a": 1', {}),
+    ('{"a": 12, "b": fa', {"a": 12}),
+    ('{"a": [1, 2', {"a": [1]}),
+    ('{"a": {"b": "c', {"a": {"b": "c"}}),
+    ('{"a": "line\\nbreak', {"a": "line\nbreak"}),
+    ('{"a": true, "b": null}', {"a": True, "b": None}),
+])
+def test_prefixes(text, expected):
+    assert parse_partial_json(text) == expected
+
+
+def test_complete_document_matches_json():
+    text = '{"analysis": "ok", "scores": [1, 2.5], "flags": {"high": false}}'
+    assert parse_partial_json(text) == {
+        "analysis": "ok", "scores": [1, 2.5], "flags": {"high": False},
+    }
+
+
+@pytest.mark.parametrize("text", ['{"a": 1 x}', "[1 2]", "{1: 2}", '{"a" 1}'])
+def test_malformed_input_raises(text):
+    with pytest.raises(ValueError):
+        parse_partial_json(text)
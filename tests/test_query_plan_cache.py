@@ -0,0 +1,73 @@
+import pytest
+
+from app.utils.query_plan_cache import QueryPlanCache
+
+LONG_TOP = ("List the top ministries by capital budget execution rate "
+            "for foreign funded projects in each region")
+LONG_BOTTOM = LONG_TOP.replace("top", "bottom")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = QueryPlanCache(tmp_path / "plans.sqlite")
+    cache.store(LONG_TOP, "v1", ["SELECT 'top'"], "h-top", "TOP answer")
+    cache.store("Which ministry has the highest capex but lowest opex?", "v1",
+                ["SELECT 'capex'"], "h-capex", "CAPEX answer")
+    cache.store("What is the total capex for region 4 in 2026?", "v1",
+                ["SELECT 'region'"], "h-region", "REGION answer")
+    return cache
+
+
+@pytest.mark.parametrize("question, answer", [
+    ("Which ministry has the highest capex but lowest opex?", "CAPEX answer"),
+    # Case, punctuation, stopwords and inflection only
+    ("which ministries have highest capex but the lowest opex", "CAPEX answer"),
+    ("list the top ministry by capital budget execution rates "
+     "for foreign-funded project in each region", "TOP answer"),
+    ("total capex for Region 4 in 2026", "REGION answer"),
+])
+def test_same_question_reuses_the_answer(cache, question, answer):
+    plan = cache.match(question, "v1")
+    assert plan is not None and plan.answer == answer
+
+
+@pytest.mark.parametrize("question", [
+    # One antonym in a long question
+    LONG_BOTTOM,
+    LONG_TOP.replace("foreign funded", "locally funded"),
+    # Same words, swapped roles
+    "Which ministry has the lowest capex but highest opex?",
+    "Which ministry has the highest capex but not lowest opex?",
+    # Different numbers
+    "What is the total capex for region 5 in 2026?",
+    "What is the total capex for region 4 in 2025?",
+    # Related but not the same question
+    "Which ministry has the highest capex?",
+])
+def test_different_question_gets_no_answer(cache, question):
+    assert cache.match(question, "v1") is None
+
+
+def test_antonym_question_gets_the_sql_as_a_hint_only(cache):
+    assert cache.match(LONG_BOTTOM, "v1") is None
+    hints = cache.hints(LONG_BOTTOM, "v1")
+    assert [plan.sql for plan in hints][:1] == [["SELECT 'top'"]]
+
+
+def test_plans_are_scoped_to_the_data_version(cache, tmp_path):
+    assert cache.match(LONG_TOP, "v2") is None
+    assert len(cache) == 0
+
+    # Stored plans persist across instances for the same version
+    cache.store(LONG_TOP, "v2", ["SELECT 2"], "h2", "V2 answer")
+    reopened = QueryPlanCache(tmp_path / "plans.sqlite")
+    assert reopened.match(LONG_TOP, "v2").answer == "V2 answer"
+    assert reopened.match(LONG_TOP, "v1") is None
+
+
+def test_record_hit_is_persisted(cache, tmp_path):
+    plan = cache.match(LONG_TOP, "v1")
+    cache.record_hit(plan)
+
+    reopened = QueryPlanCache(tmp_path / "plans.sqlite")
+    assert reopened.match(LONG_TOP, "v1").hits == 1
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from app.utils import response_cache
+from app.utils.response_cache import DiskTier, MemoryTier, TieredCache
+
+
+class FailingTier:
+    name = "postgres"
+
+    def get_many(self, keys):
+        raise OSError("unreachable")
+
+    def set_many(self, items):
+        raise OSError("unreachable")
+
+
+@pytest.fixture
+def disk(tmp_path):
+    return DiskTier(tmp_path / "llm.sqlite")
+
+
+def test_write_behind_reaches_lower_tiers(disk):
+    cache = TieredCache([MemoryTier(), disk])
+    cache.set("k", {"text": "one"})
+
+    # Memory is written inline
+    assert cache.lookup("k") == ({"text": "one"}, "memory")
+
+    cache.flush()
+    assert disk.get_many(["k"])["k"]["value"] == {"text": "one"}
+
+
+def test_lower_tier_hit_is_promoted(disk):
+    writer = TieredCache([MemoryTier(), disk])
+    writer.set("k", {"text": "one"})
+    writer.flush()
+
+    # A fresh process: empty memory, same disk
+    cache = TieredCache([MemoryTier(), disk])
+    assert cache.lookup("k") == ({"text": "one"}, "disk")
+    assert cache.lookup("k") == ({"text": "one"}, "memory")
+    assert cache.stats_snapshot()["disk"]["hits"] == 1
+
+
+def test_expired_entry_is_a_miss(disk, monkeypatch):
+    cache = TieredCache([MemoryTier(), disk])
+    cache.set("short", {"text": "one"}, ttl=60)
+    cache.set("forever", {"text": "two"})
+    cache.flush()
+
+    now = time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 61)
+
+    assert cache.lookup("short") == (None, None)
+    assert cache.lookup("forever") == ({"text": "two"}, "memory")
+    # Expired in every tier, not just memory
+    assert cache.stats_snapshot()["disk"]["misses"] == 1
+
+
+def test_failing_tier_degrades_to_a_miss(disk):
+    cache = TieredCache([MemoryTier(), FailingTier()])
+    cache.set("k", {"text": "one"})
+    cache.flush()
+
+    assert cache.lookup("other") == (None, None)
+    stats = cache.stats_snapshot()["postgres"]
+    assert stats["errors"] == 2  # the background write and the read
+
+
+def test_memory_tier_is_bounded():
+    tier = MemoryTier(max_entries=2)
+    tier.set_many({"a": 1, "b": 2})
+    tier.get_many(["a"])
+    tier.set_many({"c": 3})
+
+    # b was the least recently used
+    assert set(tier.get_many(["a", "b", "c"])) == {"a", "c"}
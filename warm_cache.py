@@ -0,0 +1,92 @@
+"""
+Pre-generates the ministry review (fiscal analysis, expenditure review and
+cabinet briefing) for every ministry into the LLM response cache, so
+interactive requests on the Ministry Review page are cache hits.
+
+Run once after a data refresh:
+
+    python warm_cache.py [--concurrency 4] [--ministry NAME ...]
+
+Every ministry goes through the same pipeline as the page, so the cache
+keys are the page's own content-addressed keys (prompt, model, schema
+and data). The job is resumable: each stage looks up its exact request
+first, so stages cached by an earlier run cost a cache read, not an LLM
+call, and a prompt or model change is regenerated rather than skipped.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from engine.loader import read_dataset_file
+from engine.fiscal_core.ministry_index import ministry_row
+from engine.fiscal_core.ministry_review.priority_signal_engine import ministry_priority_signals
+from app.utils.load_csv import get_file_hash
+from app.utils.response_cache import get_response_cache
+from agents.ministry_review_pipeline import generate_full_review
+
+MASTER_FILE = "master_ministry_fiscal_intelligence.csv"
+
+def warm_ministry(df, data_hash, ministry):
+    started = time.perf_counter()
+    row = ministry_row(df, ministry)
+    if row is None:
+        raise ValueError(f"Ministry '{ministry}' not found.")
+    ministry = row["ministry"]
+
+    signals = ministry_priority_signals(df, ministry)
+
+    # Same inputs as pages/2_Ministry_Review.py, so the keys match
+    for _ in generate_full_review(df, data_hash, row, signals):
+        pass
+
+    return "warmed", time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the LLM response cache for every ministry.")
+    parser.add_argument("--concurrency", type=int, default=4, help="ministries reviewed at once")
+    parser.add_argument("--ministry", action="append", help="only warm this ministry (repeatable)")
+    args = parser.parse_args()
+
+    df = read_dataset_file(MASTER_FILE)
+    data_hash = get_file_hash(MASTER_FILE)
+    ministries = args.ministry or sorted(df["ministry"].unique())
+
+    print(f"Warming {len(ministries)} ministries (data {data_hash[:12]}, "
+          f"concurrency {args.concurrency})")
+
+    started = time.perf_counter()
+    outcomes = {"warmed": [], "failed": []}
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = {
+            pool.submit(warm_ministry, df, data_hash, ministry): ministry
+            for ministry in ministries
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            ministry = futures[future]
+            try:
+                outcome, elapsed = future.result()
+            except Exception as e:
+                outcome, elapsed = "failed", 0.0
+                print(f"  ! {ministry}: {e}")
+            outcomes[outcome].append(elapsed)
+            print(f"[{done:>3}/{len(ministries)}] {outcome:<7} {elapsed:6.1f}s  {ministry}")
+
+    # Let write-behind reach the disk and Postgres tiers before exiting
+    get_response_cache().flush()
+
+    total = time.perf_counter() - started
+    warmed = sorted(outcomes["warmed"])
+    print(
+        f"\nDone in {total:.1f}s: {len(warmed)} warmed, "
+        f"{len(outcomes['failed'])} failed"
+    )
+    if warmed:
+        print(f"Per ministry: median {warmed[len(warmed) // 2]:.1f}s, max {warmed[-1]:.1f}s")
+    for tier, counts in get_response_cache().stats_snapshot().items():
+        print(f"  {tier:<9} hits {counts['hits']:>4}  misses {counts['misses']:>4}  errors {counts['errors']:>3}")
+
+
+if __name__ == "__main__":
+    main()